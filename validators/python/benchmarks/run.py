@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Run the benchmark suites for every preset manifest shape.
+
+Writes one JSON report per shape (small.json, medium.json, large.json) into
+the output directory. With --baseline-dir, compares each report with the file
+of the same name there and exits 1 if any median latency regressed.
+
+Usage:
+    python benchmarks/run.py --output-dir benchmarks/results
+    python benchmarks/run.py --output-dir new --baseline-dir benchmarks/results
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Run from a checkout without installing the package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from jsonagents.bench import SHAPES, SUITES, compare_reports, run_benchmarks
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output-dir", type=Path, default=Path("benchmarks/results"))
+    parser.add_argument("--baseline-dir", type=Path)
+    parser.add_argument("--shape", action="append", choices=sorted(SHAPES),
+                        help="Shape to run (repeatable; default: all)")
+    parser.add_argument("--suite", action="append", choices=SUITES,
+                        help="Benchmark to run (repeatable; default: all)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--cli-runs", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    regressions = []
+    for name in args.shape or SHAPES:
+        report = run_benchmarks(
+            SHAPES[name],
+            seed=args.seed,
+            iterations=args.iterations,
+            cli_runs=args.cli_runs,
+            suites=args.suite or SUITES,
+        )
+        path = args.output_dir / f"{name}.json"
+        path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        for suite, result in report["results"].items():
+            latency = result["latency_ms"]
+            print(f"{name:<7} {suite:<9} {result['ops_per_second']:>12,.1f} ops/s  "
+                  f"p50 {latency['p50']:.3f} ms  p99 {latency['p99']:.3f} ms")
+
+        baseline = args.baseline_dir / f"{name}.json" if args.baseline_dir else None
+        if baseline is not None and baseline.exists():
+            previous = json.loads(baseline.read_text(encoding="utf-8"))
+            regressions.extend(f"{name}/{r}" for r in
+                               compare_reports(previous, report, args.tolerance))
+
+    for regression in regressions:
+        print(f"Regression: {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,16 +2,71 @@
 
 __version__ = "1.0.0"
 
-from .validator import Validator, ValidationResult, validate_manifest
-from .uri import URIValidator, URIValidationResult
-from .policy import PolicyValidator, PolicyValidationResult
-
-__all__ = [
-    "Validator",
-    "ValidationResult",
-    "validate_manifest",
-    "URIValidator",
-    "URIValidationResult",
-    "PolicyValidator",
-    "PolicyValidationResult",
-]
+from typing import TYPE_CHECKING, Any, List
+
+# Public names and the submodule defining each. Submodules are imported on
+# first attribute access (PEP 562) so that `import jsonagents` and the light
+# CLI commands do not pay for jsonschema, requests or rich.
+_EXPORTS = {
+    "Validator": "validator",
+    "ValidationResult": "validator",
+    "validate_manifest": "validator",
+    "URIValidator": "uri",
+    "URIValidationResult": "uri",
+    "PolicyValidator": "policy",
+    "PolicyValidationResult": "policy",
+    "PolicySyntaxError": "policy_ast",
+    "CompiledPolicy": "policy_eval",
+    "compile_policy": "policy_eval",
+    "PolicyEngine": "decision",
+    "Decision": "decision",
+    "Resolver": "resolver",
+    "ResolverError": "resolver",
+    "ResolvedManifest": "resolver",
+    "GraphAnalysis": "graph",
+    "GraphFinding": "graph",
+    "analyze_graph": "graph",
+    "DependencyGraph": "dependencies",
+    "resolve_graph": "dependencies",
+    "resolve_graph_sync": "dependencies",
+    "ResultCache": "result_cache",
+    "ValidationProfile": "timing",
+    "Metrics": "metrics",
+    "Registry": "metrics",
+    "get_metrics": "metrics",
+    "set_metrics": "metrics",
+    "get_compiled_schema": "schema",
+    "invalidate_schema_cache": "schema",
+}
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .validator import Validator, ValidationResult, validate_manifest
+    from .uri import URIValidator, URIValidationResult
+    from .policy import PolicyValidator, PolicyValidationResult
+    from .policy_ast import PolicySyntaxError
+    from .policy_eval import CompiledPolicy, compile_policy
+    from .decision import Decision, PolicyEngine
+    from .resolver import ResolvedManifest, Resolver, ResolverError
+    from .graph import GraphAnalysis, GraphFinding, analyze_graph
+    from .dependencies import DependencyGraph, resolve_graph, resolve_graph_sync
+    from .result_cache import ResultCache
+    from .timing import ValidationProfile
+    from .metrics import Metrics, Registry, get_metrics, set_metrics
+    from .schema import get_compiled_schema, invalidate_schema_cache
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
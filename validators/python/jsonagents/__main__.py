@@ -0,0 +1,24 @@
+"""Entry point of the ``jsonagents`` command.
+
+Hands the invocation to a running daemon (see :mod:`jsonagents.daemon`)
+before importing the CLI at all, and runs it in-process otherwise.
+"""
+
+import sys
+
+
+def main() -> None:
+    """Run the ``jsonagents`` command."""
+    from .daemon import try_forward
+
+    exit_code = try_forward(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    from .cli import main as cli_main
+
+    cli_main(prog_name="jsonagents")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,409 @@
+"""Benchmarks over synthetic manifests.
+
+:func:`generate_manifest` builds a schema-valid manifest of a given
+:class:`ManifestShape` from a seed, so the same seed and shape always produce
+the same document. :func:`run_benchmarks` times schema validation, URI checks,
+policy checks, full in-process validation and end-to-end CLI runs over such
+manifests and returns a JSON-serializable report with throughput and latency
+percentiles. :func:`compare_reports` flags regressions against a saved report.
+"""
+
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from . import __version__
+
+
+SUITES = ("schema", "uri", "policy", "validate", "cli")
+
+PERCENTILES = (50, 90, 99)
+
+TOOL_TYPES = ("http", "function", "plugin", "system", "mcp", "custom")
+ACTIONS = ("tool.call", "tool.read", "message.send", "message.receive", "agent.delegate")
+FIELDS = (
+    ("tool.type", "string"),
+    ("tool.name", "string"),
+    ("tool.auth.method", "string"),
+    ("message.role", "string"),
+    ("message.size", "number"),
+    ("message.tags", "array"),
+    ("runtime.region", "string"),
+    ("runtime.attempt", "number"),
+    ("agent.version", "string"),
+)
+WORDS = ("alpha", "beta", "gamma", "delta", "search", "billing", "faq", "router", "eu", "us")
+
+
+@dataclass(frozen=True)
+class ManifestShape:
+    """Size knobs of a synthetic manifest."""
+
+    tools: int = 10
+    policies: int = 10
+    nodes: int = 0
+    edges: int = 0
+    schema_properties: int = 8
+
+
+# Presets used by `jsonagents bench --shape` and benchmarks/run.py
+SHAPES: Dict[str, ManifestShape] = {
+    "small": ManifestShape(tools=2, policies=2, nodes=0, edges=0, schema_properties=4),
+    "medium": ManifestShape(tools=20, policies=20, nodes=10, edges=20, schema_properties=16),
+    "large": ManifestShape(tools=200, policies=200, nodes=100, edges=300, schema_properties=64),
+}
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """Timing of one benchmark: every latency is in milliseconds."""
+
+    name: str
+    iterations: int
+    seconds: float
+    ops_per_second: float
+    latency_ms: Dict[str, float]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def generate_manifest(shape: ManifestShape = ManifestShape(), seed: int = 0) -> Dict[str, Any]:
+    """
+    Build a schema-valid manifest of the given shape.
+
+    Args:
+        shape: Number of tools, policies, graph nodes and edges, and the
+               number of properties in each tool's embedded input schema
+        seed: Random seed; the same seed and shape give the same manifest
+
+    Returns:
+        The manifest as a dict
+    """
+    rng = random.Random(seed)
+    profiles = ["core"]
+    manifest: Dict[str, Any] = {
+        "manifest_version": "1.0",
+        "profiles": profiles,
+        "agent": {
+            "id": f"ajson://bench.example.com/agents/agent-{seed}",
+            "name": f"Benchmark agent {seed}",
+            "version": "1.0.0",
+        },
+        "capabilities": [{"id": "bench", "description": "Synthetic benchmark capability"}],
+        "modalities": {"input": ["text", "json"], "output": ["text"]},
+    }
+
+    if shape.tools:
+        manifest["tools"] = [_tool(rng, i, shape.schema_properties) for i in range(shape.tools)]
+
+    if shape.policies:
+        profiles.append("gov")
+        manifest["policies"] = [
+            {
+                "id": f"policy-{i}",
+                "effect": rng.choice(("allow", "deny", "audit", "notify")),
+                "action": rng.choice(ACTIONS),
+                "where": generate_expression(rng),
+            }
+            for i in range(shape.policies)
+        ]
+
+    if shape.nodes:
+        profiles.append("graph")
+        nodes = [
+            {
+                "id": f"node-{i}",
+                "ref": f"ajson://{rng.choice(WORDS)}.example.com/agents/node-{i}",
+                "role": rng.choice(WORDS),
+            }
+            for i in range(shape.nodes)
+        ]
+        edges = []
+        for _ in range(shape.edges):
+            edge = {"from": rng.choice(nodes)["id"], "to": rng.choice(nodes)["id"]}
+            if rng.random() < 0.5:
+                edge["condition"] = generate_expression(rng)
+            edges.append(edge)
+        manifest["graph"] = {"nodes": nodes, "edges": edges}
+
+    return manifest
+
+
+def generate_manifests(
+    count: int, shape: ManifestShape = ManifestShape(), seed: int = 0
+) -> List[Dict[str, Any]]:
+    """Build ``count`` distinct manifests of one shape from consecutive seeds."""
+    return [generate_manifest(shape, seed + i) for i in range(count)]
+
+
+def generate_uris(count: int, seed: int = 0) -> List[str]:
+    """
+    Build ``count`` distinct ajson:// URIs, roughly one in ten malformed.
+
+    Args:
+        count: Number of URIs
+        seed: Random seed
+    """
+    rng = random.Random(seed)
+    uris = []
+    for i in range(count):
+        host = f"{rng.choice(WORDS)}{i}.example.com"
+        path = "/".join(rng.choice(WORDS) for _ in range(rng.randint(1, 4)))
+        uri = f"ajson://{host}/agents/{path}"
+        roll = rng.random()
+        if roll < 0.05:
+            uri = uri.replace("ajson://", "ajson:")
+        elif roll < 0.1:
+            uri = f"ajson:///agents/{i}"
+        elif roll < 0.3:
+            uri = f"{uri}?v={i}"
+        uris.append(uri)
+    return uris
+
+
+def generate_expressions(count: int, seed: int = 0) -> List[str]:
+    """Build ``count`` policy where clauses from a seed."""
+    rng = random.Random(seed)
+    return [generate_expression(rng) for _ in range(count)]
+
+
+def generate_expression(rng: random.Random, terms: Optional[int] = None) -> str:
+    """Build one random, valid policy where clause."""
+    terms = terms or rng.randint(1, 4)
+    clauses = []
+    for _ in range(terms):
+        field, kind = rng.choice(FIELDS)
+        if kind == "number":
+            clause = f"{field} {rng.choice(('<', '<=', '>', '>=', '==', '!='))} {rng.randint(0, 4096)}"
+        elif kind == "array":
+            clause = f"{field} contains '{rng.choice(WORDS)}'"
+        else:
+            op = rng.choice(("==", "!=", "in", "~", "starts_with"))
+            if op == "in":
+                options = ", ".join(f"'{w}'" for w in rng.sample(WORDS, 3))
+                clause = f"{field} in [{options}]"
+            elif op == "~":
+                clause = f"{field} ~ '^{rng.choice(WORDS)}[a-z]*$'"
+            else:
+                clause = f"{field} {op} '{rng.choice(WORDS)}'"
+        if rng.random() < 0.1:
+            clause = f"not ({clause})"
+        clauses.append(clause)
+    expression = clauses[0]
+    for clause in clauses[1:]:
+        expression = f"{expression} {rng.choice(('&&', '||'))} {clause}"
+    return expression
+
+
+def _tool(rng: random.Random, index: int, properties: int) -> Dict[str, Any]:
+    tool_type = rng.choice(TOOL_TYPES)
+    name = f"{rng.choice(WORDS)}_{index}"
+    tool: Dict[str, Any] = {
+        # Every other tool is addressed by URI so tool URI checks are exercised
+        "id": f"ajson://tools.example.com/tools/{name}" if index % 2 else name,
+        "name": name,
+        "type": tool_type,
+        "description": f"Synthetic {tool_type} tool",
+        "endpoint": f"https://api.example.com/{name}" if tool_type == "http" else name,
+        "auth": {"method": rng.choice(("env", "vault", "oidc")), "ref": f"SECRET_{index}"},
+    }
+    if properties:
+        tool["input_schema"] = _object_schema(rng, properties)
+    return tool
+
+
+def _object_schema(rng: random.Random, properties: int) -> Dict[str, Any]:
+    """A JSON Schema object with the given number of typed properties."""
+    props: Dict[str, Any] = {}
+    for i in range(properties):
+        kind = rng.choice(("string", "integer", "number", "boolean", "array"))
+        prop: Dict[str, Any] = {"type": kind, "description": f"Field {i}"}
+        if kind == "string":
+            prop["maxLength"] = rng.randint(8, 256)
+        elif kind == "array":
+            prop["items"] = {"type": "string"}
+        props[f"field_{i}"] = prop
+    return {
+        "type": "object",
+        "properties": props,
+        "required": sorted(rng.sample(list(props), k=min(len(props), 2))),
+        "additionalProperties": False,
+    }
+
+
+def measure(name: str, func: Callable[[Any], Any], inputs: Sequence[Any],
+            warmup: int = 0) -> Measurement:
+    """
+    Call ``func`` once per input and time each call.
+
+    Args:
+        name: Benchmark name
+        func: Function under test
+        inputs: Arguments, one call each
+        warmup: Number of leading inputs called untimed first
+    """
+    for item in inputs[:warmup]:
+        func(item)
+    latencies = []
+    clock = time.perf_counter_ns
+    start = clock()
+    for item in inputs:
+        before = clock()
+        func(item)
+        latencies.append(clock() - before)
+    seconds = (clock() - start) / 1e9
+    return Measurement(
+        name=name,
+        iterations=len(latencies),
+        seconds=round(seconds, 6),
+        ops_per_second=round(len(latencies) / seconds, 2) if seconds else 0.0,
+        latency_ms=latency_summary(latencies),
+    )
+
+
+def latency_summary(latencies_ns: Sequence[int]) -> Dict[str, float]:
+    """Summarize nanosecond latencies as min, mean, max and percentiles in ms."""
+    if not latencies_ns:
+        return {}
+    ordered = sorted(latencies_ns)
+    summary = {
+        "min": ordered[0],
+        "mean": sum(ordered) / len(ordered),
+        "max": ordered[-1],
+    }
+    for p in PERCENTILES:
+        # Nearest-rank percentile
+        rank = max(1, -(-p * len(ordered) // 100))
+        summary[f"p{p}"] = ordered[rank - 1]
+    return {key: round(value / 1e6, 4) for key, value in summary.items()}
+
+
+def run_benchmarks(
+    shape: ManifestShape = ManifestShape(),
+    seed: int = 0,
+    iterations: int = 200,
+    cli_runs: int = 5,
+    suites: Sequence[str] = SUITES,
+) -> Dict[str, Any]:
+    """
+    Run the benchmark suites and return a JSON-serializable report.
+
+    Memoization is disabled in the validators under test, so every call does
+    the full work.
+
+    Args:
+        shape: Shape of the generated manifests
+        seed: Random seed for every generator
+        iterations: Calls per in-process benchmark
+        cli_runs: Processes started by the end-to-end CLI benchmark
+        suites: Subset of :data:`SUITES` to run
+
+    Raises:
+        ValueError: If a suite name is unknown
+    """
+    unknown = [name for name in suites if name not in SUITES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark suite(s): {', '.join(unknown)}. "
+                         f"Use: {', '.join(SUITES)}")
+
+    from .jsonio import get_backend
+
+    results: Dict[str, Dict[str, Any]] = {}
+    warmup = max(1, iterations // 10)
+    needs_manifests = {"schema", "validate"} & set(suites)
+    manifests = generate_manifests(iterations, shape, seed) if needs_manifests else []
+
+    for suite in SUITES:
+        if suite not in suites:
+            continue
+        if suite == "schema":
+            from .schema import get_compiled_schema
+
+            schema = get_compiled_schema()
+            measurement = measure(suite, lambda m: list(schema.iter_errors(m)), manifests, warmup)
+        elif suite == "uri":
+            from .uri import URIValidator
+
+            uri_validator = URIValidator(cache_size=0)
+            measurement = measure(suite, uri_validator.validate,
+                                  generate_uris(iterations, seed), warmup)
+        elif suite == "policy":
+            from .policy import PolicyValidator
+
+            policy_validator = PolicyValidator(cache_size=0)
+            measurement = measure(suite, policy_validator.validate,
+                                  generate_expressions(iterations, seed), warmup)
+        elif suite == "validate":
+            from .validator import Validator
+
+            validator = Validator(cache_size=0)
+            raw = [json.dumps(m).encode() for m in manifests]
+            measurement = measure(suite, validator.validate, raw, warmup)
+        else:
+            measurement = _measure_cli(shape, seed, cli_runs)
+        results[suite] = measurement.to_dict()
+
+    return {
+        "jsonagents": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "json_backend": get_backend().name,
+        "seed": seed,
+        "shape": asdict(shape),
+        "results": results,
+    }
+
+
+def _measure_cli(shape: ManifestShape, seed: int, runs: int) -> Measurement:
+    """Time complete `jsonagents validate` processes on one generated file."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "manifest.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(generate_manifest(shape, seed), f)
+        command = [sys.executable, "-m", "jsonagents.cli", "validate", "--json", path]
+        # Import this copy of the package even when it is not installed
+        package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+
+        def run(_: int) -> None:
+            subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                           env=env, check=False)
+
+        return measure("cli", run, list(range(runs)))
+
+
+def compare_reports(
+    baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float = 0.25
+) -> List[str]:
+    """
+    Compare two reports and describe median latency regressions.
+
+    Args:
+        baseline: Earlier report from :func:`run_benchmarks`
+        current: New report
+        tolerance: Allowed relative slowdown of the p50 latency (0.25 = 25%)
+
+    Returns:
+        One message per benchmark slower than allowed; empty if none
+    """
+    regressions = []
+    for name, result in current.get("results", {}).items():
+        before = baseline.get("results", {}).get(name)
+        if not before:
+            continue
+        old, new = before["latency_ms"].get("p50"), result["latency_ms"].get("p50")
+        if old and new and new > old * (1 + tolerance):
+            regressions.append(
+                f"{name}: p50 {old:.4f} ms -> {new:.4f} ms (+{(new / old - 1) * 100:.0f}%)"
+            )
+    return regressions
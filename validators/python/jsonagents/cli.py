@@ -1,20 +1,37 @@
 """Command-line interface for JSON Agents validator."""
 
 import json
+import os
 import sys
+from collections import deque
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Deque, Iterator, List, Optional, Tuple, Union
 
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.syntax import Syntax
 
-from .validator import validate_manifest, ValidationResult
+# rich, jsonschema and the validator are imported inside the commands that
+# need them, so check-uri and check-policy start quickly
+if TYPE_CHECKING:
+    from rich.console import Console
 
+    from .validator import ValidationResult
+    from .watch import Change
 
-console = Console()
+
+class _LazyConsole:
+    """Stand-in for a rich Console that imports rich on first use."""
+
+    _console: Optional["Console"] = None
+
+    def __getattr__(self, name: str) -> object:
+        if _LazyConsole._console is None:
+            from rich.console import Console
+
+            _LazyConsole._console = Console()
+        return getattr(_LazyConsole._console, name)
+
+
+console = _LazyConsole()
 
 
 @click.group()
@@ -25,7 +42,7 @@ def main() -> None:
 
 
 @main.command()
-@click.argument("files", nargs=-1, type=click.Path(exists=True), required=True)
+@click.argument("files", nargs=-1, type=click.Path(exists=True, allow_dash=True), required=True)
 @click.option(
     "--strict",
     is_flag=True,
@@ -48,12 +65,65 @@ def main() -> None:
     type=click.Path(exists=True),
     help="Path to custom json-agents.json schema",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    default="1",
+    metavar="N|auto",
+    callback=lambda ctx, param, value: _parse_jobs(value),
+    help="Number of worker processes ('auto' uses one per CPU)",
+)
+@click.option(
+    "--ndjson",
+    is_flag=True,
+    help="Read newline-delimited JSON, one manifest per line ('-' reads stdin)",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    envvar="JSONAGENTS_CACHE_DIR",
+    help="Reuse results for unchanged manifests across runs (content-hash keyed; "
+         "not used with --verbose)",
+)
+@click.option(
+    "--watch",
+    "-w",
+    is_flag=True,
+    help="Keep running and revalidate files as they change",
+)
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=0.01),
+    default=0.5,
+    show_default=True,
+    help="Seconds between scans in --watch mode",
+)
+@click.option(
+    "--timings",
+    "profile",
+    is_flag=True,
+    help="Print time spent per validation stage, summed over all manifests",
+)
+@click.option(
+    "--profile",
+    "deprecated_profile",
+    is_flag=True,
+    hidden=True,
+    help="Deprecated alias of --timings",
+)
 def validate(
     files: tuple,
     strict: bool,
     verbose: bool,
     output_json: bool,
     schema: Optional[str],
+    jobs: int,
+    ndjson: bool,
+    cache_dir: Optional[str],
+    watch: bool,
+    interval: float,
+    profile: bool,
+    deprecated_profile: bool,
 ) -> None:
     """
     Validate JSON Agents manifest files.
@@ -62,43 +132,294 @@ def validate(
         jsonagents validate manifest.json
         jsonagents validate examples/*.json
         jsonagents validate manifest.json --strict --verbose
+        jsonagents validate examples/ --jobs auto
+        jsonagents validate --ndjson export.ndjson
+        cat export.ndjson | jsonagents validate --ndjson -
+        jsonagents validate examples/ --cache-dir .jsonagents-cache
+        jsonagents validate examples/ --watch
+        jsonagents validate examples/ --timings
     """
-    results: List[tuple[str, ValidationResult]] = []
-    
+    if deprecated_profile:
+        click.echo("Warning: --profile is deprecated, use --timings", err=True)
+        profile = True
+    if verbose:
+        # Cached results carry no manifest to preview
+        cache_dir = None
+    if watch:
+        if ndjson or "-" in files:
+            raise click.UsageError("--watch works on files and directories, not --ndjson or stdin")
+        if profile:
+            raise click.UsageError("--timings cannot be combined with --watch")
+        if jobs > 1:
+            raise click.UsageError("--jobs cannot be combined with --watch")
+        _watch(files, strict, verbose, output_json, schema, interval, cache_dir)
+        return
+
+    if ndjson:
+        _validate_ndjson(files, strict, verbose, output_json, schema, jobs, cache_dir, profile)
+        return
+
     # Expand directories
-    file_paths: List[Path] = []
+    sources: List[Tuple[str, Union[Path, bytes]]] = []
     for file in files:
+        if file == "-":
+            sources.append(("<stdin>", sys.stdin.buffer.read()))
+            continue
         path = Path(file)
         if path.is_dir():
-            file_paths.extend(path.glob("*.json"))
+            sources.extend((str(p), p) for p in path.glob("*.json"))
         else:
-            file_paths.append(path)
+            sources.append((file, path))
 
-    if not file_paths:
+    if not sources:
         console.print("[yellow]No manifest files found[/yellow]")
         sys.exit(1)
 
     # Validate each file
-    for file_path in file_paths:
-        try:
-            result = validate_manifest(file_path, strict=strict, schema_path=schema)
-            results.append((str(file_path), result))
-        except Exception as e:
-            console.print(f"[red]Error validating {file_path}: {e}[/red]")
-            results.append((str(file_path), ValidationResult(is_valid=False, errors=[str(e)])))
+    results = _validate_files(sources, strict, schema, jobs, cache_dir, profile)
 
     # Output results
     if output_json:
         _output_json(results)
     else:
         _output_rich(results, verbose=verbose)
+    if profile:
+        _print_profile([result for _, result in results], output_json)
 
     # Exit with error code if any validation failed
     if any(not result.is_valid for _, result in results):
         sys.exit(1)
 
 
-def _output_json(results: List[tuple[str, ValidationResult]]) -> None:
+def _watch(
+    files: tuple,
+    strict: bool,
+    verbose: bool,
+    output_json: bool,
+    schema: Optional[str],
+    interval: float,
+    cache_dir: Optional[str] = None,
+    max_scans: Optional[int] = None,
+) -> None:
+    """Validate once, then print only what changes until interrupted."""
+    from .validator import Validator
+    from .watch import Watcher
+
+    validator = Validator(schema_path=schema, cache_dir=cache_dir)
+    watcher = Watcher(files, validator=validator, strict=strict)
+    first = True
+
+    def report(changes: List["Change"]) -> None:
+        nonlocal first
+        if output_json:
+            for change in changes:
+                result = change.after
+                click.echo(json.dumps({
+                    "file": change.path,
+                    "event": change.kind,
+                    "valid": result.is_valid if result else None,
+                    "errors": result.errors if result else [],
+                    "warnings": result.warnings if result else [],
+                }))
+        elif first:
+            _output_rich(list(watcher.results.items()), verbose=verbose)
+        else:
+            _print_changes(changes, watcher.results)
+        first = False
+        if not output_json:
+            console.print("[dim]Watching for changes (Ctrl+C to stop)...[/dim]")
+
+    try:
+        watcher.run(report, interval=interval, max_scans=max_scans)
+    except KeyboardInterrupt:
+        pass
+
+    if any(not result.is_valid for result in watcher.results.values()):
+        sys.exit(1)
+
+
+def _print_changes(changes: List["Change"], results: dict) -> None:
+    """Print how the result set changed since the previous scan."""
+    console.print()
+    for change in changes:
+        if change.after is None:
+            console.print(f"🗑  [bold]{change.path}[/bold] - [dim]removed[/dim]")
+            continue
+        valid = change.after.is_valid
+        icon, color, status = ("✅", "green", "VALID") if valid else ("❌", "red", "INVALID")
+        console.print(f"{icon} [bold]{change.path}[/bold] - [{color}]{status}[/{color}] ({change.kind})")
+        for error in change.new_errors:
+            console.print(f"  [red]+[/red] {error}")
+        for error in change.fixed_errors:
+            console.print(f"  [green]-[/green] [dim]{error}[/dim]")
+        for warning in change.new_warnings:
+            console.print(f"  [yellow]+[/yellow] {warning}")
+        for warning in change.fixed_warnings:
+            console.print(f"  [green]-[/green] [dim]{warning}[/dim]")
+
+    failed = sum(1 for result in results.values() if not result.is_valid)
+    color = "red" if failed else "green"
+    console.print(f"[{color}]{len(results) - failed}/{len(results)} files valid[/{color}]")
+
+
+def _parse_jobs(value: str) -> int:
+    """Parse the --jobs option into a worker count."""
+    if value == "auto":
+        return os.cpu_count() or 1
+    try:
+        jobs = int(value)
+    except ValueError:
+        raise click.BadParameter(f"expected a positive integer or 'auto', got {value!r}")
+    if jobs < 1:
+        raise click.BadParameter(f"expected a positive integer or 'auto', got {value!r}")
+    return jobs
+
+
+def _validate_files(
+    sources: List[Tuple[str, Union[Path, bytes]]],
+    strict: bool,
+    schema: Optional[str],
+    jobs: int,
+    cache_dir: Optional[str] = None,
+    profile: bool = False,
+) -> List[Tuple[str, "ValidationResult"]]:
+    """Validate files serially or across a process pool, preserving input order."""
+    from .validator import Validator
+
+    jobs = min(jobs, len(sources))
+    validator = Validator(schema_path=schema, cache_dir=cache_dir, profile=profile)
+    outcomes = validator.validate_many(
+        (source for _, source in sources),
+        strict=strict,
+        executor="process" if jobs > 1 else None,
+        max_workers=jobs,
+    )
+    return [(name, result) for (name, _), (_, result) in zip(sources, outcomes)]
+
+
+def _validate_ndjson(
+    files: tuple,
+    strict: bool,
+    verbose: bool,
+    output_json: bool,
+    schema: Optional[str],
+    jobs: int,
+    cache_dir: Optional[str] = None,
+    profile: bool = False,
+) -> None:
+    """Stream-validate NDJSON inputs, one manifest per line, with flat memory use."""
+    from .validator import Validator
+
+    from .timing import ValidationProfile
+
+    labels: Deque[Tuple[str, int]] = deque()
+    validator = Validator(schema_path=schema, cache_dir=cache_dir, profile=profile)
+    outcomes = validator.validate_many(
+        _iter_ndjson_lines(files, labels),
+        strict=strict,
+        executor="process" if jobs > 1 else None,
+        max_workers=jobs,
+    )
+
+    total = 0
+    failed = 0
+    # Summed as results stream by, so memory stays flat
+    summed = ValidationProfile(validations=0)
+    for _, result in outcomes:
+        name, line_no = labels.popleft()
+        total += 1
+        if not result.is_valid:
+            failed += 1
+        if profile:
+            summed = ValidationProfile.aggregate([summed, result.profile])
+
+        if output_json:
+            click.echo(json.dumps({
+                "file": name,
+                "line": line_no,
+                "valid": result.is_valid,
+                "errors": result.errors,
+                "warnings": result.warnings,
+            }))
+        else:
+            _print_result(f"{name}:{line_no}", result, verbose)
+
+    if total == 0:
+        console.print("[yellow]No manifests found[/yellow]")
+        sys.exit(1)
+
+    if not output_json:
+        _print_summary(total, failed, label="Total Manifests")
+    if profile:
+        _print_profile([summed], output_json)
+
+    if failed:
+        sys.exit(1)
+
+
+def _iter_ndjson_lines(files: tuple, labels: Deque[Tuple[str, int]]) -> Iterator[bytes]:
+    """Yield non-blank NDJSON lines, recording (file, line number) for each in `labels`."""
+    for file in files:
+        if file == "-":
+            yield from _iter_stream_lines("<stdin>", sys.stdin.buffer, labels)
+            continue
+        path = Path(file)
+        paths = sorted([*path.glob("*.ndjson"), *path.glob("*.jsonl")]) if path.is_dir() else [path]
+        for ndjson_path in paths:
+            with open(ndjson_path, "rb") as stream:
+                yield from _iter_stream_lines(str(ndjson_path), stream, labels)
+
+
+def _iter_stream_lines(name: str, stream, labels: Deque[Tuple[str, int]]) -> Iterator[bytes]:
+    """Yield non-blank lines of one NDJSON stream."""
+    for line_no, line in enumerate(stream, 1):
+        if line.strip():
+            labels.append((name, line_no))
+            yield line
+
+
+def _print_profile(results: List[object], output_json: bool) -> None:
+    """
+    Print the per-stage time breakdown summed over results or profiles.
+
+    With --json the breakdown goes to stderr as JSON, so stdout stays a
+    valid results document.
+    """
+    from .timing import STAGES, ValidationProfile
+
+    total = ValidationProfile.aggregate(
+        item if isinstance(item, ValidationProfile) else getattr(item, "profile", None)
+        for item in results
+    )
+    if output_json:
+        click.echo(json.dumps({"profile": total.to_dict()}), err=True)
+        return
+
+    from rich.table import Table
+
+    elapsed = total.total_seconds
+    table = Table(title=f"Validation Timings ({total.validations} manifests)")
+    table.add_column("Stage", style="bold")
+    table.add_column("Total ms", justify="right")
+    table.add_column("Share", justify="right")
+    table.add_column("Mean ms", justify="right")
+    table.add_column("Count", justify="right")
+    table.add_column("Counted", style="dim")
+    for stage, timing in total.stages.items():
+        table.add_row(
+            stage,
+            f"{timing.seconds * 1000:.2f}",
+            f"{timing.seconds / elapsed:.1%}" if elapsed else "-",
+            f"{timing.seconds * 1000 / max(total.validations, 1):.3f}",
+            str(timing.count),
+            STAGES.get(stage, ""),
+        )
+    table.add_row("total", f"{elapsed * 1000:.2f}", "100.0%" if elapsed else "-",
+                  f"{elapsed * 1000 / max(total.validations, 1):.3f}", "", "", style="bold")
+    console.print(table)
+
+
+def _output_json(results: List[Tuple[str, "ValidationResult"]]) -> None:
     """Output results as JSON."""
     output = []
     for file_path, result in results:
@@ -108,55 +429,71 @@ def _output_json(results: List[tuple[str, ValidationResult]]) -> None:
             "errors": result.errors,
             "warnings": result.warnings,
         })
-    
-    console.print(json.dumps(output, indent=2))
+
+    # Not through rich: it would wrap long lines at the console width
+    click.echo(json.dumps(output, indent=2))
 
 
-def _output_rich(results: List[tuple[str, ValidationResult]], verbose: bool) -> None:
+def _output_rich(results: List[Tuple[str, "ValidationResult"]], verbose: bool) -> None:
     """Output results with rich formatting."""
     total = len(results)
-    passed = sum(1 for _, r in results if r.is_valid)
-    failed = total - passed
+    failed = sum(1 for _, r in results if not r.is_valid)
 
     # Show results for each file
     for file_path, result in results:
-        if result.is_valid:
-            icon = "✅"
-            color = "green"
-            status = "VALID"
-        else:
-            icon = "❌"
-            color = "red"
-            status = "INVALID"
-
-        console.print(f"\n{icon} [bold]{file_path}[/bold] - [{color}]{status}[/{color}]")
-
-        if result.errors:
-            console.print("\n[red bold]Errors:[/red bold]")
-            for error in result.errors:
-                console.print(f"  [red]•[/red] {error}")
-
-        if result.warnings:
-            console.print("\n[yellow bold]Warnings:[/yellow bold]")
-            for warning in result.warnings:
-                console.print(f"  [yellow]•[/yellow] {warning}")
-
-        # Show manifest snippet in verbose mode
-        if verbose and result.manifest:
-            console.print("\n[dim]Manifest preview:[/dim]")
-            preview = json.dumps(result.manifest, indent=2)[:500]
-            if len(json.dumps(result.manifest)) > 500:
-                preview += "\n..."
-            syntax = Syntax(preview, "json", theme="monokai", line_numbers=False)
-            console.print(syntax)
+        _print_result(file_path, result, verbose)
+
+    _print_summary(total, failed)
+
+
+def _print_result(file_path: str, result: "ValidationResult", verbose: bool) -> None:
+    """Print one validation result with rich formatting."""
+    if result.is_valid:
+        icon = "✅"
+        color = "green"
+        status = "VALID"
+    else:
+        icon = "❌"
+        color = "red"
+        status = "INVALID"
+
+    console.print(f"\n{icon} [bold]{file_path}[/bold] - [{color}]{status}[/{color}]")
+
+    if result.errors:
+        console.print("\n[red bold]Errors:[/red bold]")
+        for error in result.errors:
+            console.print(f"  [red]•[/red] {error}")
+
+    if result.warnings:
+        console.print("\n[yellow bold]Warnings:[/yellow bold]")
+        for warning in result.warnings:
+            console.print(f"  [yellow]•[/yellow] {warning}")
+
+    # Show manifest snippet in verbose mode
+    if verbose and result.manifest:
+        console.print("\n[dim]Manifest preview:[/dim]")
+        preview = json.dumps(result.manifest, indent=2)[:500]
+        if len(json.dumps(result.manifest)) > 500:
+            preview += "\n..."
+        from rich.syntax import Syntax
+
+        syntax = Syntax(preview, "json", theme="monokai", line_numbers=False)
+        console.print(syntax)
+
+
+def _print_summary(total: int, failed: int, label: str = "Total Files") -> None:
+    """Print the summary table and final status line."""
+    passed = total - failed
 
     # Summary table
     console.print()
+    from rich.table import Table
+
     table = Table(title="Validation Summary", show_header=True, header_style="bold")
     table.add_column("Metric", style="cyan")
     table.add_column("Count", justify="right")
     
-    table.add_row("Total Files", str(total))
+    table.add_row(label, str(total))
     table.add_row("Passed", f"[green]{passed}[/green]")
     table.add_row("Failed", f"[red]{failed}[/red]" if failed > 0 else "0")
     
@@ -183,31 +520,29 @@ def check_uri(uri: str) -> None:
     validator = URIValidator()
     result = validator.validate(uri)
 
+    # Plain click styling: these commands are called from scripts and hooks,
+    # where importing rich would dominate their run time
     if result.is_valid:
-        console.print(f"[green]✅ Valid URI:[/green] {uri}")
-        
+        click.echo(click.style("✅ Valid URI:", fg="green") + f" {uri}")
+
         # Show parsed components
-        console.print("\n[bold]Parsed Components:[/bold]")
+        click.secho("\nParsed Components:", bold=True)
         for key, value in result.parsed.items():
             if value:
-                console.print(f"  {key}: {value}")
-        
+                click.echo(f"  {key}: {value}")
+
         # Show HTTPS transformation
         try:
             https_url = validator.to_https(uri)
-            console.print(f"\n[bold]HTTPS URL:[/bold] {https_url}")
+            click.echo(click.style("\nHTTPS URL:", bold=True) + f" {https_url}")
         except Exception as e:
-            console.print(f"\n[yellow]Could not transform to HTTPS: {e}[/yellow]")
+            click.secho(f"\nCould not transform to HTTPS: {e}", fg="yellow")
     else:
-        console.print(f"[red]❌ Invalid URI:[/red] {uri}")
+        click.echo(click.style("❌ Invalid URI:", fg="red") + f" {uri}")
         for error in result.errors:
-            console.print(f"  [red]•[/red] {error}")
-    
-    if result.warnings:
-        console.print("\n[yellow bold]Warnings:[/yellow bold]")
-        for warning in result.warnings:
-            console.print(f"  [yellow]•[/yellow] {warning}")
+            click.echo(click.style("  •", fg="red") + f" {error}")
 
+    _print_warnings(result.warnings)
     sys.exit(0 if result.is_valid else 1)
 
 
@@ -226,22 +561,326 @@ def check_policy(expression: str) -> None:
     result = validator.validate(expression)
 
     if result.is_valid:
-        console.print(f"[green]✅ Valid expression[/green]")
-        console.print(f"\n[dim]{expression}[/dim]")
+        click.secho("✅ Valid expression", fg="green")
+        click.secho(f"\n{expression}", dim=True)
     else:
-        console.print(f"[red]❌ Invalid expression[/red]")
-        console.print(f"\n[dim]{expression}[/dim]")
-        console.print("\n[red bold]Errors:[/red bold]")
+        click.secho("❌ Invalid expression", fg="red")
+        click.secho(f"\n{expression}", dim=True)
+        click.secho("\nErrors:", fg="red", bold=True)
         for error in result.errors:
-            console.print(f"  [red]•[/red] {error}")
-    
-    if result.warnings:
-        console.print("\n[yellow bold]Warnings:[/yellow bold]")
-        for warning in result.warnings:
-            console.print(f"  [yellow]•[/yellow] {warning}")
+            click.echo(click.style("  •", fg="red") + f" {error}")
 
+    _print_warnings(result.warnings)
     sys.exit(0 if result.is_valid else 1)
 
 
+def _print_warnings(warnings: List[str]) -> None:
+    """Print warnings of the light check commands."""
+    if warnings:
+        click.secho("\nWarnings:", fg="yellow", bold=True)
+        for warning in warnings:
+            click.echo(click.style("  •", fg="yellow") + f" {warning}")
+
+
+@main.command()
+@click.option("--host", default="127.0.0.1", show_default=True, help="Address to listen on")
+@click.option("--port", "-p", type=click.IntRange(0, 65535), default=8080, show_default=True,
+              help="Port to listen on (0 picks a free port)")
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=8,
+    show_default=True,
+    help="Connections served concurrently",
+)
+@click.option(
+    "--schema",
+    type=click.Path(exists=True),
+    help="Path to custom json-agents.json schema",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    envvar="JSONAGENTS_CACHE_DIR",
+    help="Reuse results for unchanged manifests across runs (content-hash keyed)",
+)
+@click.option(
+    "--max-body",
+    type=click.IntRange(min=1),
+    default=16 * 1024 * 1024,
+    show_default=True,
+    help="Largest accepted request body in bytes",
+)
+@click.option("--access-log", is_flag=True, help="Log every request to stderr")
+def serve(
+    host: str,
+    port: int,
+    workers: int,
+    schema: Optional[str],
+    cache_dir: Optional[str],
+    max_body: int,
+    access_log: bool,
+) -> None:
+    """
+    Serve validation over HTTP with one warm validator.
+
+    Endpoints: POST /validate, /check-uri, /check-policy; GET /healthz, /metrics.
+
+    Example:
+        jsonagents serve --port 8080 --workers 16
+        curl --data-binary @manifest.json localhost:8080/validate
+    """
+    from .metrics import Registry
+    from .server import ValidationServer
+    from .validator import Validator
+
+    registry = Registry()
+    validator = Validator(schema_path=schema, cache_dir=cache_dir, metrics=registry)
+    server = ValidationServer(
+        (host, port),
+        validator=validator,
+        workers=workers,
+        max_body=max_body,
+        metrics=registry,
+        access_log=access_log,
+    )
+    click.echo(f"Serving on {server.url} with {workers} workers (Ctrl+C to stop)", err=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+@main.group()
+def daemon() -> None:
+    """
+    Keep a warm process that serves validate, check-uri and check-policy.
+
+    While it runs, those commands are forwarded to it over a Unix socket and
+    skip interpreter startup and schema compilation. Set JSONAGENTS_NO_DAEMON=1
+    to run a command in-process anyway.
+    """
+
+
+_socket_option = click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    envvar="JSONAGENTS_DAEMON_SOCKET",
+    help="Socket path (default: $XDG_RUNTIME_DIR/jsonagents-<uid>.sock)",
+)
+
+
+@daemon.command("start")
+@_socket_option
+@click.option(
+    "--idle-timeout",
+    type=click.FloatRange(min=0),
+    default=1800.0,
+    show_default=True,
+    help="Exit after this many idle seconds (0 never exits)",
+)
+@click.option("--foreground", is_flag=True, help="Run in this process instead of detaching")
+def daemon_start(socket_path: Optional[str], idle_timeout: float, foreground: bool) -> None:
+    """Start the daemon."""
+    from .daemon import DaemonError, serve, start_background
+
+    try:
+        if foreground:
+            serve(socket_path, idle_timeout)
+        else:
+            info = start_background(socket_path, idle_timeout)
+            click.echo(f"Daemon {info['pid']} listening on {info['socket']}")
+    except DaemonError as e:
+        click.secho(f"✗ {e}", fg="red", err=True)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        pass
+
+
+@daemon.command("stop")
+@_socket_option
+def daemon_stop(socket_path: Optional[str]) -> None:
+    """Stop the daemon."""
+    from .daemon import DaemonError, request
+
+    try:
+        info = request("stop", socket_path)
+    except DaemonError as e:
+        click.secho(f"✗ {e}", fg="red", err=True)
+        sys.exit(1)
+    click.echo(f"Stopped daemon {info.get('pid')}")
+
+
+@daemon.command("status")
+@_socket_option
+@click.option("--json", "output_json", is_flag=True, help="Output status as JSON")
+def daemon_status(socket_path: Optional[str], output_json: bool) -> None:
+    """Show whether the daemon is running. Exits 1 if it is not."""
+    from .daemon import DaemonError, request
+
+    try:
+        info = request("ping", socket_path)
+    except DaemonError as e:
+        if output_json:
+            click.echo(json.dumps({"running": False}))
+        else:
+            click.echo(f"Not running ({e})")
+        sys.exit(1)
+    if info.get("status") != "ok":
+        click.secho(f"✗ Daemon runs version {info.get('version')}", fg="red", err=True)
+        sys.exit(1)
+    if output_json:
+        click.echo(json.dumps({"running": True, **{k: v for k, v in info.items() if k != "status"}}))
+        return
+    click.echo(
+        f"Daemon {info['pid']} (version {info['version']}) on {info['socket']}: "
+        f"up {info['uptime_seconds']:.0f}s, {info['requests']} requests"
+    )
+
+
+@main.command()
+@click.option(
+    "--shape",
+    type=click.Choice(["small", "medium", "large"]),
+    default="medium",
+    show_default=True,
+    help="Preset manifest size; the options below override single knobs",
+)
+@click.option("--tools", type=click.IntRange(min=0), help="Tools per manifest")
+@click.option("--policies", type=click.IntRange(min=0), help="Policies per manifest")
+@click.option("--nodes", type=click.IntRange(min=0), help="Graph nodes per manifest")
+@click.option("--edges", type=click.IntRange(min=0), help="Graph edges per manifest")
+@click.option(
+    "--schema-properties",
+    type=click.IntRange(min=0),
+    help="Properties in each tool's embedded input schema",
+)
+@click.option("--seed", type=int, default=0, show_default=True, help="Generator seed")
+@click.option(
+    "--iterations",
+    "-n",
+    type=click.IntRange(min=1),
+    default=200,
+    show_default=True,
+    help="Calls per in-process benchmark",
+)
+@click.option(
+    "--cli-runs",
+    type=click.IntRange(min=1),
+    default=5,
+    show_default=True,
+    help="Processes started by the end-to-end CLI benchmark",
+)
+@click.option(
+    "--suite",
+    "suites",
+    multiple=True,
+    type=click.Choice(["schema", "uri", "policy", "validate", "cli"]),
+    help="Benchmark to run (repeatable; default: all)",
+)
+@click.option("--json", "output_json", is_flag=True, help="Output the report as JSON")
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Also write the JSON report to this file",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Earlier JSON report; exit 1 if a median latency regressed",
+)
+@click.option(
+    "--tolerance",
+    type=click.FloatRange(min=0),
+    default=0.25,
+    show_default=True,
+    help="Allowed relative p50 slowdown against --baseline",
+)
+def bench(
+    shape: str,
+    tools: Optional[int],
+    policies: Optional[int],
+    nodes: Optional[int],
+    edges: Optional[int],
+    schema_properties: Optional[int],
+    seed: int,
+    iterations: int,
+    cli_runs: int,
+    suites: Tuple[str, ...],
+    output_json: bool,
+    output: Optional[str],
+    baseline: Optional[str],
+    tolerance: float,
+) -> None:
+    """
+    Benchmark validation over seeded synthetic manifests.
+
+    Example:
+        jsonagents bench --shape large --json -o bench.json
+    """
+    from dataclasses import replace
+
+    from .bench import SHAPES, SUITES, compare_reports, run_benchmarks
+
+    overrides = {
+        "tools": tools,
+        "policies": policies,
+        "nodes": nodes,
+        "edges": edges,
+        "schema_properties": schema_properties,
+    }
+    manifest_shape = replace(SHAPES[shape], **{k: v for k, v in overrides.items() if v is not None})
+    report = run_benchmarks(
+        manifest_shape,
+        seed=seed,
+        iterations=iterations,
+        cli_runs=cli_runs,
+        suites=suites or SUITES,
+    )
+
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+    if output_json:
+        click.echo(json.dumps(report, indent=2))
+    else:
+        _print_bench(report)
+
+    if baseline:
+        with open(baseline, encoding="utf-8") as f:
+            regressions = compare_reports(json.load(f), report, tolerance)
+        for regression in regressions:
+            click.secho(f"Regression: {regression}", fg="red", err=True)
+        if regressions:
+            sys.exit(1)
+
+
+def _print_bench(report: dict) -> None:
+    """Print a benchmark report as a table."""
+    from rich.table import Table
+
+    shape = ", ".join(f"{key}={value}" for key, value in report["shape"].items())
+    table = Table(title=f"Benchmarks ({shape}; seed {report['seed']}; {report['json_backend']})")
+    table.add_column("Benchmark", style="bold")
+    table.add_column("Runs", justify="right")
+    table.add_column("Ops/s", justify="right")
+    for column in ("p50", "p90", "p99", "max"):
+        table.add_column(f"{column} ms", justify="right")
+    for name, result in report["results"].items():
+        latency = result["latency_ms"]
+        table.add_row(
+            name,
+            str(result["iterations"]),
+            f"{result['ops_per_second']:,.1f}",
+            *(f"{latency[column]:.3f}" for column in ("p50", "p90", "p99", "max")),
+        )
+    console.print(table)
+
+
 if __name__ == "__main__":
     main()
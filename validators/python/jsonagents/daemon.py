@@ -0,0 +1,381 @@
+"""Background daemon that serves CLI invocations over a Unix domain socket.
+
+``jsonagents daemon start`` launches a process that imports the CLI, compiles
+the schema and then waits on a per-user Unix socket. The ``jsonagents``
+entry point (:mod:`jsonagents.__main__`) first tries to hand ``validate``,
+``check-uri`` and ``check-policy`` invocations to that daemon: it sends argv,
+the working directory and ``JSONAGENTS_*`` environment variables, then prints
+the returned output and exits with the returned code. If no daemon is
+listening, or it runs a different version, the command runs in-process as
+usual. So do invocations that stream (``--ndjson``, stdin via ``-``) or run
+until interrupted (``--watch``): the daemon buffers a whole invocation's
+output, and it runs invocations one at a time.
+
+The client half of this module only imports the standard library modules it
+needs, so a forwarded invocation never loads click, rich or jsonschema.
+
+Set ``JSONAGENTS_NO_DAEMON=1`` to never forward, and
+``JSONAGENTS_DAEMON_SOCKET`` to use another socket path.
+"""
+
+import json
+import os
+import socket
+import struct
+import sys
+from typing import Any, Dict, List, Optional
+
+from . import __version__
+
+
+# Commands whose invocations are forwarded to a running daemon
+FORWARDED_COMMANDS = frozenset({"validate", "check-uri", "check-policy"})
+
+# Options that make `validate` long-running, streaming or interactive
+_LOCAL_OPTIONS = frozenset({"--watch", "-w", "--ndjson", "--help"})
+
+_HEADER = struct.Struct("!I")
+MAX_FRAME = 256 * 1024 * 1024
+
+CONNECT_TIMEOUT = 0.5
+
+
+class DaemonError(Exception):
+    """The daemon could not be reached or answered with an error."""
+
+
+def socket_path() -> str:
+    """Path of the current user's daemon socket."""
+    configured = os.environ.get("JSONAGENTS_DAEMON_SOCKET")
+    if configured:
+        return configured
+    directory = os.environ.get("XDG_RUNTIME_DIR") or "/tmp"
+    return os.path.join(directory, f"jsonagents-{os.getuid()}.sock")
+
+
+def should_forward(argv: List[str]) -> bool:
+    """Whether an invocation is handed to the daemon when one is running."""
+    if not hasattr(socket, "AF_UNIX") or os.environ.get("JSONAGENTS_NO_DAEMON"):
+        return False
+    if not argv or argv[0] not in FORWARDED_COMMANDS:
+        return False
+    # Reading stdin ("-") streams, so it stays in-process too
+    return not any(arg in _LOCAL_OPTIONS or arg == "-" for arg in argv[1:])
+
+
+def try_forward(argv: List[str]) -> Optional[int]:
+    """
+    Run an invocation on the daemon, printing its output.
+
+    Args:
+        argv: Command-line arguments without the program name
+
+    Returns:
+        The exit code, or None if the invocation must run in-process
+        (not forwardable, no daemon, or a daemon of another version)
+    """
+    if not should_forward(argv):
+        return None
+    path = socket_path()
+    if not _owned_socket(path):
+        return None
+
+    request: Dict[str, Any] = {
+        "op": "run",
+        "version": __version__,
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "env": {k: v for k, v in os.environ.items() if k.startswith("JSONAGENTS_")},
+        "tty": sys.stdout.isatty(),
+        "columns": _columns(),
+    }
+    response: Dict[str, Any] = {}
+    try:
+        with _connect(path) as sock:
+            _send(sock, request)
+            response = _receive(sock)
+    except (OSError, DaemonError, ValueError):
+        pass
+    if response.get("status") != "ok":
+        return None
+
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stdout.flush()
+    sys.stderr.write(response.get("stderr", ""))
+    return int(response.get("exit_code", 1))
+
+
+def request(op: str, path: Optional[str] = None, timeout: float = 5.0) -> Dict[str, Any]:
+    """
+    Send a control request ("ping" or "stop") to the daemon.
+
+    Raises:
+        DaemonError: If no daemon answers on the socket
+    """
+    path = path or socket_path()
+    if not _owned_socket(path):
+        raise DaemonError(f"No daemon socket at {path}")
+    try:
+        with _connect(path, timeout) as sock:
+            _send(sock, {"op": op, "version": __version__})
+            return _receive(sock)
+    except (OSError, ValueError) as e:
+        raise DaemonError(f"No daemon answering at {path}: {e}")
+
+
+def _owned_socket(path: str) -> bool:
+    """Whether path is a socket owned by this user (never talk to someone else's)."""
+    import stat
+
+    try:
+        info = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(info.st_mode) and info.st_uid == os.getuid()
+
+
+def _connect(path: str, timeout: Optional[float] = None) -> socket.socket:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(path)
+        sock.settimeout(timeout)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def _columns() -> int:
+    try:
+        return os.get_terminal_size(sys.stdout.fileno()).columns
+    except (OSError, ValueError, AttributeError):
+        return 80
+
+
+def _send(sock: socket.socket, message: Dict[str, Any]) -> None:
+    payload = json.dumps(message).encode("utf-8")
+    sock.sendall(_HEADER.pack(len(payload)) + payload)
+
+
+def _receive(sock: socket.socket) -> Dict[str, Any]:
+    (length,) = _HEADER.unpack(_read_exactly(sock, _HEADER.size))
+    if length > MAX_FRAME:
+        raise DaemonError(f"Frame of {length} bytes exceeds the limit")
+    message = json.loads(_read_exactly(sock, length))
+    if not isinstance(message, dict):
+        raise DaemonError("Malformed frame")
+    return message
+
+
+def _read_exactly(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1024 * 1024))
+        if not chunk:
+            raise DaemonError("Connection closed mid-frame")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def serve(path: Optional[str] = None, idle_timeout: Optional[float] = 1800.0) -> None:
+    """
+    Run the daemon in the foreground until stopped or idle.
+
+    Invocations are executed one at a time: each one changes the working
+    directory, environment and standard streams of this process, so a slow
+    one (a large ``--jobs`` run, say) delays those queued behind it.
+
+    Args:
+        path: Socket path. If None, :func:`socket_path`.
+        idle_timeout: Exit after this many seconds without a request.
+                      None or 0 keeps running until stopped.
+
+    Raises:
+        DaemonError: If another daemon already answers on the socket
+    """
+    import socketserver
+    import threading
+    import time
+
+    from . import cli
+    from .validator import Validator
+
+    path = path or socket_path()
+    if os.path.exists(path):
+        try:
+            request("ping", path, timeout=1.0)
+        except DaemonError:
+            os.unlink(path)
+        else:
+            raise DaemonError(f"A daemon is already running on {path}")
+
+    # Warm up everything a forwarded invocation needs
+    Validator()._get_validator()
+    from rich.console import Console  # noqa: F401
+    from rich.table import Table  # noqa: F401
+
+    # Fixed at start: a client of another version must not be served
+    version = __version__
+    run_lock = threading.Lock()
+    state = {"started": time.time(), "last": time.monotonic(), "requests": 0}
+
+    class Handler(socketserver.BaseRequestHandler):
+        def handle(self) -> None:
+            try:
+                message = _receive(self.request)
+            except (OSError, DaemonError, ValueError):
+                return
+            state["last"] = time.monotonic()
+            if message.get("version") != version:
+                _send(self.request, {"status": "version-mismatch", "version": version})
+                return
+            op = message.get("op")
+            if op == "run":
+                with run_lock:
+                    state["requests"] += 1
+                    response = _run(cli, message)
+            elif op == "ping":
+                response = {
+                    "status": "ok",
+                    "pid": os.getpid(),
+                    "version": version,
+                    "socket": path,
+                    "uptime_seconds": round(time.time() - state["started"], 3),
+                    "requests": state["requests"],
+                }
+            elif op == "stop":
+                response = {"status": "ok", "pid": os.getpid()}
+                threading.Thread(target=server.shutdown, daemon=True).start()
+            else:
+                response = {"status": "error", "error": f"Unknown op {op!r}"}
+            state["last"] = time.monotonic()
+            _send(self.request, response)
+
+    class Server(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+    # Only this user may connect
+    umask = os.umask(0o177)
+    try:
+        server = Server(path, Handler)
+    finally:
+        os.umask(umask)
+    inode = os.stat(path).st_ino
+
+    if idle_timeout:
+        def watch_idle() -> None:
+            while True:
+                time.sleep(min(idle_timeout, 1.0))
+                if time.monotonic() - state["last"] > idle_timeout:
+                    server.shutdown()
+                    return
+
+        threading.Thread(target=watch_idle, daemon=True).start()
+
+    try:
+        server.serve_forever(poll_interval=0.2)
+    finally:
+        server.server_close()
+        try:
+            # Leave a socket a newer daemon put in our place alone
+            if os.stat(path).st_ino == inode:
+                os.unlink(path)
+        except OSError:
+            pass
+
+
+def start_background(
+    path: Optional[str] = None,
+    idle_timeout: Optional[float] = 1800.0,
+    wait: float = 10.0,
+) -> Dict[str, Any]:
+    """
+    Start the daemon in a detached process and wait until it answers.
+
+    Returns:
+        The daemon's ping response
+
+    Raises:
+        DaemonError: If it does not come up within ``wait`` seconds
+    """
+    import subprocess
+    import time
+
+    path = path or socket_path()
+    command = [sys.executable, "-m", "jsonagents", "daemon", "start", "--foreground",
+               "--socket", path, "--idle-timeout", str(idle_timeout or 0)]
+    # Import this copy of the package even when it is not installed
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+    process = subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                               stderr=subprocess.DEVNULL, env=env, start_new_session=True)
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise DaemonError(f"Daemon exited with code {process.returncode}")
+        try:
+            return request("ping", path, timeout=1.0)
+        except DaemonError:
+            time.sleep(0.05)
+    raise DaemonError(f"Daemon did not start within {wait} seconds")
+
+
+def _run(cli: Any, message: Dict[str, Any]) -> Dict[str, Any]:
+    """Execute one forwarded invocation, capturing its output and exit code."""
+    import io
+    import traceback
+
+    from rich.console import Console
+
+    tty = bool(message.get("tty"))
+    stdout, stderr = io.StringIO(), io.StringIO()
+    # Invocations reading stdin are never forwarded; never read the daemon's own
+    stdin = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    env = {k: v for k, v in message.get("env", {}).items() if k.startswith("JSONAGENTS_")}
+
+    saved_cwd = os.getcwd()
+    saved_env = {k: v for k, v in os.environ.items() if k.startswith("JSONAGENTS_")}
+    saved_streams = sys.stdin, sys.stdout, sys.stderr
+    saved_console = cli._LazyConsole._console
+    exit_code = 0
+    try:
+        os.chdir(message["cwd"])
+        for key in saved_env:
+            del os.environ[key]
+        os.environ.update(env)
+        # Never forward from inside the daemon
+        os.environ["JSONAGENTS_NO_DAEMON"] = "1"
+        sys.stdin, sys.stdout, sys.stderr = stdin, stdout, stderr
+        cli._LazyConsole._console = Console(
+            file=stdout,
+            force_terminal=tty,
+            color_system="standard" if tty else None,
+            width=int(message.get("columns") or 80),
+        )
+        try:
+            cli.main.main(args=list(message["argv"]), prog_name="jsonagents", color=tty)
+        except SystemExit as e:
+            if isinstance(e.code, str):
+                stderr.write(e.code + "\n")
+                exit_code = 1
+            else:
+                exit_code = e.code or 0
+        except Exception:
+            traceback.print_exc(file=stderr)
+            exit_code = 1
+    finally:
+        sys.stdin, sys.stdout, sys.stderr = saved_streams
+        cli._LazyConsole._console = saved_console
+        for key in [k for k in os.environ if k.startswith("JSONAGENTS_")]:
+            del os.environ[key]
+        os.environ.update(saved_env)
+        os.chdir(saved_cwd)
+    return {
+        "status": "ok",
+        "exit_code": exit_code,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+    }
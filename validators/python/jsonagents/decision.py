@@ -0,0 +1,238 @@
+"""Allow/deny decisions over a manifest's ``policies`` array.
+
+Policies are indexed by ``action`` so a decision only evaluates the policies
+that target the requested action (plus ``*`` and ``prefix.*`` wildcards).
+Effects combine with deny-overrides semantics: any matching ``deny`` policy
+denies, otherwise any matching ``allow`` policy allows, otherwise the engine's
+default effect applies. Matching ``audit`` and ``notify`` policies never change
+the outcome; they are reported on the decision.
+
+Decisions are memoized per action on the values of the context fields the
+candidate policies actually read, so repeated requests that differ only in
+fields no policy looks at are answered from the cache.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Optional, Tuple
+
+from .lru import CacheInfo, LRUCache
+from .policy import PolicyValidator
+from .policy_ast import PolicySyntaxError
+from .policy_eval import Context, Getter, Predicate, make_getter
+
+
+EFFECTS = ("allow", "deny", "audit", "notify")
+WILDCARD = "*"
+
+
+@dataclass(frozen=True)
+class Decision:
+    """Outcome of a policy decision (immutable, safe to share from the cache)."""
+
+    action: str
+    effect: str
+    policy_ids: Tuple[str, ...] = ()
+    audit: Tuple[str, ...] = ()
+    notify: Tuple[str, ...] = ()
+
+    @property
+    def allowed(self) -> bool:
+        """True if the decision allows the action."""
+        return self.effect == "allow"
+
+    @property
+    def is_default(self) -> bool:
+        """True if no allow or deny policy matched and the default effect applied."""
+        return not self.policy_ids
+
+
+@dataclass(frozen=True)
+class _Rule:
+    id: str
+    effect: str
+    predicate: Optional[Predicate]
+
+    def matches(self, context: Context) -> bool:
+        return self.predicate is None or self.predicate(context)
+
+
+class _Plan:
+    """Candidate rules for one action, grouped by effect, and the fields they read."""
+
+    __slots__ = ("deny", "allow", "audit", "notify", "getters")
+
+    def __init__(self, rules: List[_Rule], accessors: Iterable[Tuple[Any, ...]]) -> None:
+        self.deny = tuple(r for r in rules if r.effect == "deny")
+        self.allow = tuple(r for r in rules if r.effect == "allow")
+        self.audit = tuple(r for r in rules if r.effect == "audit")
+        self.notify = tuple(r for r in rules if r.effect == "notify")
+        self.getters: Tuple[Getter, ...] = tuple(make_getter(parts) for parts in accessors)
+
+
+class PolicyEngine:
+    """
+    Decide whether an action is allowed from a manifest's policies.
+
+    Example:
+        >>> engine = PolicyEngine.from_manifest(manifest, default="allow")
+        >>> engine.decide("tool.call", {"tool": {"endpoint": "https://x.internal.corp"}})
+        Decision(action='tool.call', effect='allow', ...)
+    """
+
+    def __init__(
+        self,
+        policies: Iterable[Mapping[str, Any]],
+        default: str = "deny",
+        cache_size: int = 1024,
+        policy_validator: Optional[PolicyValidator] = None,
+    ) -> None:
+        """
+        Build the engine.
+
+        Args:
+            policies: Policy objects with ``id``, ``effect``, ``action`` and an
+                      optional ``where`` clause
+            default: Effect when no allow or deny policy matches ("allow" or "deny")
+            cache_size: Number of decisions memoized (0 disables memoization)
+            policy_validator: Validator used to compile where clauses
+
+        Raises:
+            ValueError: If a policy is malformed or a where clause does not parse
+        """
+        if default not in ("allow", "deny"):
+            raise ValueError(f"default must be 'allow' or 'deny', not {default!r}")
+        self.default = default
+        compiler = policy_validator or PolicyValidator(cache_size=0)
+
+        self._rules: Dict[str, List[_Rule]] = {}
+        self._accessors: Dict[str, Dict[Tuple[Any, ...], None]] = {}
+        errors: List[str] = []
+        for i, policy in enumerate(policies):
+            label = f"Policy[{i}]"
+            effect = policy.get("effect")
+            action = policy.get("action")
+            if effect not in EFFECTS:
+                errors.append(f"{label} has unknown effect {effect!r}")
+                continue
+            if not isinstance(action, str) or not action:
+                errors.append(f"{label} has no action")
+                continue
+            where = policy.get("where")
+            predicate = None
+            accessors: Tuple[Tuple[Any, ...], ...] = ()
+            if where is not None:
+                try:
+                    compiled = compiler.compile(where)
+                except PolicySyntaxError as e:
+                    errors.extend(f"{label} {message}" for message in e.errors)
+                    continue
+                predicate, accessors = compiled, compiled.paths
+            rule = _Rule(str(policy.get("id", label)), effect, predicate)
+            self._rules.setdefault(action, []).append(rule)
+            self._accessors.setdefault(action, {}).update(dict.fromkeys(accessors))
+        if errors:
+            raise ValueError("Invalid policies: " + "; ".join(errors))
+
+        self._plans: Dict[str, _Plan] = {}
+        self._cache: LRUCache[Decision] = LRUCache(cache_size)
+
+    @classmethod
+    def from_manifest(cls, manifest: Mapping[str, Any], **kwargs: Any) -> "PolicyEngine":
+        """
+        Build an engine from a manifest's ``policies`` array.
+
+        Args:
+            manifest: A validated manifest
+            **kwargs: Passed to :class:`PolicyEngine`
+        """
+        return cls(manifest.get("policies") or (), **kwargs)
+
+    def decide(self, action: str, context: Context) -> Decision:
+        """
+        Decide whether an action is allowed in a context.
+
+        Args:
+            action: Action category, e.g. "tool.call"
+            context: Mapping with ``tool``, ``message``, ``agent`` and
+                     ``runtime`` entries
+
+        Returns:
+            Decision with the effect and the ids of the policies behind it
+        """
+        plan = self._plans.get(action)
+        if plan is None:
+            plan = self._plans[action] = self._plan(action)
+
+        try:
+            key: Optional[Hashable] = (action,) + tuple(_freeze(get(context)) for get in plan.getters)
+        except TypeError:
+            # A read field holds a mapping or another unhashable value
+            key = None
+        if key is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        decision = self._evaluate(action, plan, context)
+        if key is not None:
+            self._cache.put(key, decision)
+        return decision
+
+    def candidates(self, action: str) -> Tuple[str, ...]:
+        """Return the ids of the policies considered for an action."""
+        plan = self._plans.get(action) or self._plan(action)
+        return tuple(r.id for group in (plan.deny, plan.allow, plan.audit, plan.notify)
+                     for r in group)
+
+    def cache_info(self) -> CacheInfo:
+        """Return decision cache statistics."""
+        return self._cache.info()
+
+    def clear_cache(self) -> None:
+        """Drop memoized decisions."""
+        self._cache.clear()
+
+    def _plan(self, action: str) -> _Plan:
+        rules: List[_Rule] = []
+        accessors: Dict[Tuple[Any, ...], None] = {}
+        for pattern in _patterns(action):
+            rules.extend(self._rules.get(pattern, ()))
+            accessors.update(self._accessors.get(pattern, {}))
+        return _Plan(rules, accessors)
+
+    def _evaluate(self, action: str, plan: _Plan, context: Context) -> Decision:
+        denied = tuple(r.id for r in plan.deny if r.matches(context))
+        if denied:
+            effect, policy_ids = "deny", denied
+        else:
+            allowed = tuple(r.id for r in plan.allow if r.matches(context))
+            effect, policy_ids = ("allow", allowed) if allowed else (self.default, ())
+        return Decision(
+            action=action,
+            effect=effect,
+            policy_ids=policy_ids,
+            audit=tuple(r.id for r in plan.audit if r.matches(context)),
+            notify=tuple(r.id for r in plan.notify if r.matches(context)),
+        )
+
+
+def _patterns(action: str) -> List[str]:
+    """Action patterns that target an action: itself, its ``prefix.*`` forms and ``*``."""
+    patterns = [action]
+    parts = action.split(".")
+    for i in range(len(parts) - 1, 0, -1):
+        patterns.append(".".join(parts[:i]) + ".*")
+    if action != WILDCARD:
+        patterns.append(WILDCARD)
+    return patterns
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable cache key for a field value that keeps ``True`` and ``1`` apart."""
+    kind = type(value)
+    if kind is list or kind is tuple:
+        return (list, tuple(_freeze(item) for item in value))
+    if kind is dict:
+        raise TypeError("mappings are not cached")
+    hash(value)
+    return (kind, value)
@@ -0,0 +1,185 @@
+"""Concurrent resolution of the agents a manifest's graph refers to.
+
+Every ``graph.nodes[*].ref`` that is an ``ajson://`` URI is fetched with a
+:class:`~jsonagents.resolver.Resolver`; with ``transitive=True`` the refs of
+the fetched manifests are followed too, up to ``max_depth`` hops. Fetches run
+concurrently on an asyncio loop, bounded overall and per host, and each
+manifest's refs are scheduled as soon as it arrives, so wall-clock time tracks
+the depth of the graph rather than its size. Each URI is fetched once, which
+also makes cycles terminate; they are reported on the result.
+
+The fetches themselves are blocking :class:`~jsonagents.resolver.Resolver`
+calls run on a thread pool. If resolution fails, pending fetches are
+cancelled and those already running are waited for before the error
+propagates, so nothing writes to the resolver's cache afterwards.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+from .resolver import ResolvedManifest, Resolver, ResolverError
+
+
+ROOT = "<root>"
+
+
+@dataclass
+class DependencyGraph:
+    """Agents reachable from a manifest and the refs between them."""
+
+    root: str
+    nodes: Dict[str, ResolvedManifest] = field(default_factory=dict)
+    edges: Dict[str, Tuple[str, ...]] = field(default_factory=dict)
+    depth: Dict[str, int] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    cycles: List[Tuple[str, ...]] = field(default_factory=list)
+    truncated: Tuple[str, ...] = ()
+
+    @property
+    def is_complete(self) -> bool:
+        """True if every ref was fetched without errors or depth truncation."""
+        return not self.errors and not self.truncated
+
+
+def graph_refs(manifest: Mapping[str, Any]) -> Tuple[str, ...]:
+    """Return the distinct ``ajson://`` refs of a manifest's graph nodes, in order."""
+    graph = manifest.get("graph")
+    nodes = graph.get("nodes") if isinstance(graph, Mapping) else None
+    if not isinstance(nodes, list):
+        return ()
+    refs = (node.get("ref") for node in nodes if isinstance(node, Mapping))
+    return tuple(dict.fromkeys(
+        ref for ref in refs if isinstance(ref, str) and ref.startswith("ajson://")
+    ))
+
+
+async def resolve_graph(
+    manifest: Mapping[str, Any],
+    resolver: Optional[Resolver] = None,
+    transitive: bool = True,
+    max_depth: int = 8,
+    concurrency: int = 16,
+    per_host: int = 4,
+) -> DependencyGraph:
+    """
+    Resolve the agents a manifest's graph refers to.
+
+    Args:
+        manifest: The root manifest
+        resolver: Resolver used for fetching. If None, a new one without a
+                  disk cache is created and closed afterwards.
+        transitive: Follow the refs of resolved manifests as well
+        max_depth: Maximum number of hops from the root when transitive
+        concurrency: Maximum fetches in flight overall
+        per_host: Maximum fetches in flight per host
+
+    Returns:
+        DependencyGraph keyed by URI; the root is keyed by its ``agent.id``
+    """
+    if concurrency < 1 or per_host < 1:
+        raise ValueError("concurrency and per_host must be at least 1")
+    agent = manifest.get("agent")
+    root = agent.get("id") if isinstance(agent, Mapping) else None
+    result = DependencyGraph(root=root if isinstance(root, str) else ROOT)
+    result.edges[result.root] = graph_refs(manifest)
+    result.depth[result.root] = 0
+    limit = max_depth if transitive else 1
+
+    own_resolver = resolver is None
+    resolver = resolver or Resolver(pool_size=per_host)
+    loop = asyncio.get_running_loop()
+    overall = asyncio.Semaphore(concurrency)
+    hosts: Dict[str, asyncio.Semaphore] = {}
+    pending: Set["asyncio.Future[None]"] = set()
+    scheduled: Set[str] = {result.root}
+    too_deep: Set[str] = set()
+
+    def schedule(refs: Tuple[str, ...], depth: int) -> None:
+        for ref in refs:
+            if ref in scheduled:
+                continue
+            if depth > limit:
+                too_deep.add(ref)
+                continue
+            scheduled.add(ref)
+            result.depth[ref] = depth
+            pending.add(asyncio.ensure_future(visit(ref, depth)))
+
+    async def visit(uri: str, depth: int) -> None:
+        try:
+            host = urlsplit(resolver.url_for(uri)).netloc
+        except ValueError as e:
+            result.errors[uri] = str(e)
+            return
+        host_limit = hosts.setdefault(host, asyncio.Semaphore(per_host))
+        async with host_limit, overall:
+            try:
+                resolved = await loop.run_in_executor(pool, resolver.resolve, uri)
+            except (ResolverError, ValueError) as e:
+                result.errors[uri] = str(e)
+                return
+        result.nodes[uri] = resolved
+        refs = graph_refs(resolved.manifest)
+        result.edges[uri] = refs
+        schedule(refs, depth + 1)
+
+    pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="jsonagents-resolve")
+    try:
+        schedule(result.edges[result.root], 1)
+        while pending:
+            done, _ = await asyncio.wait(pending)
+            pending.difference_update(done)
+            for task in done:
+                task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        # Cancelling a task cancels its fetch unless a worker already runs it
+        await asyncio.gather(*pending, return_exceptions=True)
+        # Running fetches are bounded by the resolver's timeout
+        pool.shutdown(wait=True)
+        if own_resolver:
+            resolver.close()
+
+    result.truncated = tuple(sorted(too_deep - scheduled))
+    result.cycles = find_cycles(result.edges, result.root)
+    return result
+
+
+def resolve_graph_sync(manifest: Mapping[str, Any], **kwargs: Any) -> DependencyGraph:
+    """Run :func:`resolve_graph` on a new event loop and return its result."""
+    return asyncio.run(resolve_graph(manifest, **kwargs))
+
+
+def find_cycles(edges: Mapping[str, Tuple[str, ...]], root: str) -> List[Tuple[str, ...]]:
+    """
+    Return the cycles reachable from ``root``, one per back edge.
+
+    Each cycle lists its URIs in ref order, starting and ending with the same URI.
+    """
+    cycles: List[Tuple[str, ...]] = []
+    on_path: Dict[str, int] = {}
+    path: List[str] = []
+    done: Set[str] = set()
+    stack: List[Tuple[str, int]] = [(root, 0)]
+    while stack:
+        node, index = stack.pop()
+        if index == 0:
+            on_path[node] = len(path)
+            path.append(node)
+        children = edges.get(node, ())
+        if index < len(children):
+            stack.append((node, index + 1))
+            child = children[index]
+            if child in on_path:
+                cycles.append(tuple(path[on_path[child]:]) + (child,))
+            elif child not in done:
+                stack.append((child, 0))
+            continue
+        done.add(node)
+        del on_path[node]
+        path.pop()
+    return cycles
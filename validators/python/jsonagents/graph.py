@@ -0,0 +1,228 @@
+"""Structural analysis of a manifest's multi-agent graph.
+
+The node list and edge list are indexed once into an adjacency list; every
+check below is then linear in the number of nodes plus edges:
+
+- duplicate node ids and edges whose ``from``/``to`` name no node (errors)
+- cycles, as strongly connected components found with an iterative Tarjan pass
+  (informational only, since routing loops are often intentional)
+- nodes unreachable from the entry nodes (warnings)
+
+Entry nodes are the first declared node plus every node without incoming
+edges, so neither an isolated node nor a main graph that is one big loop
+makes the rest of the graph look unreachable.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+
+ERROR = "error"
+WARNING = "warning"
+INFO = "info"
+
+# Node ids listed in a single message before it is abbreviated
+_MAX_LISTED = 10
+
+
+@dataclass(frozen=True)
+class GraphFinding:
+    """A single problem found in the graph."""
+
+    severity: str
+    code: str
+    message: str
+    nodes: Tuple[str, ...] = ()
+    edge: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class GraphAnalysis:
+    """Findings for one graph plus the structure they were derived from."""
+
+    findings: Tuple[GraphFinding, ...] = ()
+    entries: Tuple[str, ...] = ()
+    cycles: Tuple[Tuple[str, ...], ...] = ()
+    unreachable: Tuple[str, ...] = ()
+
+    @property
+    def errors(self) -> Tuple[GraphFinding, ...]:
+        return tuple(f for f in self.findings if f.severity == ERROR)
+
+    @property
+    def warnings(self) -> Tuple[GraphFinding, ...]:
+        return tuple(f for f in self.findings if f.severity == WARNING)
+
+    @property
+    def info(self) -> Tuple[GraphFinding, ...]:
+        return tuple(f for f in self.findings if f.severity == INFO)
+
+
+def analyze_graph(graph: Mapping[str, Any], entries: Optional[Iterable[str]] = None) -> GraphAnalysis:
+    """
+    Analyze a manifest's ``graph`` object.
+
+    Args:
+        graph: Mapping with ``nodes`` and optional ``edges``
+        entries: Node ids to check reachability from. If None, the first
+                 node and the nodes without incoming edges are used.
+
+    Returns:
+        GraphAnalysis with structured findings
+    """
+    findings: List[GraphFinding] = []
+    nodes = graph.get("nodes") or []
+    edges = graph.get("edges") or []
+
+    ids: List[str] = []
+    index: Dict[str, int] = {}
+    for i, node in enumerate(nodes):
+        node_id = node.get("id") if isinstance(node, Mapping) else None
+        if not isinstance(node_id, str):
+            continue
+        first = index.get(node_id)
+        if first is not None:
+            findings.append(GraphFinding(
+                ERROR, "duplicate-node",
+                f"Graph node[{i}] duplicates id '{node_id}' (first defined at node[{first}])",
+                nodes=(node_id,),
+            ))
+            continue
+        index[node_id] = i
+        ids.append(node_id)
+
+    position = {node_id: n for n, node_id in enumerate(ids)}
+    adjacency: List[List[int]] = [[] for _ in ids]
+    has_incoming = [False] * len(ids)
+    for i, edge in enumerate(edges):
+        if not isinstance(edge, Mapping):
+            continue
+        ends = []
+        for end in ("from", "to"):
+            target = edge.get(end)
+            n = position.get(target) if isinstance(target, str) else None
+            if n is None:
+                findings.append(GraphFinding(
+                    ERROR, "dangling-edge",
+                    f"Edge[{i}] '{end}' references unknown node '{target}'",
+                    nodes=(target,) if isinstance(target, str) else (),
+                    edge=i,
+                ))
+            ends.append(n)
+        source, target = ends
+        if source is None or target is None:
+            continue
+        adjacency[source].append(target)
+        if source != target:
+            has_incoming[target] = True
+
+    if entries is not None:
+        starts = [position[e] for e in dict.fromkeys(entries) if e in position]
+    else:
+        starts = [n for n in range(len(ids)) if n == 0 or not has_incoming[n]]
+
+    cycles = tuple(
+        tuple(ids[n] for n in component)
+        for component in strongly_connected_components(adjacency)
+        if len(component) > 1 or component[0] in adjacency[component[0]]
+    )
+    for cycle in cycles:
+        findings.append(GraphFinding(
+            INFO, "cycle", f"Graph cycle through nodes: {_listing(cycle)}", nodes=cycle
+        ))
+
+    reached = _reachable(adjacency, starts)
+    unreachable = tuple(ids[n] for n in range(len(ids)) if not reached[n])
+    if unreachable:
+        findings.append(GraphFinding(
+            WARNING, "unreachable",
+            f"Graph nodes unreachable from entry nodes: {_listing(unreachable)}",
+            nodes=unreachable,
+        ))
+
+    return GraphAnalysis(
+        findings=tuple(findings),
+        entries=tuple(ids[n] for n in starts),
+        cycles=cycles,
+        unreachable=unreachable,
+    )
+
+
+def strongly_connected_components(adjacency: List[List[int]]) -> List[List[int]]:
+    """
+    Tarjan's algorithm without recursion.
+
+    Args:
+        adjacency: Successor indices per vertex
+
+    Returns:
+        Components as lists of vertex indices, in reverse topological order
+    """
+    count = len(adjacency)
+    order = [-1] * count
+    low = [0] * count
+    on_stack = [False] * count
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter = 0
+
+    for root in range(count):
+        if order[root] != -1:
+            continue
+        work = [(root, 0)]
+        while work:
+            v, i = work.pop()
+            if i == 0:
+                order[v] = low[v] = counter
+                counter += 1
+                stack.append(v)
+                on_stack[v] = True
+            successors = adjacency[v]
+            while i < len(successors):
+                w = successors[i]
+                i += 1
+                if order[w] == -1:
+                    work.append((v, i))
+                    work.append((w, 0))
+                    break
+                if on_stack[w] and order[w] < low[v]:
+                    low[v] = order[w]
+            else:
+                if low[v] == order[v]:
+                    component = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        component.append(w)
+                        if w == v:
+                            break
+                    component.reverse()
+                    components.append(component)
+                if work:
+                    parent = work[-1][0]
+                    if low[v] < low[parent]:
+                        low[parent] = low[v]
+    return components
+
+
+def _reachable(adjacency: List[List[int]], starts: Iterable[int]) -> List[bool]:
+    reached = [False] * len(adjacency)
+    frontier = []
+    for start in starts:
+        if not reached[start]:
+            reached[start] = True
+            frontier.append(start)
+    while frontier:
+        v = frontier.pop()
+        for w in adjacency[v]:
+            if not reached[w]:
+                reached[w] = True
+                frontier.append(w)
+    return reached
+
+
+def _listing(node_ids: Tuple[str, ...]) -> str:
+    shown = ", ".join(node_ids[:_MAX_LISTED])
+    if len(node_ids) > _MAX_LISTED:
+        shown += f" and {len(node_ids) - _MAX_LISTED} more"
+    return shown
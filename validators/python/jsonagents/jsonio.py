@@ -0,0 +1,115 @@
+"""JSON parsing with an optional fast backend.
+
+Manifests are parsed from bytes, never from decoded text. ``orjson`` or
+``msgspec`` is used when installed (``pip install jsonagents[fast]``), the
+standard library ``json`` module otherwise. Large files are memory-mapped and
+handed to backends that can parse a buffer in place.
+
+Documents a fast backend rejects are re-parsed with ``json``, so the accepted
+documents and error messages are the same whichever backend is active (for
+example, ``NaN`` literals and integers beyond 64 bits still parse).
+"""
+
+import json
+import mmap
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple, Type, Union
+
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+BACKEND_NAMES = ("orjson", "msgspec", "json")
+
+# Files at least this large are memory-mapped instead of read into bytes
+MMAP_THRESHOLD = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class JSONBackend:
+    """A JSON decoder for byte buffers."""
+
+    name: str
+    decode: Callable[[Any], Any]
+    errors: Tuple[Type[BaseException], ...]
+    accepts_buffers: bool
+
+
+@lru_cache(maxsize=None)
+def get_backend(name: Optional[str] = None) -> JSONBackend:
+    """
+    Return a JSON backend.
+
+    Args:
+        name: "orjson", "msgspec", "json", or None/"auto" for the fastest one
+              installed
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If the requested backend is not installed
+    """
+    if name in (None, "auto"):
+        for candidate in BACKEND_NAMES:
+            try:
+                return get_backend(candidate)
+            except ImportError:
+                continue
+    if name == "orjson":
+        import orjson
+
+        return JSONBackend("orjson", orjson.loads, (orjson.JSONDecodeError,), True)
+    if name == "msgspec":
+        import msgspec
+
+        return JSONBackend("msgspec", msgspec.json.decode, (msgspec.DecodeError,), True)
+    if name == "json":
+        return JSONBackend("json", json.loads, (ValueError,), False)
+    raise ValueError(f"Unknown JSON backend {name!r}. Use one of: auto, {', '.join(BACKEND_NAMES)}")
+
+
+def loads(data: Union[Buffer, str], backend: Optional[JSONBackend] = None) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: The document as bytes, bytearray, memoryview or str
+        backend: Backend to use. If None, the fastest installed one.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+        UnicodeDecodeError: If bytes are not valid UTF-8/16/32
+    """
+    backend = backend or get_backend()
+    if backend.name != "json":
+        try:
+            return backend.decode(data)
+        except backend.errors:
+            pass
+    if isinstance(data, (memoryview, mmap.mmap)):
+        data = bytes(data)
+    return json.loads(data)
+
+
+def load_path(path: Union[str, Path], backend: Optional[JSONBackend] = None) -> Any:
+    """
+    Parse a JSON file with a single read, or via mmap for large files.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    backend = backend or get_backend()
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        # Empty files cannot be mapped
+        if backend.accepts_buffers and size and size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    return loads(view, backend)
+                finally:
+                    view.release()
+        data = f.read()
+    return loads(data, backend)
@@ -0,0 +1,206 @@
+"""Metrics reported by the validators.
+
+Validators report counters and latency histograms into a :class:`Metrics`
+object. The default, :data:`NULL_METRICS`, discards everything and tells the
+validators not to collect anything. Install a :class:`Registry` to keep the
+values in process and export them in the Prometheus text format:
+
+    >>> registry = Registry()
+    >>> set_metrics(registry)            # or Validator(metrics=registry)
+    >>> Validator().validate("manifest.json")
+    >>> print(registry.to_prometheus())
+
+Other backends (StatsD, OpenTelemetry, ...) only need to subclass
+:class:`Metrics` and implement :meth:`Metrics.inc` and :meth:`Metrics.observe`.
+"""
+
+import math
+import threading
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+
+COUNTER = "counter"
+HISTOGRAM = "histogram"
+
+# Standard metrics: name -> (type, help)
+METRICS: Dict[str, Tuple[str, str]] = {
+    "jsonagents_manifests_validated_total": (COUNTER, "Manifests validated"),
+    "jsonagents_manifests_failed_total": (COUNTER, "Manifests that failed validation"),
+    "jsonagents_validation_errors_total": (
+        COUNTER, "Validation errors by category (the stage that found them)"),
+    "jsonagents_cache_hits_total": (COUNTER, "Cache hits by cache"),
+    "jsonagents_cache_misses_total": (COUNTER, "Cache misses by cache"),
+    "jsonagents_uri_checks_total": (COUNTER, "ajson:// URIs checked by result"),
+    "jsonagents_policy_checks_total": (COUNTER, "Policy expressions checked by result"),
+    "jsonagents_validation_seconds": (HISTOGRAM, "Manifest validation latency"),
+    "jsonagents_validation_stage_seconds": (HISTOGRAM, "Validation latency by stage"),
+    "jsonagents_http_requests_total": (COUNTER, "HTTP requests by endpoint and status"),
+    "jsonagents_http_request_seconds": (HISTOGRAM, "HTTP request latency by endpoint"),
+}
+
+# Latency buckets in seconds, from 50 microseconds to 10 seconds
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+Labels = Optional[Mapping[str, str]]
+_LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class Metrics:
+    """
+    Metrics interface; this base class discards everything.
+
+    Validators check :attr:`enabled` before doing any work whose only purpose
+    is to feed metrics, such as timing validation stages.
+    """
+
+    enabled = False
+
+    def inc(self, name: str, value: float = 1.0, labels: Labels = None) -> None:
+        """Add ``value`` to a counter."""
+
+    def observe(self, name: str, value: float, labels: Labels = None) -> None:
+        """Record one observation, in seconds for latencies, in a histogram."""
+
+
+NULL_METRICS = Metrics()
+
+_metrics: Metrics = NULL_METRICS
+
+
+def get_metrics() -> Metrics:
+    """Return the process-wide metrics used by validators without their own."""
+    return _metrics
+
+
+def set_metrics(metrics: Optional[Metrics]) -> None:
+    """Install process-wide metrics. None restores the no-op default."""
+    global _metrics
+    _metrics = metrics if metrics is not None else NULL_METRICS
+
+
+class _Histogram:
+    """Cumulative-bucket histogram of one label set."""
+
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, buckets: int) -> None:
+        self.counts = [0] * buckets
+        self.sum = 0.0
+        self.count = 0
+
+
+class Registry(Metrics):
+    """
+    Thread-safe, in-process metrics store with a Prometheus text exporter.
+
+    Metrics are created on first use. Names in :data:`METRICS` carry their
+    help text; any other name is exported without one.
+    """
+
+    enabled = True
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """
+        Initialize the registry.
+
+        Args:
+            buckets: Upper bounds of the histogram buckets, ascending;
+                     a ``+Inf`` bucket is always added
+        """
+        if list(buckets) != sorted(buckets):
+            raise ValueError("buckets must be in ascending order")
+        self.buckets = tuple(b for b in buckets if not math.isinf(b))
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[_LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[_LabelKey, _Histogram]] = {}
+
+    def inc(self, name: str, value: float = 1.0, labels: Labels = None) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, labels: Labels = None) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(len(self.buckets))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    histogram.counts[i] += 1
+                    break
+            histogram.sum += value
+            histogram.count += 1
+
+    def value(self, name: str, labels: Labels = None) -> float:
+        """Current value of a counter, 0 if never incremented."""
+        with self._lock:
+            return self._counters.get(name, {}).get(_label_key(labels), 0.0)
+
+    def histogram(self, name: str, labels: Labels = None) -> Tuple[int, float]:
+        """Observation count and sum of a histogram, (0, 0.0) if empty."""
+        with self._lock:
+            histogram = self._histograms.get(name, {}).get(_label_key(labels))
+            return (histogram.count, histogram.sum) if histogram else (0, 0.0)
+
+    def clear(self) -> None:
+        """Drop every recorded value."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def to_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format (0.0.4)."""
+        lines: List[str] = []
+        with self._lock:
+            for name in sorted(self._counters):
+                _header(lines, name, COUNTER)
+                for key, value in sorted(self._counters[name].items()):
+                    lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+            for name in sorted(self._histograms):
+                _header(lines, name, HISTOGRAM)
+                for key, histogram in sorted(self._histograms[name].items()):
+                    cumulative = 0
+                    for bound, count in zip(self.buckets, histogram.counts):
+                        cumulative += count
+                        le = (("le", _format_value(bound)),)
+                        lines.append(f"{name}_bucket{_format_labels(key + le)} {cumulative}")
+                    lines.append(f"{name}_bucket{_format_labels(key + (('le', '+Inf'),))} "
+                                 f"{histogram.count}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {_format_value(histogram.sum)}")
+                    lines.append(f"{name}_count{_format_labels(key)} {histogram.count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def _label_key(labels: Labels) -> _LabelKey:
+    return tuple(sorted(labels.items())) if labels else ()
+
+
+def _header(lines: List[str], name: str, kind: str) -> None:
+    _, help_text = METRICS.get(name, (kind, ""))
+    if help_text:
+        lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+
+
+def _format_labels(key: _LabelKey) -> str:
+    if not key:
+        return ""
+    return "{" + ",".join(f'{label}="{_escape(value)}"' for label, value in key) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
@@ -0,0 +1,458 @@
+"""Tokenizer, syntax tree and parser for policy where clause expressions (Appendix B).
+
+Grammar implemented by :func:`parse`, from lowest to highest precedence::
+
+    expression = or_expr
+    or_expr    = and_expr *(("||" | "or") and_expr)
+    and_expr   = not_expr *(("&&" | "and") not_expr)
+    not_expr   = "not" not_expr | comparison
+    comparison = operand [compare_op operand]
+    operand    = "(" expression ")" | literal | array | accessor
+    accessor   = identifier *("." identifier | "[" (NUMBER | STRING) "]")
+    array      = "[" [literal *("," literal)] "]"
+
+``not`` applies to a whole comparison, so ``not tool.type == 'system'`` reads as
+``not (tool.type == 'system')``. Comparisons do not chain.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+
+# Token kinds
+LITERAL = "literal"
+NAME = "name"
+OP = "op"
+LPAREN = "("
+RPAREN = ")"
+LBRACKET = "["
+RBRACKET = "]"
+COMMA = ","
+DOT = "."
+EOF = "eof"
+
+COMPARE_OPS = frozenset({
+    "==", "!=", ">", "<", ">=", "<=",
+    "~", "!~", "contains", "starts_with", "ends_with",
+    "in", "not in",
+})
+AND_OPS = frozenset({"&&", "and"})
+OR_OPS = frozenset({"||", "or"})
+
+WORD_OPS = frozenset({"and", "or", "not", "in", "contains", "starts_with", "ends_with"})
+WORD_LITERALS = {"true": True, "false": False, "null": None}
+
+INVALID_OPS = {
+    "===": "Invalid operator '==='. Use '==' for equality",
+    "=": "Invalid operator '='. Use '==' for comparison",
+    "&": "Invalid operator '&'. Use '&&' or '||' for logical operations",
+    "|": "Invalid operator '|'. Use '&&' or '||' for logical operations",
+    "!": "Invalid operator '!'. Use 'not' for negation",
+}
+
+Span = Tuple[int, int]
+
+
+class PolicySyntaxError(ValueError):
+    """Raised when a policy expression cannot be parsed."""
+
+    def __init__(self, errors: List[str], offset: int = 0) -> None:
+        super().__init__(errors[0] if errors else "Invalid policy expression")
+        self.errors = errors
+        self.offset = offset
+
+
+class Token(NamedTuple):
+    """A typed lexical token with its source offsets."""
+
+    kind: str
+    text: str
+    start: int
+    end: int
+    value: Any = None
+
+
+@dataclass(frozen=True)
+class Literal:
+    """A string, number, boolean or null literal."""
+
+    value: Any
+    span: Span
+
+
+@dataclass(frozen=True)
+class Path:
+    """A context accessor such as ``tool.auth.method`` or ``tool.args[0]``."""
+
+    parts: Tuple[Union[str, int], ...]
+    span: Span
+
+    @property
+    def root(self) -> str:
+        """The context variable the accessor starts from."""
+        return str(self.parts[0])
+
+    @property
+    def dotted(self) -> str:
+        """The accessor in source notation."""
+        return dotted_path(self.parts)
+
+
+@dataclass(frozen=True)
+class Array:
+    """An array of literals, e.g. the right operand of ``in``."""
+
+    items: Tuple[Literal, ...]
+    span: Span
+
+
+@dataclass(frozen=True)
+class Compare:
+    """A binary comparison, string or collection operation."""
+
+    op: str
+    left: "Node"
+    right: "Node"
+    span: Span
+
+
+@dataclass(frozen=True)
+class Not:
+    """Logical negation."""
+
+    operand: "Node"
+    span: Span
+
+
+@dataclass(frozen=True)
+class Logical:
+    """A chain of ``and`` or ``or`` operands (``&&``/``||`` are normalized)."""
+
+    op: str
+    operands: Tuple["Node", ...]
+    span: Span
+
+
+Node = Union[Literal, Path, Array, Compare, Not, Logical]
+
+
+def dotted_path(parts: Tuple[Union[str, int], ...]) -> str:
+    """Render accessor parts in source notation, e.g. ``tool.args[0]``."""
+    out = str(parts[0])
+    for part in parts[1:]:
+        if isinstance(part, int):
+            out += f"[{part}]"
+        elif part.isidentifier():
+            out += f".{part}"
+        else:
+            out += f"[{part!r}]"
+    return out
+
+
+def walk(node: Node) -> Iterator[Node]:
+    """Yield a node and all of its descendants, depth first."""
+    stack: List[Node] = [node]
+    while stack:
+        current = stack.pop()
+        yield current
+        if isinstance(current, Compare):
+            stack.append(current.right)
+            stack.append(current.left)
+        elif isinstance(current, Not):
+            stack.append(current.operand)
+        elif isinstance(current, Logical):
+            stack.extend(reversed(current.operands))
+        elif isinstance(current, Array):
+            stack.extend(reversed(current.items))
+
+
+def paths(node: Node) -> List[Path]:
+    """Return every context accessor referenced by an expression, in source order."""
+    return [n for n in walk(node) if isinstance(n, Path)]
+
+
+# One master pattern; alternatives are tried in order at each position and
+# every character is consumed by exactly one branch, so scanning is linear.
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<space>\s+)
+    |(?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+    |(?P<number>-?\d+(?:\.\d+)?(?![\w.]))
+    |(?P<bad_number>-?\d[\w.]*)
+    |(?P<not_in>not\s+in\b)
+    |(?P<word>[A-Za-z_][A-Za-z0-9_]*)
+    |(?P<invalid>===)
+    |(?P<op>&&|\|\||==|!=|>=|<=|!~|[<>~])
+    |(?P<invalid_char>[=&|!])
+    |(?P<open>[(\[])
+    |(?P<close>[)\]])
+    |(?P<punct>[,.])
+    |(?P<quote>['"])
+    |(?P<other>.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+_STRING_ESCAPE = re.compile(r"\\(['\"\\])")
+
+_CLOSERS = {")": "(", "]": "["}
+_BRACKET_NAMES = {"(": "parentheses", "[": "brackets"}
+
+
+def tokenize(expression: str) -> Tuple[List[Token], List[str]]:
+    """
+    Split an expression into tokens in a single linear pass.
+
+    Returns:
+        (tokens, errors) where tokens always ends with an EOF token and errors
+        lists lexical problems such as invalid operators or unbalanced brackets.
+    """
+    tokens: List[Token] = []
+    append = tokens.append
+    errors: List[str] = []
+    stack: List[str] = []
+    balance_error: Optional[str] = None
+
+    for match in _TOKEN_RE.finditer(expression):
+        kind = match.lastgroup
+        if kind == "space":
+            continue
+        text = match.group()
+        start, end = match.span()
+        if kind == "word":
+            if text in WORD_OPS:
+                append(Token(OP, text, start, end, text))
+            elif text in WORD_LITERALS:
+                append(Token(LITERAL, text, start, end, WORD_LITERALS[text]))
+            else:
+                append(Token(NAME, text, start, end, text))
+        elif kind == "punct" or kind == "op":
+            append(Token(OP if kind == "op" else text, text, start, end, text))
+        elif kind == "string":
+            value = text[1:-1]
+            if "\\" in value:
+                value = _STRING_ESCAPE.sub(r"\1", value)
+            append(Token(LITERAL, text, start, end, value))
+        elif kind == "number":
+            append(Token(LITERAL, text, start, end, float(text) if "." in text else int(text)))
+        elif kind == "open":
+            stack.append(text)
+            append(Token(text, text, start, end, text))
+        elif kind == "close":
+            if balance_error is None:
+                if not stack:
+                    balance_error = f"Unbalanced {_BRACKET_NAMES[_CLOSERS[text]]}"
+                elif stack[-1] != _CLOSERS[text]:
+                    balance_error = f"Mismatched brackets: '{stack[-1]}' closed by '{text}'"
+                else:
+                    stack.pop()
+            append(Token(text, text, start, end, text))
+        elif kind == "not_in":
+            append(Token(OP, "not in", start, end, "not in"))
+        elif kind == "invalid" or kind == "invalid_char":
+            errors.append(INVALID_OPS[text])
+        elif kind == "bad_number":
+            errors.append(f"Invalid number '{text}' at offset {start}")
+        elif kind == "quote":
+            errors.append(f"Unterminated string literal at offset {start}")
+            break
+        else:
+            errors.append(f"Unexpected character '{text}' at offset {start}")
+
+    if balance_error is None and stack:
+        balance_error = f"Unbalanced {_BRACKET_NAMES[stack[-1]]}"
+    if balance_error is not None:
+        errors.append(balance_error)
+
+    length = len(expression)
+    append(Token(EOF, "", length, length))
+    return tokens, errors
+
+
+class _Parser:
+    """Recursive-descent parser over a token list."""
+
+    def __init__(self, tokens: List[Token]) -> None:
+        self.tokens = tokens
+        self.pos = 0
+
+    def parse(self) -> Node:
+        if self.tokens[0].kind == EOF:
+            raise PolicySyntaxError(["Expression is empty"])
+        node = self.parse_or()
+        token = self.peek()
+        if token.kind != EOF:
+            self.fail(f"Unexpected {_describe(token)} at offset {token.start}; expected an operator")
+        return node
+
+    def peek(self) -> Token:
+        return self.tokens[self.pos]
+
+    def advance(self) -> Token:
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def previous(self) -> Optional[Token]:
+        return self.tokens[self.pos - 1] if self.pos > 0 else None
+
+    def fail(self, message: str) -> None:
+        raise PolicySyntaxError([message], self.peek().start)
+
+    def parse_or(self) -> Node:
+        return self._parse_logical("or", OR_OPS, self.parse_and)
+
+    def parse_and(self) -> Node:
+        return self._parse_logical("and", AND_OPS, self.parse_not)
+
+    def _parse_logical(self, op: str, ops: frozenset, operand: Any) -> Node:
+        operands = [operand()]
+        while self.peek().kind == OP and self.peek().value in ops:
+            self.advance()
+            operands.append(operand())
+        if len(operands) == 1:
+            return operands[0]
+        return Logical(op, tuple(operands), (_start(operands[0]), _end(operands[-1])))
+
+    def parse_not(self) -> Node:
+        token = self.peek()
+        if token.kind == OP and token.value == "not":
+            self.advance()
+            operand = self.parse_not()
+            return Not(operand, (token.start, _end(operand)))
+        return self.parse_comparison()
+
+    def parse_comparison(self) -> Node:
+        left = self.parse_operand()
+        token = self.peek()
+        if token.kind != OP or token.value not in COMPARE_OPS:
+            return left
+        self.advance()
+        right = self.parse_operand()
+        if token.value in ("~", "!~") and isinstance(right, Literal) and isinstance(right.value, str):
+            try:
+                re.compile(right.value)
+            except re.error as e:
+                raise PolicySyntaxError(
+                    [f"Invalid regular expression for '{token.value}': {e}"], right.span[0]
+                )
+        if self.peek().kind == OP and self.peek().value in COMPARE_OPS:
+            self.fail(f"Comparisons cannot be chained: '{self.peek().text}' at offset {self.peek().start}")
+        return Compare(token.value, left, right, (_start(left), _end(right)))
+
+    def parse_operand(self) -> Node:
+        token = self.peek()
+        if token.kind == LPAREN:
+            self.advance()
+            node = self.parse_or()
+            self.expect(RPAREN)
+            return node
+        if token.kind == LITERAL:
+            self.advance()
+            return Literal(token.value, (token.start, token.end))
+        if token.kind == LBRACKET:
+            return self.parse_array()
+        if token.kind == NAME:
+            return self.parse_path()
+        self._missing_operand(token)
+        raise AssertionError("unreachable")
+
+    def _missing_operand(self, token: Token) -> None:
+        prev = self.previous()
+        if token.kind == OP:
+            if prev is None:
+                self.fail(f"Operator '{token.text}' at start of expression needs left operand")
+            if prev.kind in (LPAREN, LBRACKET):
+                self.fail(f"Operator '{token.text}' after '{prev.text}' needs left operand")
+            self.fail(f"Consecutive operators: {prev.text} {token.text}")
+        if prev is not None and prev.kind == OP:
+            if token.kind == EOF:
+                self.fail(f"Operator '{prev.text}' at end of expression needs right operand")
+            if token.kind in (RPAREN, RBRACKET):
+                self.fail(f"Operator '{prev.text}' before '{token.text}' needs right operand")
+        if token.kind == EOF:
+            self.fail("Unexpected end of expression")
+        self.fail(f"Unexpected {_describe(token)} at offset {token.start}")
+
+    def parse_path(self) -> Path:
+        first = self.advance()
+        parts: List[Union[str, int]] = [first.text]
+        end = first.end
+        while True:
+            token = self.peek()
+            if token.kind == DOT:
+                self.advance()
+                name = self.peek()
+                if name.kind not in (NAME, OP) or not name.text.isidentifier():
+                    self.fail(f"Expected a field name after '.' at offset {token.start}")
+                self.advance()
+                parts.append(name.text)
+                end = name.end
+            elif token.kind == LBRACKET:
+                self.advance()
+                index = self.peek()
+                if index.kind != LITERAL or isinstance(index.value, (bool, float)) \
+                        or index.value is None:
+                    self.fail(f"Expected an integer or string index at offset {index.start}")
+                self.advance()
+                parts.append(index.value)
+                end = self.expect(RBRACKET).end
+            else:
+                return Path(tuple(parts), (first.start, end))
+
+    def parse_array(self) -> Array:
+        opening = self.advance()
+        items: List[Literal] = []
+        if self.peek().kind != RBRACKET:
+            while True:
+                item = self.parse_operand()
+                if not isinstance(item, Literal):
+                    raise PolicySyntaxError(
+                        [f"Array items must be literal values (offset {_start(item)})"],
+                        _start(item),
+                    )
+                items.append(item)
+                if self.peek().kind != COMMA:
+                    break
+                self.advance()
+        closing = self.expect(RBRACKET)
+        return Array(tuple(items), (opening.start, closing.end))
+
+    def expect(self, kind: str) -> Token:
+        token = self.peek()
+        if token.kind != kind:
+            self.fail(f"Expected '{kind}' at offset {token.start}, found {_describe(token)}")
+        return self.advance()
+
+
+def _describe(token: Token) -> str:
+    if token.kind == EOF:
+        return "end of expression"
+    if token.kind == LITERAL:
+        return f"literal {token.text}"
+    return f"'{token.text}'"
+
+
+def _start(node: Node) -> int:
+    return node.span[0]
+
+
+def _end(node: Node) -> int:
+    return node.span[1]
+
+
+def parse(expression: str) -> Node:
+    """
+    Parse a policy expression into a syntax tree.
+
+    Raises:
+        PolicySyntaxError: If the expression is not well formed
+    """
+    tokens, errors = tokenize(expression)
+    if errors:
+        raise PolicySyntaxError(errors)
+    try:
+        return _Parser(tokens).parse()
+    except RecursionError:
+        raise PolicySyntaxError(["Expression is nested too deeply"])
@@ -0,0 +1,281 @@
+"""Column-wise batch evaluation of compiled policies.
+
+Every accessor a policy reads is flattened once into a column, then each
+operator is applied to whole columns and combined into a boolean mask. With
+NumPy installed, equality, numeric comparisons and the logical operators run
+as array operations; otherwise (or with ``backend="python"``) columns are
+plain lists. Both backends give the same answers as evaluating the compiled
+policy row by row.
+"""
+
+import math
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .policy_ast import Array, Compare, Literal, Logical, Node, Not, Path, dotted_path
+from .policy_eval import (
+    BINARY_OPS,
+    CompiledPolicy,
+    Context,
+    _compile_path_literal,
+    literal_value,
+)
+
+
+PathKey = Tuple[Union[str, int], ...]
+
+# Largest integer magnitude float64 represents exactly
+_EXACT_FLOAT_INT = 2 ** 53
+_NUMBER_TYPES = (int, float)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _load_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def evaluate_batch(
+    policy: CompiledPolicy,
+    contexts: Iterable[Context],
+    backend: Optional[str] = None,
+) -> Any:
+    """
+    Evaluate a compiled policy against many contexts.
+
+    Args:
+        policy: The compiled policy
+        contexts: Evaluation contexts (materialized once)
+        backend: "numpy", "python", or None to use NumPy when installed
+
+    Returns:
+        Boolean mask, one entry per context: a NumPy bool array with the
+        NumPy backend, a list of bools otherwise
+    """
+    rows = contexts if isinstance(contexts, Sequence) else list(contexts)
+    return _evaluate(policy.tree, flatten(rows, policy.paths), len(rows), backend)
+
+
+def flatten(contexts: Sequence[Context], accessors: Iterable[PathKey]) -> Dict[PathKey, List[Any]]:
+    """
+    Flatten contexts into one column per accessor.
+
+    Shared prefixes (``tool`` for ``tool.type`` and ``tool.auth.method``) are
+    walked once; missing values become None, as in row-wise evaluation.
+    """
+    columns: Dict[PathKey, List[Any]] = {(): list(contexts)}
+
+    def column(parts: PathKey) -> List[Any]:
+        existing = columns.get(parts)
+        if existing is not None:
+            return existing
+        parent = column(parts[:-1])
+        key = parts[-1]
+        try:
+            # Homogeneous recorded contexts take this C-level path
+            values = list(map(itemgetter(key), parent))
+        except (KeyError, IndexError, TypeError):
+            values = [_step(v, key) for v in parent]
+        columns[parts] = values
+        return values
+
+    return {parts: column(parts) for parts in accessors}
+
+
+def _step(container: Any, key: Union[str, int]) -> Any:
+    try:
+        return container[key]
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
+def evaluate_columns(
+    policy: CompiledPolicy,
+    columns: Mapping[str, Sequence[Any]],
+    backend: Optional[str] = None,
+) -> Any:
+    """
+    Evaluate a compiled policy against data that is already columnar.
+
+    Args:
+        policy: The compiled policy
+        columns: Values per accessor, keyed by dotted path (e.g. "tool.type").
+                 Accessors without a column evaluate to null.
+        backend: "numpy", "python", or None to use NumPy when installed
+
+    Raises:
+        ValueError: If the columns have different lengths
+    """
+    lengths = {len(column) for column in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"Columns have different lengths: {sorted(lengths)}")
+    length = lengths.pop() if lengths else 0
+    keyed = {}
+    for parts in policy.paths:
+        column = columns.get(dotted_path(parts))
+        keyed[parts] = list(column) if column is not None else [None] * length
+    return _evaluate(policy.tree, keyed, length, backend)
+
+
+def _evaluate(tree: Node, columns: Dict[PathKey, List[Any]], length: int,
+              backend: Optional[str]) -> Any:
+    if backend not in (None, "numpy", "python"):
+        raise ValueError(f"Unknown backend {backend!r}. Use 'numpy' or 'python'")
+    numpy = _load_numpy() if backend != "python" else None
+    if backend == "numpy" and numpy is None:
+        raise ImportError("The numpy backend requires NumPy to be installed")
+    if numpy is not None:
+        return _NumpyEvaluator(numpy, columns, length).mask(tree)
+    return _PythonEvaluator(columns, length).mask(tree)
+
+
+class _PythonEvaluator:
+    """Evaluates masks as lists of bools."""
+
+    def __init__(self, columns: Dict[PathKey, List[Any]], length: int) -> None:
+        self.columns = columns
+        self.length = length
+
+    def mask(self, node: Node) -> List[bool]:
+        if isinstance(node, Logical):
+            masks = [self.mask(operand) for operand in node.operands]
+            combine = all if node.op == "and" else any
+            return [combine(row) for row in zip(*masks)]
+        if isinstance(node, Not):
+            return [not value for value in self.mask(node.operand)]
+        if isinstance(node, Compare):
+            return self.compare(node)
+        if isinstance(node, Path):
+            return [bool(value) for value in self.columns[node.parts]]
+        return [bool(literal_value(node))] * self.length
+
+    def compare(self, node: Compare) -> List[bool]:
+        row_predicate = _row_predicate(node)
+        if row_predicate is not None:
+            return [row_predicate(value) for value in self.columns[node.left.parts]]
+        return _generic_compare(node, self.columns, self.length)
+
+
+class _NumpyEvaluator:
+    """Evaluates masks as NumPy bool arrays."""
+
+    def __init__(self, numpy: Any, columns: Dict[PathKey, List[Any]], length: int) -> None:
+        self.np = numpy
+        self.columns = columns
+        self.length = length
+        self._objects: Dict[PathKey, Any] = {}
+        self._numbers: Dict[PathKey, Optional[Any]] = {}
+
+    def mask(self, node: Node) -> Any:
+        np = self.np
+        if isinstance(node, Logical):
+            masks = [self.mask(operand) for operand in node.operands]
+            reduce = np.logical_and if node.op == "and" else np.logical_or
+            return reduce.reduce(masks) if masks else np.ones(self.length, dtype=bool)
+        if isinstance(node, Not):
+            return ~self.mask(node.operand)
+        if isinstance(node, Compare):
+            return self.compare(node)
+        if isinstance(node, Path):
+            return self._from_rows(bool, self.columns[node.parts])
+        return np.full(self.length, bool(literal_value(node)), dtype=bool)
+
+    def compare(self, node: Compare) -> Any:
+        if isinstance(node.left, Path) and isinstance(node.right, (Literal, Array)):
+            vectorized = self._vectorized(node.op, node.left.parts, literal_value(node.right))
+            if vectorized is not None:
+                return vectorized
+        row_predicate = _row_predicate(node)
+        if row_predicate is not None:
+            return self._from_rows(row_predicate, self.columns[node.left.parts])
+        return self.np.fromiter(
+            _generic_compare(node, self.columns, self.length), dtype=bool, count=self.length
+        )
+
+    def _vectorized(self, op: str, parts: PathKey, lit: Any) -> Optional[Any]:
+        """Array implementation of ``accessor <op> literal`` where one exists."""
+        if type(lit) is str and op in ("==", "!="):
+            equal = self._object_column(parts) == lit
+            return equal if op == "==" else ~equal
+        if type(lit) in _NUMBER_TYPES and op in ("==", "!=", ">", "<", ">=", "<="):
+            if type(lit) is int and not -_EXACT_FLOAT_INT <= lit <= _EXACT_FLOAT_INT:
+                # The literal itself would be rounded as a float
+                return None
+            numbers = self._number_column(parts)
+            if numbers is None:
+                return None
+            np = self.np
+            result = {
+                "==": np.equal, "!=": np.equal,
+                ">": np.greater, "<": np.less,
+                ">=": np.greater_equal, "<=": np.less_equal,
+            }[op](numbers, lit)
+            return ~result if op == "!=" else result
+        if op in ("in", "not in") and type(lit) is tuple and lit \
+                and all(type(item) is str for item in lit):
+            try:
+                found = self.np.frompyfunc(frozenset(lit).__contains__, 1, 1)(
+                    self._object_column(parts)
+                ).astype(bool)
+            except TypeError:
+                # Unhashable values (arrays, objects) in the column
+                return None
+            return found if op == "in" else ~found
+        return None
+
+    def _object_column(self, parts: PathKey) -> Any:
+        column = self._objects.get(parts)
+        if column is None:
+            values = self.columns[parts]
+            column = self.np.empty(self.length, dtype=object)
+            try:
+                column[:] = values
+            except ValueError:
+                # Equal-length nested sequences can be mistaken for a 2-D shape
+                for i, value in enumerate(values):
+                    column[i] = value
+            self._objects[parts] = column
+        return column
+
+    def _number_column(self, parts: PathKey) -> Optional[Any]:
+        """Column as float64 with NaN for non-numbers, or None if floats would lose precision."""
+        if parts in self._numbers:
+            return self._numbers[parts]
+        values = [v if type(v) in _NUMBER_TYPES else math.nan for v in self.columns[parts]]
+        exact = all(
+            -_EXACT_FLOAT_INT <= v <= _EXACT_FLOAT_INT for v in values if type(v) is int
+        )
+        column = self.np.array(values, dtype=float) if exact else None
+        self._numbers[parts] = column
+        return column
+
+    def _from_rows(self, function: Callable[[Any], bool], values: List[Any]) -> Any:
+        return self.np.fromiter(
+            (function(value) for value in values), dtype=bool, count=self.length
+        )
+
+
+def _row_predicate(node: Compare) -> Optional[Callable[[Any], bool]]:
+    """The compiled ``accessor <op> literal`` predicate applied to a bare value."""
+    if isinstance(node.left, Path) and isinstance(node.right, (Literal, Array)):
+        return _compile_path_literal(node.op, _identity, literal_value(node.right))
+    return None
+
+
+def _generic_compare(node: Compare, columns: Dict[PathKey, List[Any]], length: int) -> List[bool]:
+    op = BINARY_OPS[node.op]
+    left = _operand_column(node.left, columns, length)
+    right = _operand_column(node.right, columns, length)
+    return [op(a, b) for a, b in zip(left, right)]
+
+
+def _operand_column(node: Node, columns: Dict[PathKey, List[Any]], length: int) -> Sequence[Any]:
+    if isinstance(node, Path):
+        return columns[node.parts]
+    return [literal_value(node)] * length
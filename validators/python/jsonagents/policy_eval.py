@@ -0,0 +1,310 @@
+"""Compile policy where clause syntax trees into fast evaluation callables.
+
+Evaluation semantics:
+
+- Accessors read nested mappings and sequences; a missing key, index out of
+  range or non-container along the way yields ``null`` (``None``).
+- ``==``/``!=`` compare by value, but booleans never equal numbers.
+- ``<``, ``>``, ``<=``, ``>=`` are true only for two numbers or two strings.
+- ``~``/``!~`` use ``re.search``; ``contains``, ``starts_with`` and
+  ``ends_with`` operate on strings (``contains`` also on arrays).
+- ``in``/``not in`` test membership in an array, or substring in a string.
+- ``&&``/``and`` and ``||``/``or`` short-circuit; a bare operand is tested for
+  truthiness.
+"""
+
+import re
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .policy_ast import Array, Compare, Literal, Logical, Node, Not, Path, parse, paths
+
+
+Context = Mapping[str, Any]
+Getter = Callable[[Context], Any]
+Predicate = Callable[[Context], bool]
+
+_NUMBER_TYPES = (int, float)
+
+
+class CompiledPolicy:
+    """A where clause compiled into a callable over an evaluation context."""
+
+    __slots__ = ("expression", "tree", "paths", "_predicate")
+
+    def __init__(self, expression: str, tree: Node) -> None:
+        self.expression = expression
+        self.tree = tree
+        self.paths: Tuple[Tuple[Union[str, int], ...], ...] = tuple(
+            dict.fromkeys(p.parts for p in paths(tree))
+        )
+        self._predicate = _compile_predicate(tree)
+
+    def __call__(self, context: Context) -> bool:
+        """
+        Evaluate the clause.
+
+        Args:
+            context: Mapping with ``tool``, ``message``, ``agent`` and
+                     ``runtime`` entries
+
+        Returns:
+            True if the clause matches the context
+        """
+        return self._predicate(context)
+
+    evaluate = __call__
+
+    def evaluate_batch(self, contexts: Iterable[Context], backend: Optional[str] = None) -> Any:
+        """
+        Evaluate against many contexts column-wise, returning a boolean mask.
+
+        See :func:`jsonagents.policy_batch.evaluate_batch`.
+        """
+        from .policy_batch import evaluate_batch
+
+        return evaluate_batch(self, contexts, backend=backend)
+
+    def evaluate_columns(
+        self,
+        columns: Mapping[str, Sequence[Any]],
+        backend: Optional[str] = None,
+    ) -> Any:
+        """
+        Evaluate against columnar data keyed by dotted accessor path.
+
+        See :func:`jsonagents.policy_batch.evaluate_columns`.
+        """
+        from .policy_batch import evaluate_columns
+
+        return evaluate_columns(self, columns, backend=backend)
+
+    def __repr__(self) -> str:
+        return f"CompiledPolicy({self.expression!r})"
+
+
+def compile_policy(expression: str, tree: Optional[Node] = None) -> CompiledPolicy:
+    """
+    Compile a where clause into a :class:`CompiledPolicy`.
+
+    Args:
+        expression: The policy expression
+        tree: Its syntax tree, if already parsed
+
+    Raises:
+        PolicySyntaxError: If the expression is not well formed
+    """
+    return CompiledPolicy(expression, tree if tree is not None else parse(expression))
+
+
+def make_getter(parts: Sequence[Union[str, int]]) -> Getter:
+    """Build a fast accessor for a dotted path, returning None when it is missing."""
+    if len(parts) == 1:
+        (a,) = parts
+
+        def get1(ctx: Context) -> Any:
+            try:
+                return ctx[a]
+            except (KeyError, IndexError, TypeError):
+                return None
+        return get1
+
+    if len(parts) == 2:
+        a, b = parts
+
+        def get2(ctx: Context) -> Any:
+            try:
+                return ctx[a][b]
+            except (KeyError, IndexError, TypeError):
+                return None
+        return get2
+
+    if len(parts) == 3:
+        a, b, c = parts
+
+        def get3(ctx: Context) -> Any:
+            try:
+                return ctx[a][b][c]
+            except (KeyError, IndexError, TypeError):
+                return None
+        return get3
+
+    keys = tuple(parts)
+
+    def get_n(ctx: Context) -> Any:
+        obj: Any = ctx
+        try:
+            for key in keys:
+                obj = obj[key]
+        except (KeyError, IndexError, TypeError):
+            return None
+        return obj
+    return get_n
+
+
+def values_equal(a: Any, b: Any) -> bool:
+    """Equality that keeps booleans distinct from numbers."""
+    return a == b and (type(a) is bool) == (type(b) is bool)
+
+
+def _ordered(a: Any, b: Any) -> bool:
+    if type(a) in _NUMBER_TYPES and type(b) in _NUMBER_TYPES:
+        return True
+    return type(a) is str and type(b) is str
+
+
+def _contains(container: Any, item: Any) -> bool:
+    if isinstance(container, str):
+        return isinstance(item, str) and item in container
+    if isinstance(container, (list, tuple)):
+        return any(values_equal(element, item) for element in container)
+    return False
+
+
+def _search(value: Any, pattern: Any) -> bool:
+    if not isinstance(value, str) or not isinstance(pattern, str):
+        return False
+    try:
+        return re.search(pattern, value) is not None
+    except re.error:
+        return False
+
+
+BINARY_OPS: Dict[str, Callable[[Any, Any], bool]] = {
+    "==": values_equal,
+    "!=": lambda a, b: not values_equal(a, b),
+    ">": lambda a, b: _ordered(a, b) and a > b,
+    "<": lambda a, b: _ordered(a, b) and a < b,
+    ">=": lambda a, b: _ordered(a, b) and a >= b,
+    "<=": lambda a, b: _ordered(a, b) and a <= b,
+    "~": _search,
+    "!~": lambda a, b: isinstance(a, str) and not _search(a, b),
+    "contains": _contains,
+    "starts_with": lambda a, b: isinstance(a, str) and isinstance(b, str) and a.startswith(b),
+    "ends_with": lambda a, b: isinstance(a, str) and isinstance(b, str) and a.endswith(b),
+    "in": lambda a, b: _contains(b, a),
+    "not in": lambda a, b: not _contains(b, a),
+}
+
+
+def _compile_value(node: Node) -> Getter:
+    if isinstance(node, Path):
+        return make_getter(node.parts)
+    constant = literal_value(node)
+    return lambda ctx: constant
+
+
+def literal_value(node: Node) -> Any:
+    """Return the Python value of a Literal or Array node."""
+    if isinstance(node, Literal):
+        return node.value
+    if isinstance(node, Array):
+        return tuple(item.value for item in node.items)
+    raise TypeError(f"{type(node).__name__} is not a literal")
+
+
+def _compile_predicate(node: Node) -> Predicate:
+    if isinstance(node, Logical):
+        parts = [_compile_predicate(operand) for operand in node.operands]
+        return _compile_logical(node.op, parts)
+
+    if isinstance(node, Not):
+        inner = _compile_predicate(node.operand)
+        return lambda ctx: not inner(ctx)
+
+    if isinstance(node, Compare):
+        if isinstance(node.left, Path) and isinstance(node.right, (Literal, Array)):
+            fast = _compile_path_literal(node.op, make_getter(node.left.parts),
+                                         literal_value(node.right))
+            if fast is not None:
+                return fast
+        left = _compile_value(node.left)
+        right = _compile_value(node.right)
+        op = BINARY_OPS[node.op]
+        return lambda ctx: op(left(ctx), right(ctx))
+
+    value = _compile_value(node)
+    return lambda ctx: bool(value(ctx))
+
+
+def _compile_logical(op: str, parts: List[Predicate]) -> Predicate:
+    if len(parts) == 2:
+        a, b = parts
+        if op == "and":
+            return lambda ctx: a(ctx) and b(ctx)
+        return lambda ctx: a(ctx) or b(ctx)
+
+    if op == "and":
+        def all_of(ctx: Context) -> bool:
+            for part in parts:
+                if not part(ctx):
+                    return False
+            return True
+        return all_of
+
+    def any_of(ctx: Context) -> bool:
+        for part in parts:
+            if part(ctx):
+                return True
+        return False
+    return any_of
+
+
+def _compile_path_literal(op: str, get: Getter, lit: Any) -> Optional[Predicate]:
+    """Specialize the common ``accessor <op> literal`` shape, or return None."""
+    if op in ("==", "!="):
+        if lit is None or type(lit) is bool:
+            if op == "==":
+                return lambda ctx: get(ctx) is lit
+            return lambda ctx: get(ctx) is not lit
+        if type(lit) is str:
+            if op == "==":
+                return lambda ctx: get(ctx) == lit
+            return lambda ctx: get(ctx) != lit
+        if op == "==":
+            return lambda ctx: values_equal(get(ctx), lit)
+        return lambda ctx: not values_equal(get(ctx), lit)
+
+    if op in (">", "<", ">=", "<=") and type(lit) in _NUMBER_TYPES:
+        compare = BINARY_OPS[op]
+
+        def ordered(ctx: Context) -> bool:
+            value = get(ctx)
+            return type(value) in _NUMBER_TYPES and compare(value, lit)
+        return ordered
+
+    if op in ("~", "!~") and isinstance(lit, str):
+        search = re.compile(lit).search
+        if op == "~":
+            def matches(ctx: Context) -> bool:
+                value = get(ctx)
+                return isinstance(value, str) and search(value) is not None
+            return matches
+
+        def not_matches(ctx: Context) -> bool:
+            value = get(ctx)
+            return isinstance(value, str) and search(value) is None
+        return not_matches
+
+    if op in ("starts_with", "ends_with") and isinstance(lit, str):
+        method = str.startswith if op == "starts_with" else str.endswith
+
+        def affix(ctx: Context) -> bool:
+            value = get(ctx)
+            return isinstance(value, str) and method(value, lit)
+        return affix
+
+    if op in ("in", "not in") and isinstance(lit, tuple) and lit \
+            and all(type(item) is str for item in lit):
+        members = frozenset(lit)
+        if op == "in":
+            def member(ctx: Context) -> bool:
+                value = get(ctx)
+                return type(value) is str and value in members
+            return member
+
+        def non_member(ctx: Context) -> bool:
+            value = get(ctx)
+            return not (type(value) is str and value in members)
+        return non_member
+
+    return None
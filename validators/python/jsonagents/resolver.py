@@ -0,0 +1,335 @@
+"""Fetch the manifests that ``ajson://`` URIs refer to.
+
+URIs are mapped to their ``.well-known`` HTTPS URL (see
+:meth:`URIValidator.to_https`) and fetched through one pooled
+``requests.Session``, so connections and TLS sessions are reused across hops.
+Responses can be kept in an on-disk cache: entries younger than the TTL are
+served without touching the network, older ones are revalidated with
+``If-None-Match``/``If-Modified-Since``. Concurrent requests for the same URI
+share a single fetch.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import __version__
+from .jsonio import loads
+from .uri import URIValidator
+
+
+class ResolverError(Exception):
+    """A manifest could not be fetched or decoded."""
+
+    def __init__(self, uri: str, message: str) -> None:
+        super().__init__(f"{uri}: {message}")
+        self.uri = uri
+
+
+@dataclass(frozen=True)
+class ResolvedManifest:
+    """A fetched manifest and where it came from."""
+
+    uri: str
+    url: str
+    manifest: Dict[str, Any]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    from_cache: bool = False
+    revalidated: bool = False
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A cached response body with its validators."""
+
+    url: str
+    body: bytes
+    fetched_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class DiskCache:
+    """
+    Content cache with one file per URL.
+
+    Each file holds a JSON metadata line followed by the raw response body and
+    is replaced atomically, so concurrent readers never see a partial entry.
+    """
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, url: str) -> Path:
+        """Return the cache file used for a URL."""
+        return self.directory / (hashlib.sha256(url.encode("utf-8")).hexdigest() + ".cache")
+
+    def load(self, url: str) -> Optional[CacheEntry]:
+        """Return the cached entry for a URL, or None if absent or unreadable."""
+        try:
+            raw = self.path_for(url).read_bytes()
+            header, _, body = raw.partition(b"\n")
+            meta = json.loads(header)
+            if meta.get("url") != url:
+                return None
+            return CacheEntry(
+                url=url,
+                body=body,
+                fetched_at=float(meta["fetched_at"]),
+                etag=meta.get("etag"),
+                last_modified=meta.get("last_modified"),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def store(self, entry: CacheEntry) -> None:
+        """Write an entry atomically."""
+        header = json.dumps({
+            "url": entry.url,
+            "fetched_at": entry.fetched_at,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+        }).encode("utf-8")
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(header + b"\n" + entry.body)
+            os.replace(tmp, self.path_for(entry.url))
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        for path in self.directory.glob("*.cache"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+class _Flight:
+    """A fetch in progress that other callers can wait on."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[ResolvedManifest] = None
+        self.error: Optional[BaseException] = None
+
+
+class Resolver:
+    """
+    Resolve ``ajson://`` URIs to manifests.
+
+    Example:
+        >>> with Resolver(cache_dir="~/.cache/jsonagents") as resolver:
+        ...     resolved = resolver.resolve("ajson://example.com/agents/router")
+        >>> resolved.manifest["agent"]["id"]
+        'ajson://example.com/agents/router'
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        ttl: float = 300.0,
+        timeout: float = 10.0,
+        pool_size: int = 10,
+        scheme: str = "https",
+        session: Optional[requests.Session] = None,
+        uri_validator: Optional[URIValidator] = None,
+    ) -> None:
+        """
+        Initialize the resolver.
+
+        Args:
+            cache_dir: Directory for the response cache. If None, nothing is
+                       cached between calls.
+            ttl: Seconds a cached entry is used without revalidation
+            timeout: Per-request timeout in seconds
+            pool_size: Connections kept open per host
+            scheme: URL scheme to fetch with; "http" is meant for local
+                    stand-in servers in tests
+            session: Session to use instead of a new pooled one
+            uri_validator: Validator used to map URIs to URLs
+        """
+        self.ttl = ttl
+        self.timeout = timeout
+        self.scheme = scheme
+        self.cache = DiskCache(Path(cache_dir).expanduser()) if cache_dir is not None else None
+        self.uri_validator = uri_validator or URIValidator()
+        self._owns_session = session is None
+        self.session = session or _pooled_session(pool_size)
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, _Flight] = {}
+
+    def url_for(self, uri: str) -> str:
+        """
+        Return the URL a URI is fetched from.
+
+        Raises:
+            ValueError: If the URI is not a valid ajson:// URI
+        """
+        url = self.uri_validator.to_https(uri)
+        if self.scheme != "https":
+            url = f"{self.scheme}://{url[len('https://'):]}"
+        return url.split("#", 1)[0]
+
+    def resolve(self, uri: str, refresh: bool = False) -> ResolvedManifest:
+        """
+        Fetch the manifest a URI refers to.
+
+        Args:
+            uri: ajson:// URI
+            refresh: Revalidate a cached entry even if it is within the TTL
+
+        Returns:
+            ResolvedManifest with the decoded manifest
+
+        Raises:
+            ValueError: If the URI is not a valid ajson:// URI
+            ResolverError: If the manifest cannot be fetched or decoded
+        """
+        url = self.url_for(uri)
+        with self._lock:
+            flight = self._inflight.get(url)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[url] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            assert flight.result is not None
+            return _for_uri(flight.result, uri)
+
+        try:
+            flight.result = self._fetch(uri, url, refresh)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[url]
+            flight.done.set()
+
+    def close(self) -> None:
+        """Close the session if the resolver created it."""
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> "Resolver":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _fetch(self, uri: str, url: str, refresh: bool) -> ResolvedManifest:
+        entry = self.cache.load(url) if self.cache is not None else None
+        if entry is not None and not refresh and time.time() - entry.fetched_at < self.ttl:
+            return _decode(uri, entry, from_cache=True, revalidated=False)
+
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise ResolverError(uri, f"Request to {url} failed: {e}") from e
+
+        if response.status_code == 304 and entry is not None:
+            entry = CacheEntry(
+                url=url,
+                body=entry.body,
+                fetched_at=time.time(),
+                etag=response.headers.get("ETag", entry.etag),
+                last_modified=response.headers.get("Last-Modified", entry.last_modified),
+            )
+            self._store(entry)
+            return _decode(uri, entry, from_cache=True, revalidated=True)
+
+        if response.status_code != 200:
+            raise ResolverError(uri, f"GET {url} returned HTTP {response.status_code}")
+
+        entry = CacheEntry(
+            url=url,
+            body=response.content,
+            fetched_at=time.time(),
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        resolved = _decode(uri, entry, from_cache=False, revalidated=False)
+        self._store(entry)
+        return resolved
+
+    def _store(self, entry: CacheEntry) -> None:
+        if self.cache is not None:
+            try:
+                self.cache.store(entry)
+            except OSError:
+                # A read-only or full cache directory must not fail resolution
+                pass
+
+
+def _pooled_session(pool_size: int) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "Accept": "application/json",
+        "User-Agent": f"jsonagents/{__version__}",
+    })
+    return session
+
+
+def _decode(uri: str, entry: CacheEntry, from_cache: bool, revalidated: bool) -> ResolvedManifest:
+    try:
+        manifest = loads(entry.body)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ResolverError(uri, f"Invalid JSON from {entry.url}: {e}") from e
+    if not isinstance(manifest, dict):
+        raise ResolverError(uri, f"Manifest at {entry.url} is not a JSON object")
+    return ResolvedManifest(
+        uri=uri,
+        url=entry.url,
+        manifest=manifest,
+        etag=entry.etag,
+        last_modified=entry.last_modified,
+        from_cache=from_cache,
+        revalidated=revalidated,
+    )
+
+
+def _for_uri(result: ResolvedManifest, uri: str) -> ResolvedManifest:
+    """Re-label a shared result for a caller that asked with a different URI spelling."""
+    if result.uri == uri:
+        return result
+    return ResolvedManifest(
+        uri=uri,
+        url=result.url,
+        manifest=result.manifest,
+        etag=result.etag,
+        last_modified=result.last_modified,
+        from_cache=result.from_cache,
+        revalidated=result.revalidated,
+    )
@@ -0,0 +1,159 @@
+"""Persistent cache of validation results keyed by content hash.
+
+An entry's key covers everything that can change a result: the raw manifest
+bytes, the schema content, the ``strict`` flag and the validator version. A
+hit therefore needs no parsing or schema validation at all. Entries are small
+JSON files written atomically; when the directory grows past its byte budget
+the least recently used entries (by mtime, refreshed on every hit) are removed.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from . import __version__
+
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Fraction of the budget kept after an eviction pass, so passes are infrequent
+_EVICT_TO = 0.9
+
+
+class ResultCache:
+    """
+    Size-bounded on-disk store of validation outcomes.
+
+    Values are the ``is_valid``/``errors``/``warnings`` of a result; the
+    parsed manifest is not stored.
+    """
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """
+        Open (and create) a cache directory.
+
+        Args:
+            directory: Directory holding the entries
+            max_bytes: Total size of entries kept before the least recently
+                       used ones are evicted
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+
+    @staticmethod
+    def key(manifest: bytes, schema_hash: str, strict: bool) -> str:
+        """
+        Return the cache key for raw manifest bytes under a schema and mode.
+
+        ``schema_hash`` should be :attr:`CompiledSchema.content_hash
+        <jsonagents.schema.CompiledSchema>`, which also covers the companion
+        schemas the schema references.
+        """
+        digest = hashlib.sha256()
+        for part in (__version__.encode(), schema_hash.encode(), b"strict" if strict else b"lax"):
+            digest.update(part)
+            digest.update(b"\0")
+        digest.update(manifest)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored outcome for a key, or None on a miss."""
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_bytes())
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or not isinstance(data.get("is_valid"), bool):
+            return None
+        return data
+
+    def put(self, key: str, is_valid: bool, errors: Any, warnings: Any) -> None:
+        """Store an outcome atomically, evicting old entries if over budget."""
+        body = json.dumps(
+            {"is_valid": is_valid, "errors": list(errors), "warnings": list(warnings)},
+            separators=(",", ":"),
+        ).encode("utf-8")
+        path = self._path(key)
+        try:
+            # Rewriting an entry replaces its bytes rather than adding to them
+            replaced = path.stat().st_size
+        except OSError:
+            replaced = 0
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(body)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = self.size()
+            else:
+                self._size += len(body) - replaced
+            if self._size > self.max_bytes:
+                self._size = self._evict(int(self.max_bytes * _EVICT_TO))
+
+    def size(self) -> int:
+        """Return the total size of the stored entries in bytes."""
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                try:
+                    total += entry.stat().st_size
+                except OSError:
+                    pass
+        return total
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            for path in self.directory.glob("*.json"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            self._size = 0
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.directory.glob("*.json"))
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _evict(self, target: int) -> int:
+        """Delete least recently used entries until the total is at most ``target``."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+        return total
@@ -0,0 +1,331 @@
+"""Process-wide cache of compiled JSON Agents schema validators.
+
+Besides the jsonschema validator, each schema gets a generated validity check
+(:mod:`jsonagents.schema_compiler`) that decides valid manifests without
+interpreting the schema; jsonschema only runs to report the errors of invalid
+ones.
+
+``$ref`` is resolved through a prebuilt ``referencing.Registry`` holding the
+schema and every local companion schema it references, transitively; nothing
+is loaded from disk or the network while validating. Companions are tracked
+like the schema itself: editing one rebuilds the compiled schema.
+"""
+
+import dataclasses
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import unquote, urldefrag, urljoin, urlsplit
+
+from jsonschema import Draft202012Validator
+from jsonschema.exceptions import ValidationError
+from referencing import Registry, Resource
+from referencing.exceptions import NoSuchResource
+from referencing.jsonschema import DRAFT202012
+
+from .schema_compiler import Check, SchemaCompileError, default_cache_dir, load_check
+
+
+BUNDLED_SCHEMA_PATH = Path(__file__).parent / "schemas" / "json-agents.json"
+
+
+@dataclass(frozen=True)
+class SchemaFile:
+    """
+    State of a companion schema file when a schema was compiled.
+
+    A file that could not be read has an ``mtime_ns`` of -1 and an empty hash.
+    """
+
+    path: Path
+    mtime_ns: int
+    content_hash: str
+
+
+@dataclass(frozen=True)
+class CompiledSchema:
+    """
+    A loaded schema together with its ready-to-use JSON Schema validator.
+
+    ``content_hash`` covers the schema file and every companion it references,
+    so it changes whenever any file the validator was built from changes.
+    """
+
+    path: Path
+    mtime_ns: int
+    content_hash: str
+    schema: Dict[str, Any]
+    validator: Draft202012Validator
+    check: Optional[Check] = None
+    companions: Tuple[SchemaFile, ...] = ()
+
+    def iter_errors(self, instance: Any) -> Iterator[ValidationError]:
+        """
+        Yield the schema errors of an instance, like ``validator.iter_errors()``.
+
+        Instances the generated check accepts yield nothing without running
+        jsonschema.
+        """
+        if self.check is not None:
+            try:
+                if self.check(instance):
+                    return iter(())
+            except Exception:
+                # Let jsonschema report whatever the check tripped over
+                pass
+        return self.validator.iter_errors(instance)
+
+
+class SchemaCache:
+    """
+    Thread-safe cache of compiled schema validators.
+
+    Entries are keyed by resolved schema path and are reused as long as the
+    mtimes of the file and of its companion schemas are unchanged. When one
+    changes they are re-read and hashed; if the content hash still matches,
+    the compiled validator is kept, otherwise it is rebuilt.
+    """
+
+    def __init__(self, codegen_dir: Union[str, Path, None, bool] = True) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            codegen_dir: Directory caching generated checks across processes.
+                         True uses :func:`~jsonagents.schema_compiler.default_cache_dir`,
+                         None generates them in memory only, and False disables
+                         generated checks.
+        """
+        self.codegen_dir = codegen_dir
+        self._lock = threading.Lock()
+        self._entries: Dict[Path, CompiledSchema] = {}
+
+    def get(self, schema_path: Optional[Union[str, Path]] = None) -> CompiledSchema:
+        """
+        Return the compiled schema for a path, building it on first use.
+
+        Args:
+            schema_path: Path to a json-agents.json schema file.
+                        If None, uses the bundled schema.
+
+        Raises:
+            FileNotFoundError: If the schema file does not exist
+        """
+        path = Path(schema_path) if schema_path else BUNDLED_SCHEMA_PATH
+        try:
+            path = path.resolve()
+            mtime_ns = path.stat().st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError(f"Schema file not found: {path}")
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if (
+                entry is not None
+                and entry.mtime_ns == mtime_ns
+                and all(_mtime_ns(c.path) == c.mtime_ns for c in entry.companions)
+            ):
+                return entry
+
+            raw = path.read_bytes()
+            file_hash = hashlib.sha256(raw).hexdigest()
+            if entry is not None:
+                companions = tuple(_read(c.path)[0] for c in entry.companions)
+                if _combined_hash(file_hash, companions) == entry.content_hash:
+                    entry = dataclasses.replace(
+                        entry, mtime_ns=mtime_ns, companions=companions
+                    )
+                    self._entries[path] = entry
+                    return entry
+
+            schema = json.loads(raw)
+            validator, companions = _build_validator(schema, path)
+            content_hash = _combined_hash(file_hash, companions)
+            entry = CompiledSchema(
+                path=path,
+                mtime_ns=mtime_ns,
+                content_hash=content_hash,
+                schema=schema,
+                validator=validator,
+                check=self._load_check(schema, content_hash),
+                companions=companions,
+            )
+            self._entries[path] = entry
+            return entry
+
+    def _load_check(self, schema: Dict[str, Any], content_hash: str) -> Optional[Check]:
+        """The generated check of a schema, or None if it cannot be generated."""
+        if self.codegen_dir is False:
+            return None
+        cache_dir = default_cache_dir() if self.codegen_dir is True else self.codegen_dir
+        try:
+            return load_check(schema, content_hash, cache_dir)
+        except SchemaCompileError:
+            # Keywords or references the generator does not handle
+            return None
+
+    def invalidate(self, schema_path: Optional[Union[str, Path]] = None) -> None:
+        """
+        Drop cached entries.
+
+        Args:
+            schema_path: Path of the schema to drop. If None, clears everything.
+        """
+        with self._lock:
+            if schema_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(Path(schema_path).resolve(), None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def keys(self) -> Tuple[Path, ...]:
+        """Return the schema paths currently cached."""
+        with self._lock:
+            return tuple(self._entries)
+
+
+def _build_validator(
+    schema: Dict[str, Any], path: Path
+) -> Tuple[Draft202012Validator, Tuple[SchemaFile, ...]]:
+    """
+    Build a Draft 2020-12 validator whose references resolve from a preloaded registry.
+
+    Returns:
+        The validator and the companion schema files it was built from
+    """
+    if isinstance(schema, dict) and "$id" not in schema:
+        # Resolve relative references against the schema file, as before
+        schema = {"$id": path.as_uri(), **schema}
+    registry, companions = _build_registry(schema, path)
+    return Draft202012Validator(schema, registry=registry), companions
+
+
+def _build_registry(
+    schema: Dict[str, Any], path: Path
+) -> Tuple[Registry, Tuple[SchemaFile, ...]]:
+    """
+    Preload the schema and the local schemas it references into a registry.
+
+    Relative references are followed from the schema file's directory, and
+    each companion is registered under every URI a reference to it may
+    resolve to: its file URI, its path relative to that directory, the same
+    path under the root ``$id`` and its own ``$id``. The registry is crawled
+    up front, so ``$defs`` and anchors are indexed once. Anything else
+    (remote URLs, missing files) is unresolvable rather than fetched.
+
+    Returns:
+        The registry and the state of every companion file referenced,
+        including missing ones, so that creating them is noticed too
+    """
+    root_dir = path.parent
+    root_id = schema.get("$id") if isinstance(schema, dict) else None
+    resources: List[Tuple[str, Resource]] = []
+    companions: List[SchemaFile] = []
+    loaded = {path.resolve()}
+    pending: List[Tuple[Path, Any]] = [(path, schema)]
+    while pending:
+        file, contents = pending.pop()
+        resource = Resource.from_contents(contents, default_specification=DRAFT202012)
+        uris = {file.as_uri()}
+        try:
+            relative = file.relative_to(root_dir).as_posix()
+        except ValueError:
+            relative = None
+        if relative is not None:
+            uris.add(relative)
+            if root_id:
+                uris.add(urljoin(root_id, relative))
+        if resource.id():
+            uris.add(resource.id())
+        resources.extend((uri, resource) for uri in uris)
+
+        for reference in _references(contents):
+            target = _local_file(urljoin(file.as_uri(), reference))
+            if target is None or target.resolve() in loaded:
+                continue
+            loaded.add(target.resolve())
+            state, raw = _read(target)
+            companions.append(state)
+            if raw is None:
+                continue
+            try:
+                pending.append((target, json.loads(raw)))
+            except ValueError:
+                # Reported as unresolvable if a validation ever follows it
+                continue
+    registry = Registry(retrieve=_no_retrieval).with_resources(resources).crawl()
+    return registry, tuple(companions)
+
+
+def _read(path: Path) -> Tuple[SchemaFile, Optional[bytes]]:
+    """Read a companion schema file, returning its state and bytes (None if unreadable)."""
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+        raw = path.read_bytes()
+    except OSError:
+        return SchemaFile(path, -1, ""), None
+    return SchemaFile(path, mtime_ns, hashlib.sha256(raw).hexdigest()), raw
+
+
+def _mtime_ns(path: Path) -> int:
+    """A file's mtime, or -1 if it cannot be read."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _combined_hash(file_hash: str, companions: Tuple[SchemaFile, ...]) -> str:
+    """Hash of a schema file together with its companions (the file hash if it has none)."""
+    if not companions:
+        return file_hash
+    digest = hashlib.sha256(file_hash.encode())
+    for companion in sorted(companions, key=lambda c: str(c.path)):
+        digest.update(f"\0{companion.path}\0{companion.content_hash}".encode())
+    return digest.hexdigest()
+
+
+def _references(contents: Any) -> Iterator[str]:
+    """Yield the non-fragment ``$ref`` values anywhere in a schema document."""
+    if isinstance(contents, dict):
+        reference = contents.get("$ref")
+        if isinstance(reference, str) and not reference.startswith("#"):
+            yield reference
+        for value in contents.values():
+            yield from _references(value)
+    elif isinstance(contents, list):
+        for value in contents:
+            yield from _references(value)
+
+
+def _local_file(uri: str) -> Optional[Path]:
+    """The path a ``file:`` URI points to (fragment dropped), else None."""
+    url, _ = urldefrag(uri)
+    parts = urlsplit(url)
+    if parts.scheme != "file" or parts.netloc not in ("", "localhost"):
+        return None
+    return Path(unquote(parts.path))
+
+
+def _no_retrieval(uri: str) -> Resource:
+    """Registry retrieval hook: every schema has been preloaded."""
+    raise NoSuchResource(ref=uri)
+
+
+_default_cache = SchemaCache()
+
+
+def get_compiled_schema(schema_path: Optional[Union[str, Path]] = None) -> CompiledSchema:
+    """Return the compiled schema for a path from the process-wide cache."""
+    return _default_cache.get(schema_path)
+
+
+def invalidate_schema_cache(schema_path: Optional[Union[str, Path]] = None) -> None:
+    """Invalidate one or all entries in the process-wide schema cache."""
+    _default_cache.invalidate(schema_path)
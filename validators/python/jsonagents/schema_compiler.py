@@ -0,0 +1,568 @@
+"""Code generation of specialized validity checks for JSON Schemas.
+
+:func:`generate_source` turns a Draft 2020-12 schema into the source of a
+Python module whose ``check(instance)`` function returns True only if the
+instance is valid. It is a plain function of nested ``type(x) is ...`` tests,
+set lookups and loops, with no keyword dispatch at validation time, and runs
+several times faster than interpreting the schema.
+
+The check follows the type, equality and regex semantics of ``jsonschema``
+(``isinstance`` type tests, ``re.search``, booleans unequal to numbers), so
+it accepts exactly the instances ``Draft202012Validator`` accepts. It only
+answers valid or invalid: callers ask jsonschema for the error messages of
+the instances it rejects.
+
+Schemas using keywords the generator does not know (remote ``$ref``,
+``$dynamicRef``, ``unevaluatedProperties``, ``multipleOf``, ...) raise
+:class:`SchemaCompileError`; they are validated by jsonschema alone.
+``format`` is an annotation, as in a validator built without a format
+checker.
+
+Generated modules are cached on disk, keyed by the schema's content hash
+and :data:`GENERATOR_VERSION`, so later processes import them (and their
+bytecode) instead of generating them again.
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+from urllib.parse import unquote
+
+
+# Bump whenever generated code changes, to ignore modules cached on disk
+GENERATOR_VERSION = "1"
+
+Check = Callable[[Any], bool]
+
+# Keywords that never affect validity
+_ANNOTATIONS = frozenset({
+    "$schema", "$id", "$comment", "$defs", "definitions", "title", "description",
+    "default", "examples", "deprecated", "readOnly", "writeOnly", "format",
+    "contentMediaType", "contentEncoding", "contentSchema",
+})
+
+_KEYWORDS = _ANNOTATIONS | frozenset({
+    "type", "const", "enum", "$ref", "allOf", "anyOf", "oneOf", "not",
+    "if", "then", "else",
+    "required", "properties", "patternProperties", "additionalProperties",
+    "minProperties", "maxProperties",
+    "items", "minItems", "maxItems", "uniqueItems", "contains",
+    "minLength", "maxLength", "pattern",
+    "minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum",
+})
+
+_OBJECT_KEYWORDS = ("required", "properties", "patternProperties", "additionalProperties",
+                    "minProperties", "maxProperties")
+_ARRAY_KEYWORDS = ("items", "minItems", "maxItems", "uniqueItems", "contains")
+_STRING_KEYWORDS = ("minLength", "maxLength", "pattern")
+_NUMBER_KEYWORDS = ("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum")
+
+# The Draft 2020-12 type checker of jsonschema: bools are not numbers, and
+# integral floats are integers
+_TYPE_TESTS = {
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "string": "isinstance({v}, str)",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+    "number": "(type({v}) in _NUMBERS or isinstance({v}, Number) and not isinstance({v}, bool))",
+    "integer": "(isinstance({v}, int) and not isinstance({v}, bool)"
+               " or isinstance({v}, float) and {v}.is_integer())",
+}
+
+# Equality and uniqueness as jsonschema defines them (jsonschema._utils):
+# True and 1 differ, and sequences and mappings compare item by item
+_PRELUDE = '''\
+import json
+import re
+from collections.abc import Mapping, Sequence
+from numbers import Number
+
+_NUMBERS = frozenset({int, float})
+
+
+def _unbool(value, true=object(), false=object()):
+    if value is True:
+        return true
+    if value is False:
+        return false
+    return value
+
+
+def _equal(one, two):
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, Sequence) and isinstance(two, Sequence):
+        return len(one) == len(two) and all(_equal(i, j) for i, j in zip(one, two))
+    if isinstance(one, Mapping) and isinstance(two, Mapping):
+        return len(one) == len(two) and all(
+            key in two and _equal(value, two[key]) for key, value in one.items()
+        )
+    return _unbool(one) == _unbool(two)
+
+
+def _unique(items):
+    if all(type(item) is str for item in items):
+        return len(set(items)) == len(items)
+    try:
+        ordered = sorted(_unbool(item) for item in items)
+        return not any(_equal(i, j) for i, j in zip(ordered, ordered[1:]))
+    except (NotImplementedError, TypeError):
+        seen = []
+        for item in items:
+            item = _unbool(item)
+            if any(_equal(other, item) for other in seen):
+                return False
+            seen.append(item)
+        return True
+'''
+
+
+class SchemaCompileError(ValueError):
+    """The schema uses a keyword or reference the generator does not support."""
+
+
+def generate_source(schema: Union[Dict[str, Any], bool]) -> str:
+    """
+    Generate the source of a module defining ``check(instance) -> bool``.
+
+    Args:
+        schema: Draft 2020-12 schema; ``$ref`` must point into the schema itself
+
+    Raises:
+        SchemaCompileError: If the schema cannot be compiled
+    """
+    return _Generator(schema).module()
+
+
+def load_check(
+    schema: Union[Dict[str, Any], bool],
+    content_hash: Optional[str] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
+) -> Check:
+    """
+    Return the compiled check of a schema, from the disk cache if possible.
+
+    Args:
+        schema: Schema to compile
+        content_hash: Hash identifying the schema's content. If None, the
+                      canonical JSON of ``schema`` is hashed.
+        cache_dir: Directory of generated modules. If None, nothing is
+                   cached on disk.
+
+    Raises:
+        SchemaCompileError: If the schema cannot be compiled
+    """
+    if content_hash is None:
+        canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+        content_hash = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    name = f"schema_{content_hash[:32]}_v{GENERATOR_VERSION}"
+
+    if cache_dir is not None:
+        path = Path(cache_dir).expanduser() / f"{name}.py"
+        if path.is_file():
+            try:
+                return _import(name, path)
+            except Exception:
+                # Corrupt or truncated entry: regenerate it below
+                pass
+        source = generate_source(schema)
+        try:
+            _write_atomic(path, source)
+            return _import(name, path)
+        except OSError:
+            pass
+    else:
+        source = generate_source(schema)
+
+    namespace: Dict[str, Any] = {"__name__": f"jsonagents._compiled.{name}"}
+    exec(compile(source, f"<{name}>", "exec"), namespace)
+    return namespace["check"]
+
+
+def default_cache_dir() -> Path:
+    """Directory for generated modules: ``$JSONAGENTS_SCHEMA_CACHE_DIR`` or the user cache."""
+    configured = os.environ.get("JSONAGENTS_SCHEMA_CACHE_DIR")
+    if configured:
+        return Path(configured).expanduser()
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join("~", ".cache")
+    return Path(base).expanduser() / "jsonagents" / "schemas"
+
+
+def _import(name: str, path: Path) -> Check:
+    """Import a generated module; the import system caches its bytecode."""
+    spec = importlib.util.spec_from_file_location(f"jsonagents._compiled.{name}", path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot import {path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.check
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".py")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class _Generator:
+    """Emits one function per subschema that is not a simple inline test."""
+
+    def __init__(self, root: Union[Dict[str, Any], bool]) -> None:
+        self.root = root
+        self.blocks: List[str] = []
+        self.constants: List[str] = []
+        self.refs: Dict[str, str] = {}
+        self.regexes: Dict[str, str] = {}
+        self.counter = 0
+
+    def module(self) -> str:
+        entry = self.function(self.root)
+        header = [
+            '"""Generated by jsonagents.schema_compiler; do not edit."""',
+            _PRELUDE,
+            *self.constants,
+        ]
+        return "\n".join(header + self.blocks + ["", f"check = {entry}", ""])
+
+    # Functions
+
+    def function(self, schema: Union[Dict[str, Any], bool]) -> str:
+        """Name of a new function checking ``schema``."""
+        name = self._name("_f")
+        self._emit_function(name, schema)
+        return name
+
+    def ref(self, reference: str) -> str:
+        """Name of the function checking a ``$ref`` target, generated once."""
+        name = self.refs.get(reference)
+        if name is None:
+            name = self.refs[reference] = self._name("_r")
+            self._emit_function(name, self._resolve(reference))
+        return name
+
+    def _emit_function(self, name: str, schema: Union[Dict[str, Any], bool]) -> None:
+        lines: List[str] = []
+        self.body(schema, "v", lines, 1)
+        lines.append("    return True")
+        self.blocks.append("\n\ndef " + name + "(v):\n" + "\n".join(lines))
+
+    def test(self, schema: Union[Dict[str, Any], bool], var: str) -> str:
+        """A boolean expression checking ``var`` against ``schema``."""
+        if isinstance(schema, dict) and set(schema) - _ANNOTATIONS == {"$ref"}:
+            return f"{self.ref(schema['$ref'])}({var})"
+        expression = self._inline(schema, var)
+        if expression is None:
+            return f"{self.function(schema)}({var})"
+        return expression
+
+    # Schema bodies
+
+    def body(self, schema: Union[Dict[str, Any], bool], v: str, out: List[str], depth: int) -> None:
+        """Append statements that return False when ``v`` does not match ``schema``."""
+        pad = "    " * depth
+        if schema is True:
+            return
+        if schema is False:
+            out.append(f"{pad}return False")
+            return
+        if not isinstance(schema, dict):
+            raise SchemaCompileError(f"Schema must be an object or boolean, not {schema!r}")
+        unknown = set(schema) - _KEYWORDS
+        if unknown:
+            raise SchemaCompileError(f"Unsupported keywords: {', '.join(sorted(unknown))}")
+        if "$id" in schema and schema is not self.root:
+            raise SchemaCompileError("Nested $id changes the base URI")
+
+        types = schema.get("type")
+        if isinstance(types, str):
+            types = [types]
+        if types is not None:
+            if not types or any(t not in _TYPE_TESTS for t in types):
+                raise SchemaCompileError(f"Unsupported type {schema['type']!r}")
+            tests = " or ".join(_TYPE_TESTS[t].format(v=v) for t in types)
+            out.append(f"{pad}if not ({tests}):")
+            out.append(f"{pad}    return False")
+        # A single declared type makes the per-type guards below redundant
+        known = types[0] if types is not None and len(types) == 1 else None
+
+        if "const" in schema:
+            out.append(f"{pad}if not ({self._equals(v, schema['const'])}):")
+            out.append(f"{pad}    return False")
+        if "enum" in schema:
+            out.append(f"{pad}if not ({self._enum(v, schema['enum'], known == 'string')}):")
+            out.append(f"{pad}    return False")
+        if "$ref" in schema:
+            out.append(f"{pad}if not {self.ref(schema['$ref'])}({v}):")
+            out.append(f"{pad}    return False")
+
+        self._guarded(schema, v, out, depth, known, "object", _OBJECT_KEYWORDS, self._object)
+        self._guarded(schema, v, out, depth, known, "array", _ARRAY_KEYWORDS, self._array)
+        self._guarded(schema, v, out, depth, known, "string", _STRING_KEYWORDS, self._string)
+        self._guarded(schema, v, out, depth, known, "number", _NUMBER_KEYWORDS, self._number)
+
+        for sub in schema.get("allOf", ()):
+            out.append(f"{pad}if not {self.test(sub, v)}:")
+            out.append(f"{pad}    return False")
+        if "anyOf" in schema:
+            tests = " or ".join(self.test(sub, v) for sub in schema["anyOf"])
+            out.append(f"{pad}if not ({tests}):")
+            out.append(f"{pad}    return False")
+        if "oneOf" in schema:
+            tests = ", ".join(self.test(sub, v) for sub in schema["oneOf"])
+            out.append(f"{pad}if [{tests}].count(True) != 1:")
+            out.append(f"{pad}    return False")
+        if "not" in schema:
+            out.append(f"{pad}if {self.test(schema['not'], v)}:")
+            out.append(f"{pad}    return False")
+        if "if" in schema and ("then" in schema or "else" in schema):
+            condition = self.test(schema["if"], v)
+            if "then" in schema:
+                out.append(f"{pad}if {condition}:")
+                self._branch(schema["then"], v, out, depth + 1)
+                if "else" in schema:
+                    out.append(f"{pad}else:")
+                    self._branch(schema["else"], v, out, depth + 1)
+            else:
+                out.append(f"{pad}if not {condition}:")
+                self._branch(schema["else"], v, out, depth + 1)
+
+    def _branch(self, schema: Union[Dict[str, Any], bool], v: str, out: List[str],
+                depth: int) -> None:
+        before = len(out)
+        self.body(schema, v, out, depth)
+        if len(out) == before:
+            out.append("    " * depth + "pass")
+
+    def _guarded(self, schema: Dict[str, Any], v: str, out: List[str], depth: int,
+                 known: Optional[str], kind: str, keywords: tuple,
+                 emit: Callable[[Dict[str, Any], str, List[str], int], None]) -> None:
+        """Emit a type's keywords, only applied when ``v`` has that type."""
+        if not any(k in schema for k in keywords):
+            return
+        if known == kind or (kind == "number" and known == "integer"):
+            emit(schema, v, out, depth)
+            return
+        out.append("    " * depth + f"if {_TYPE_TESTS[kind].format(v=v)}:")
+        emit(schema, v, out, depth + 1)
+
+    def _object(self, schema: Dict[str, Any], v: str, out: List[str], depth: int) -> None:
+        pad = "    " * depth
+        if schema.get("required"):
+            required = self._constant(_set_literal(schema["required"]))
+            out.append(f"{pad}if not {v}.keys() >= {required}:")
+            out.append(f"{pad}    return False")
+        if "minProperties" in schema:
+            out.append(f"{pad}if len({v}) < {int(schema['minProperties'])}:")
+            out.append(f"{pad}    return False")
+        if "maxProperties" in schema:
+            out.append(f"{pad}if len({v}) > {int(schema['maxProperties'])}:")
+            out.append(f"{pad}    return False")
+
+        properties: Dict[str, Any] = schema.get("properties", {})
+        patterns: Dict[str, Any] = schema.get("patternProperties", {})
+        additional = schema.get("additionalProperties", True)
+        if additional is True and not patterns:
+            # Only declared properties matter: look them up
+            for name, sub in properties.items():
+                if sub is True:
+                    continue
+                x = self._name("x")
+                out.append(f"{pad}if {name!r} in {v}:")
+                out.append(f"{pad}    {x} = {v}[{name!r}]")
+                out.append(f"{pad}    if not {self.test(sub, x)}:")
+                out.append(f"{pad}        return False")
+            return
+
+        # Otherwise every key has to be looked at
+        key, x = self._name("k"), self._name("x")
+        out.append(f"{pad}for {key}, {x} in {v}.items():")
+        inner = pad + "    "
+        # Patterns apply to declared properties too
+        for pattern, sub in patterns.items():
+            test = self.test(sub, x)
+            out.append(f"{inner}if {self._regex(pattern)}.search({key}) and not {test}:")
+            out.append(f"{inner}    return False")
+        branch = "if"
+        for name, sub in properties.items():
+            out.append(f"{inner}{branch} {key} == {name!r}:")
+            out.append(f"{inner}    if not {self.test(sub, x)}:")
+            out.append(f"{inner}        return False")
+            branch = "elif"
+        if additional is not True:
+            if properties:
+                out.append(f"{inner}else:")
+                inner += "    "
+            tests = [] if additional is False else [f"not {self.test(additional, x)}"]
+            if patterns:
+                # Like jsonschema, match the alternation of all patterns
+                tests.insert(0, f"not {self._regex('|'.join(patterns))}.search({key})")
+            if tests:
+                out.append(f"{inner}if {' and '.join(tests)}:")
+                out.append(f"{inner}    return False")
+            else:
+                out.append(f"{inner}return False")
+        elif not properties and not patterns:
+            out.append(f"{inner}pass")
+
+    def _array(self, schema: Dict[str, Any], v: str, out: List[str], depth: int) -> None:
+        pad = "    " * depth
+        if "minItems" in schema:
+            out.append(f"{pad}if len({v}) < {int(schema['minItems'])}:")
+            out.append(f"{pad}    return False")
+        if "maxItems" in schema:
+            out.append(f"{pad}if len({v}) > {int(schema['maxItems'])}:")
+            out.append(f"{pad}    return False")
+        if schema.get("uniqueItems"):
+            out.append(f"{pad}if not _unique({v}):")
+            out.append(f"{pad}    return False")
+        if "items" in schema and schema["items"] is not True:
+            if not isinstance(schema["items"], (dict, bool)):
+                raise SchemaCompileError("Array-form 'items' is not Draft 2020-12")
+            x = self._name("x")
+            out.append(f"{pad}for {x} in {v}:")
+            out.append(f"{pad}    if not {self.test(schema['items'], x)}:")
+            out.append(f"{pad}        return False")
+        if "contains" in schema:
+            x = self._name("x")
+            out.append(f"{pad}for {x} in {v}:")
+            out.append(f"{pad}    if {self.test(schema['contains'], x)}:")
+            out.append(f"{pad}        break")
+            out.append(f"{pad}else:")
+            out.append(f"{pad}    return False")
+
+    def _string(self, schema: Dict[str, Any], v: str, out: List[str], depth: int) -> None:
+        pad = "    " * depth
+        if "minLength" in schema:
+            out.append(f"{pad}if len({v}) < {int(schema['minLength'])}:")
+            out.append(f"{pad}    return False")
+        if "maxLength" in schema:
+            out.append(f"{pad}if len({v}) > {int(schema['maxLength'])}:")
+            out.append(f"{pad}    return False")
+        if "pattern" in schema:
+            out.append(f"{pad}if not {self._regex(schema['pattern'])}.search({v}):")
+            out.append(f"{pad}    return False")
+
+    def _number(self, schema: Dict[str, Any], v: str, out: List[str], depth: int) -> None:
+        pad = "    " * depth
+        for keyword, operator in (("minimum", "<"), ("maximum", ">"),
+                                  ("exclusiveMinimum", "<="), ("exclusiveMaximum", ">=")):
+            if keyword in schema:
+                bound = schema[keyword]
+                if type(bound) not in (int, float):
+                    raise SchemaCompileError(f"{keyword} must be a number")
+                out.append(f"{pad}if {v} {operator} {bound!r}:")
+                out.append(f"{pad}    return False")
+
+    # Inline tests
+
+    def _inline(self, schema: Union[Dict[str, Any], bool], v: str) -> Optional[str]:
+        """An expression for schemas of only type/const/enum, else None."""
+        if schema is True:
+            return "True"
+        if schema is False:
+            return "False"
+        if not isinstance(schema, dict):
+            return None
+        keywords = set(schema) - _ANNOTATIONS
+        if not keywords:
+            return "True"
+        if not keywords <= {"type", "const", "enum"} or not isinstance(schema.get("type"), str):
+            return None
+        if schema["type"] not in _TYPE_TESTS:
+            raise SchemaCompileError(f"Unsupported type {schema['type']!r}")
+        tests = [_TYPE_TESTS[schema["type"]].format(v=v)]
+        if "const" in schema:
+            tests.append(self._equals(v, schema["const"]))
+        if "enum" in schema:
+            tests.append(self._enum(v, schema["enum"], schema["type"] == "string"))
+        return "(" + " and ".join(tests) + ")"
+
+    def _equals(self, v: str, value: Any) -> str:
+        """Equality as jsonschema defines it: booleans never equal numbers."""
+        if isinstance(value, str):
+            # jsonschema compares anything with a string using ==
+            return f"{v} == {value!r}"
+        return f"_equal({v}, {self._literal(value)})"
+
+    def _enum(self, v: str, values: List[Any], string: bool = False) -> str:
+        """Membership test; ``string`` when ``v`` is known to be a str."""
+        if values and all(isinstance(value, str) for value in values):
+            members = self._constant(_set_literal(values))
+            if string:
+                return f"{v} in {members}"
+            strings = self._constant(repr(tuple(values)))
+            # Set lookup for strings; anything else is compared one by one
+            return (f"({v} in {members} if isinstance({v}, str) "
+                    f"else any({v} == s for s in {strings}))")
+        if not values:
+            return "False"
+        return "(" + " or ".join(self._equals(v, value) for value in values) + ")"
+
+    def _literal(self, value: Any) -> str:
+        """A constant holding a JSON value, rebuilt from its JSON text."""
+        try:
+            text = json.dumps(value, allow_nan=False)
+        except (TypeError, ValueError):
+            raise SchemaCompileError(f"Unsupported constant {value!r}")
+        return self._constant(f"json.loads({text!r})")
+
+    # Helpers
+
+    def _resolve(self, reference: str) -> Union[Dict[str, Any], bool]:
+        """Resolve a reference to a location inside the root schema."""
+        if reference == "#":
+            return self.root
+        if not reference.startswith("#/"):
+            raise SchemaCompileError(f"Unsupported $ref {reference!r}")
+        target: Any = self.root
+        for token in reference[2:].split("/"):
+            token = unquote(token).replace("~1", "/").replace("~0", "~")
+            try:
+                target = target[int(token)] if isinstance(target, list) else target[token]
+            except (KeyError, IndexError, ValueError, TypeError):
+                raise SchemaCompileError(f"Unresolvable $ref {reference!r}")
+        return target
+
+    def _regex(self, pattern: str) -> str:
+        name = self.regexes.get(pattern)
+        if name is None:
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                raise SchemaCompileError(f"Invalid pattern {pattern!r}: {e}")
+            name = self.regexes[pattern] = self._constant(f"re.compile({pattern!r})")
+        return name
+
+    def _constant(self, expression: str) -> str:
+        name = self._name("_c")
+        self.constants.append(f"{name} = {expression}")
+        return name
+
+    def _name(self, prefix: str) -> str:
+        self.counter += 1
+        return f"{prefix}{self.counter}"
+
+
+def _set_literal(values: List[Any]) -> str:
+    """A frozenset expression whose text does not depend on hash randomization."""
+    for value in values:
+        if not isinstance(value, str):
+            raise SchemaCompileError(f"Unsupported set member {value!r}")
+    return "frozenset((" + "".join(f"{value!r}, " for value in sorted(set(values))) + "))"
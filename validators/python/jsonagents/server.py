@@ -0,0 +1,322 @@
+"""Long-running HTTP validation service.
+
+One process keeps a warm :class:`~jsonagents.validator.Validator` (schema
+compiled once, URI and policy results memoized) and serves it over HTTP/1.1
+with keep-alive, so callers pay neither interpreter startup nor schema
+compilation per manifest.
+
+Endpoints:
+    POST /validate[?strict=1]     body: manifest JSON bytes
+    POST /check-uri               body: the URI (or GET /check-uri?uri=...)
+    POST /check-policy            body: the expression (or GET ?expression=...)
+    GET  /healthz                 liveness and basic counters
+    GET  /metrics                 Prometheus text format
+
+Responses are JSON objects with ``valid``, ``errors`` and ``warnings``; an
+invalid manifest is still a ``200``. Connections are handled by a bounded
+pool of worker threads: at most ``workers`` connections are served at once,
+and further ones wait in the listen backlog.
+"""
+
+import json
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from . import __version__
+from .metrics import Metrics, Registry
+from .validator import Validator
+
+
+DEFAULT_MAX_BODY = 16 * 1024 * 1024
+
+_TRUE = {"1", "true", "yes", "on"}
+
+
+class HTTPError(Exception):
+    """A request that cannot be served, reported with an HTTP status."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class ValidationServer(HTTPServer):
+    """
+    HTTP server whose connections are served by a bounded thread pool.
+
+    Example:
+        >>> server = ValidationServer(("127.0.0.1", 8080), workers=8)
+        >>> server.serve_forever()
+    """
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        validator: Optional[Validator] = None,
+        workers: int = 8,
+        max_body: int = DEFAULT_MAX_BODY,
+        keepalive_timeout: float = 15.0,
+        metrics: Optional[Metrics] = None,
+        access_log: bool = False,
+    ) -> None:
+        """
+        Initialize the server and warm up the validator.
+
+        Args:
+            address: (host, port) to listen on; port 0 picks a free port
+            validator: Validator to serve. If None, a new one reporting into
+                       this server's metrics is created.
+            workers: Maximum number of connections served concurrently
+            max_body: Largest accepted request body in bytes
+            keepalive_timeout: Seconds an idle keep-alive connection may hold
+                               a worker
+            metrics: Metrics exposed on /metrics. If None, a new Registry.
+            access_log: If True, log one line per request to stderr
+
+        Raises:
+            ValueError: If workers is less than 1
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.metrics = metrics if metrics is not None else Registry()
+        self.validator = validator or Validator(metrics=self.metrics)
+        self.workers = workers
+        self.max_body = max_body
+        self.keepalive_timeout = keepalive_timeout
+        self.access_log = access_log
+        self.started = time.time()
+        self.requests = 0
+        self._requests_lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="jsonagents-serve")
+        self._slots = threading.BoundedSemaphore(workers)
+        self._connections: Set[socket.socket] = set()
+        self._connections_lock = threading.Lock()
+        # Compile the schema before accepting connections
+        self.validator._get_validator()
+        super().__init__(address, _Handler)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def process_request(self, request: socket.socket, client_address: Any) -> None:
+        # Blocks the accept loop while every worker is busy, leaving further
+        # connections in the kernel's listen backlog
+        self._slots.acquire()
+        try:
+            self._pool.submit(self._process, request, client_address)
+        except RuntimeError:
+            # Pool already shut down
+            self._slots.release()
+            self.shutdown_request(request)
+
+    def _process(self, request: socket.socket, client_address: Any) -> None:
+        with self._connections_lock:
+            self._connections.add(request)
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            with self._connections_lock:
+                self._connections.discard(request)
+            self.shutdown_request(request)
+            self._slots.release()
+
+    def server_close(self) -> None:
+        """Stop listening, end idle keep-alive connections and wait for the workers."""
+        super().server_close()
+        with self._connections_lock:
+            connections = list(self._connections)
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RD)
+            except OSError:
+                pass
+        self._pool.shutdown(wait=True)
+
+    def _count_request(self) -> None:
+        with self._requests_lock:
+            self.requests += 1
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = f"jsonagents/{__version__}"
+    server: ValidationServer
+
+    def setup(self) -> None:
+        super().setup()
+        self.connection.settimeout(self.server.keepalive_timeout)
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str) -> None:
+        start = time.perf_counter()
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        route = _ROUTES.get((method, url.path))
+        self.server._count_request()
+        try:
+            if route is None:
+                if any(path == url.path for _, path in _ROUTES):
+                    raise HTTPError(405, f"Method {method} not allowed on {url.path}")
+                raise HTTPError(404, f"Unknown endpoint {url.path}")
+            status, content_type, body = route(self, query)
+        except HTTPError as e:
+            status, content_type = e.status, "application/json"
+            body = _json({"error": e.message})
+            # The unread request body would be taken for the next request
+            self.close_connection = True
+        self._send(status, content_type, body)
+
+        metrics = self.server.metrics
+        if metrics.enabled:
+            labels = {"endpoint": url.path if route else "other"}
+            metrics.inc("jsonagents_http_requests_total", labels={**labels, "status": str(status)})
+            metrics.observe("jsonagents_http_request_seconds", time.perf_counter() - start, labels)
+
+    def _send(self, status: int, content_type: str, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self) -> bytes:
+        """Read the request body, by Content-Length or chunked encoding."""
+        max_body = self.server.max_body
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            size = 0
+            while True:
+                line = self.rfile.readline(65537)
+                try:
+                    length = int(line.split(b";", 1)[0].strip(), 16)
+                except ValueError:
+                    raise HTTPError(400, "Malformed chunked body")
+                if length == 0:
+                    # Skip trailers
+                    while self.rfile.readline(65537) not in (b"\r\n", b"\n", b""):
+                        pass
+                    return b"".join(chunks)
+                size += length
+                if size > max_body:
+                    raise HTTPError(413, f"Request body exceeds {max_body} bytes")
+                chunks.append(self.rfile.read(length))
+                self.rfile.readline(65537)
+        length_header = self.headers.get("Content-Length")
+        if length_header is None:
+            raise HTTPError(411, "Content-Length or chunked Transfer-Encoding required")
+        try:
+            length = int(length_header)
+        except ValueError:
+            raise HTTPError(400, "Invalid Content-Length")
+        if length < 0:
+            raise HTTPError(400, "Invalid Content-Length")
+        if length > max_body:
+            raise HTTPError(413, f"Request body exceeds {max_body} bytes")
+        return self.rfile.read(length)
+
+    def _text_argument(self, query: Dict[str, Any], name: str) -> str:
+        """A text argument from the query string (GET) or the body (POST)."""
+        if self.command == "GET":
+            values = query.get(name)
+            if not values:
+                raise HTTPError(400, f"Missing query parameter {name!r}")
+            return values[0]
+        try:
+            return self._body().decode("utf-8").strip()
+        except UnicodeDecodeError:
+            raise HTTPError(400, "Body is not valid UTF-8")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.access_log:
+            super().log_message(format, *args)
+
+
+Route = Callable[[_Handler, Dict[str, Any]], Tuple[int, str, bytes]]
+
+
+def _validate(handler: _Handler, query: Dict[str, Any]) -> Tuple[int, str, bytes]:
+    strict = query.get("strict", ["0"])[0].lower() in _TRUE
+    result = handler.server.validator._validate_safely(handler._body(), strict)
+    return 200, "application/json", _json({
+        "valid": result.is_valid,
+        "errors": result.errors,
+        "warnings": result.warnings,
+    })
+
+
+def _check_uri(handler: _Handler, query: Dict[str, Any]) -> Tuple[int, str, bytes]:
+    uri = handler._text_argument(query, "uri")
+    uri_validator = handler.server.validator.uri_validator
+    result = uri_validator.validate(uri)
+    payload: Dict[str, Any] = {
+        "valid": result.is_valid,
+        "errors": list(result.errors),
+        "warnings": list(result.warnings),
+        "parsed": dict(result.parsed),
+    }
+    if result.is_valid:
+        try:
+            payload["https_url"] = uri_validator.to_https(uri)
+        except ValueError:
+            pass
+    return 200, "application/json", _json(payload)
+
+
+def _check_policy(handler: _Handler, query: Dict[str, Any]) -> Tuple[int, str, bytes]:
+    expression = handler._text_argument(query, "expression")
+    result = handler.server.validator.policy_validator.validate(expression)
+    return 200, "application/json", _json({
+        "valid": result.is_valid,
+        "errors": list(result.errors),
+        "warnings": list(result.warnings),
+    })
+
+
+def _healthz(handler: _Handler, query: Dict[str, Any]) -> Tuple[int, str, bytes]:
+    server = handler.server
+    return 200, "application/json", _json({
+        "status": "ok",
+        "version": __version__,
+        "uptime_seconds": round(time.time() - server.started, 3),
+        "requests": server.requests,
+        "workers": server.workers,
+    })
+
+
+def _metrics(handler: _Handler, query: Dict[str, Any]) -> Tuple[int, str, bytes]:
+    metrics = handler.server.metrics
+    text = metrics.to_prometheus() if isinstance(metrics, Registry) else ""
+    return 200, "text/plain; version=0.0.4; charset=utf-8", text.encode("utf-8")
+
+
+_ROUTES: Dict[Tuple[str, str], Route] = {
+    ("POST", "/validate"): _validate,
+    ("GET", "/check-uri"): _check_uri,
+    ("POST", "/check-uri"): _check_uri,
+    ("GET", "/check-policy"): _check_policy,
+    ("POST", "/check-policy"): _check_policy,
+    ("GET", "/healthz"): _healthz,
+    ("GET", "/metrics"): _metrics,
+}
+
+
+def _json(payload: Dict[str, Any]) -> bytes:
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
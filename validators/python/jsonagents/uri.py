@@ -2,19 +2,37 @@
 
 import re
 from dataclasses import dataclass, field
-from typing import List
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 from urllib.parse import urlparse
 
+from .lru import CacheInfo, LRUCache
+from .metrics import Metrics, get_metrics
 
-@dataclass
+
+@dataclass(frozen=True)
 class URIValidationResult:
-    """Result of URI validation."""
+    """Result of URI validation (immutable, safe to share from the cache)."""
 
     is_valid: bool
-    errors: List[str] = field(default_factory=list)
-    warnings: List[str] = field(default_factory=list)
+    errors: Tuple[str, ...] = ()
+    warnings: Tuple[str, ...] = ()
     uri: str = ""
-    parsed: dict = field(default_factory=dict)
+    parsed: Mapping[str, str] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        # Fields that are already normalized (see _accepted) are kept as given
+        if type(self.errors) is not tuple:
+            object.__setattr__(self, "errors", tuple(self.errors))
+        if type(self.warnings) is not tuple:
+            object.__setattr__(self, "warnings", tuple(self.warnings))
+        if type(self.parsed) is not MappingProxyType:
+            object.__setattr__(self, "parsed", MappingProxyType(dict(self.parsed)))
+
+    @classmethod
+    def _accepted(cls, uri: str, parsed: Dict[str, str]) -> "URIValidationResult":
+        """Build a warning-free valid result from a ``parsed`` dict it takes ownership of."""
+        return cls(True, (), (), uri, MappingProxyType(parsed))
 
 
 class URIValidator:
@@ -32,16 +50,84 @@ class URIValidator:
     PATH_PATTERN = re.compile(r"^(/[a-zA-Z0-9._~!$&'()*+,;=:@\-]*)*$")
     FRAGMENT_PATTERN = re.compile(r"^[a-zA-Z0-9._~!$&'()*+,;=:@/?-]*$")
 
+    # Well-formed URIs that the checks above accept without warnings: no
+    # userinfo, no query, a non-empty path. Anything else takes the detailed
+    # path so the diagnostics stay the same.
+    AJSON_URI_PATTERN = re.compile(
+        r"ajson://"
+        r"(?P<authority>"
+        r"(?P<host>(?:[a-zA-Z0-9](?:[a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?\.)*"
+        r"[a-zA-Z0-9](?:[a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?)"
+        r"(?::(?P<port>[0-9]{1,5}))?"
+        r")"
+        r"(?P<path>/[a-zA-Z0-9._~!$&'()*+,;=:@/\-]*)"
+        r"(?:#(?P<fragment>[a-zA-Z0-9._~!$&'()*+,;=:@/?-]*))?"
+    )
+
+    def __init__(self, cache_size: int = 1024, metrics: Optional[Metrics] = None) -> None:
+        """
+        Initialize URI validator.
+
+        Args:
+            cache_size: Number of distinct URIs whose results are memoized
+                        (0 disables memoization)
+            metrics: Where checks and cache hits are counted. If None, the
+                     process-wide metrics (see :mod:`jsonagents.metrics`).
+        """
+        self._cache: LRUCache[URIValidationResult] = LRUCache(cache_size)
+        self._metrics = metrics
+
     def validate(self, uri: str) -> URIValidationResult:
         """
         Validate an ajson:// URI.
 
+        Results are memoized per URI string.
+
         Args:
             uri: The URI to validate
 
         Returns:
             URIValidationResult with validation status
         """
+        result = self._cache.get(uri)
+        hit = result is not None
+        if result is None:
+            result = self._validate(uri)
+            self._cache.put(uri, result)
+        metrics = self._metrics if self._metrics is not None else get_metrics()
+        if metrics.enabled:
+            metrics.inc("jsonagents_cache_hits_total" if hit else "jsonagents_cache_misses_total",
+                        labels={"cache": "uri"})
+            metrics.inc("jsonagents_uri_checks_total",
+                        labels={"result": "valid" if result.is_valid else "invalid"})
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        """Return memoization hit, miss and eviction counters."""
+        return self._cache.info()
+
+    def clear_cache(self) -> None:
+        """Drop memoized results and reset the counters."""
+        self._cache.clear()
+
+    def _validate(self, uri: str) -> URIValidationResult:
+        """Validate a URI without consulting the cache."""
+        match = self.AJSON_URI_PATTERN.fullmatch(uri)
+        if match is not None:
+            port = match.group("port")
+            if port is None or 1 <= int(port) <= 65535:
+                authority, path, fragment = match.group("authority", "path", "fragment")
+                return URIValidationResult._accepted(uri, {
+                    "scheme": "ajson",
+                    "authority": authority,
+                    "path": path,
+                    "query": "",
+                    "fragment": fragment or "",
+                })
+        return self._validate_detailed(uri)
+
+    def _validate_detailed(self, uri: str) -> URIValidationResult:
+        """Validate a URI step by step, collecting every error and warning."""
         errors: List[str] = []
         warnings: List[str] = []
         parsed_data: dict = {}
@@ -1,17 +1,30 @@
 """Core validator for JSON Agents manifests."""
 
 import json
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 
-import jsonschema
-from jsonschema import Draft202012Validator, RefResolver
+from jsonschema import Draft202012Validator
 
+from .graph import ERROR, GraphAnalysis, analyze_graph
+from .jsonio import get_backend, load_path, loads
+from .result_cache import DEFAULT_MAX_BYTES, ResultCache
+from .schema import get_compiled_schema
+from .metrics import NULL_METRICS, Metrics, get_metrics
+from .timing import ValidationProfile
 from .uri import URIValidator
 from .policy import PolicyValidator
 
 
+ManifestSource = Union[str, Path, bytes, bytearray, memoryview, Dict[str, Any]]
+
+_BUFFER_TYPES = (bytes, bytearray, memoryview)
+
+
 @dataclass
 class ValidationResult:
     """Result of manifest validation."""
@@ -20,6 +33,8 @@ class ValidationResult:
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     manifest: Optional[Dict[str, Any]] = None
+    graph: Optional[GraphAnalysis] = None
+    profile: Optional[ValidationProfile] = None
 
     def __str__(self) -> str:
         """String representation of validation result."""
@@ -39,72 +54,135 @@ class ValidationResult:
 class Validator:
     """Main validator for JSON Agents manifests."""
 
-    def __init__(self, schema_path: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        schema_path: Optional[str] = None,
+        cache_size: int = 1024,
+        cache_dir: Optional[Union[str, Path]] = None,
+        cache_max_bytes: int = DEFAULT_MAX_BYTES,
+        json_backend: Optional[str] = None,
+        profile: bool = False,
+        metrics: Optional[Metrics] = None,
+    ) -> None:
         """
         Initialize validator.
 
         Args:
             schema_path: Path to json-agents.json schema file.
-                        If None, uses bundled schema.
+                        If None, uses bundled schema. Compiled schemas are
+                        shared process-wide, see :mod:`jsonagents.schema`.
+            cache_size: Number of distinct URIs and policy expressions whose
+                        validation results are memoized (0 disables it)
+            cache_dir: Directory for persistent results of file and bytes
+                       inputs, keyed by content hash (see
+                       :mod:`jsonagents.result_cache`). Cached results carry
+                       no parsed ``manifest``. If None, nothing is persisted.
+            cache_max_bytes: Size budget of ``cache_dir``
+            json_backend: "orjson", "msgspec", "json", or None to use the
+                          fastest installed (see :mod:`jsonagents.jsonio`)
+            profile: If True, record per-stage wall times and counts in
+                     ``ValidationResult.profile`` (see :mod:`jsonagents.timing`)
+            metrics: Where this validator and its URI and policy validators
+                     report counters and stage latencies. If None, the
+                     process-wide metrics (see :mod:`jsonagents.metrics`),
+                     which discard everything unless configured.
         """
         self.schema_path = schema_path
-        self.uri_validator = URIValidator()
-        self.policy_validator = PolicyValidator()
-        self._schema: Optional[Dict[str, Any]] = None
-        self._validator: Optional[Draft202012Validator] = None
+        self.cache_size = cache_size
+        self.cache_dir = cache_dir
+        self.cache_max_bytes = cache_max_bytes
+        self.json_backend = json_backend
+        self.profile = profile
+        self._json = get_backend(json_backend)
+        self._metrics = metrics
+        self.uri_validator = URIValidator(cache_size=cache_size, metrics=metrics)
+        self.policy_validator = PolicyValidator(cache_size=cache_size, metrics=metrics)
+        self.result_cache = (
+            ResultCache(cache_dir, max_bytes=cache_max_bytes) if cache_dir is not None else None
+        )
 
     def _load_schema(self) -> Dict[str, Any]:
         """Load JSON Agents schema."""
-        if self._schema is not None:
-            return self._schema
-
-        if self.schema_path:
-            schema_file = Path(self.schema_path)
-        else:
-            # Use bundled schema (from Standard repo)
-            schema_file = Path(__file__).parent / "schemas" / "json-agents.json"
-
-        if not schema_file.exists():
-            raise FileNotFoundError(f"Schema file not found: {schema_file}")
-
-        with open(schema_file, "r", encoding="utf-8") as f:
-            self._schema = json.load(f)
-
-        return self._schema
+        return get_compiled_schema(self.schema_path).schema
 
     def _get_validator(self) -> Draft202012Validator:
         """Get JSON Schema validator instance."""
-        if self._validator is not None:
-            return self._validator
-
-        schema = self._load_schema()
-        
-        # Set up resolver for schema references
-        schema_dir = Path(self.schema_path).parent if self.schema_path else \
-                     Path(__file__).parent / "schemas"
-        resolver = RefResolver(
-            base_uri=f"file://{schema_dir}/",
-            referrer=schema
-        )
-        
-        self._validator = Draft202012Validator(schema, resolver=resolver)
-        return self._validator
+        return get_compiled_schema(self.schema_path).validator
 
     def validate(
         self,
-        manifest: Union[str, Path, Dict[str, Any]],
+        manifest: ManifestSource,
         strict: bool = False
     ) -> ValidationResult:
         """
         Validate a JSON Agents manifest.
 
         Args:
-            manifest: Path to manifest file or manifest dict
+            manifest: Path to manifest file, raw JSON bytes/memoryview or manifest dict
             strict: If True, treat warnings as errors
 
         Returns:
             ValidationResult with validation status and messages
         """
+        metrics = self.metrics
+        profile = None
+        if self.profile or metrics.enabled:
+            profile = ValidationProfile()
+            profile.start()
+
+        result = self._validate_cached(manifest, strict, profile)
+
+        if metrics.enabled:
+            _record(metrics, result)
+            if not self.profile:
+                result.profile = None
+        return result
+
+    @property
+    def metrics(self) -> Metrics:
+        """Metrics this validator reports into (the process-wide ones by default)."""
+        return self._metrics if self._metrics is not None else get_metrics()
+
+    def _validate_cached(
+        self,
+        manifest: ManifestSource,
+        strict: bool,
+        profile: Optional[ValidationProfile],
+    ) -> ValidationResult:
+        """Validate through the result cache, if there is one."""
+        if self.result_cache is None or not isinstance(manifest, (str, Path) + _BUFFER_TYPES):
+            return self._validate(manifest, strict, profile)
+
+        try:
+            raw = bytes(manifest) if isinstance(manifest, _BUFFER_TYPES) \
+                else Path(manifest).read_bytes()
+            schema_hash = get_compiled_schema(self.schema_path).content_hash
+        except OSError:
+            # Unreadable input or schema: report it the uncached way
+            return self._validate(manifest, strict, profile)
+
+        key = ResultCache.key(raw, schema_hash, strict)
+        hit = self.result_cache.get(key)
+        if profile is not None:
+            profile.lap("cache", 1 if hit is not None else 0)
+        if hit is not None:
+            return ValidationResult(
+                is_valid=hit["is_valid"],
+                errors=list(hit["errors"]),
+                warnings=list(hit["warnings"]),
+                profile=profile,
+            )
+        result = self._validate(raw, strict, profile)
+        self.result_cache.put(key, result.is_valid, result.errors, result.warnings)
+        return result
+
+    def _validate(
+        self,
+        manifest: ManifestSource,
+        strict: bool,
+        profile: Optional[ValidationProfile] = None,
+    ) -> ValidationResult:
+        """Validate a manifest without consulting the result cache."""
         errors: List[str] = []
         warnings: List[str] = []
         manifest_dict: Optional[Dict[str, Any]] = None
@@ -112,33 +190,42 @@ class Validator:
         # Load manifest
         try:
             if isinstance(manifest, (str, Path)):
-                with open(manifest, "r", encoding="utf-8") as f:
-                    manifest_dict = json.load(f)
+                manifest_dict = load_path(manifest, self._json)
+            elif isinstance(manifest, _BUFFER_TYPES):
+                manifest_dict = loads(manifest, self._json)
             else:
                 manifest_dict = manifest
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             errors.append(f"Invalid JSON: {e}")
-            return ValidationResult(is_valid=False, errors=errors)
+            return ValidationResult(is_valid=False, errors=errors,
+                                    profile=_lap(profile, "parse", 1, len(errors)))
         except FileNotFoundError as e:
             errors.append(f"File not found: {e}")
-            return ValidationResult(is_valid=False, errors=errors)
+            return ValidationResult(is_valid=False, errors=errors,
+                                    profile=_lap(profile, "parse", 0, len(errors)))
+        if profile is not None:
+            profile.lap("parse", 0 if manifest_dict is manifest else 1)
 
         # JSON Schema validation
         try:
-            validator = self._get_validator()
-            schema_errors = sorted(validator.iter_errors(manifest_dict), key=lambda e: e.path)
-            
+            compiled = get_compiled_schema(self.schema_path)
+            schema_errors = sorted(compiled.iter_errors(manifest_dict), key=lambda e: e.path)
+
             for error in schema_errors:
                 path = ".".join(str(p) for p in error.path) if error.path else "root"
                 errors.append(f"Schema error at '{path}': {error.message}")
-        
+
         except Exception as e:
             errors.append(f"Schema validation error: {e}")
+        if profile is not None:
+            profile.lap("schema", len(errors), len(errors))
 
         # Validate URIs
+        checked = 0
         if manifest_dict and "agent" in manifest_dict:
             agent_id = manifest_dict["agent"].get("id")
             if agent_id:
+                checked += 1
                 uri_result = self.uri_validator.validate(agent_id)
                 if not uri_result.is_valid:
                     errors.extend(uri_result.errors)
@@ -149,6 +236,7 @@ class Validator:
             for i, tool in enumerate(manifest_dict["tools"]):
                 tool_id = tool.get("id")
                 if tool_id and tool_id.startswith("ajson://"):
+                    checked += 1
                     uri_result = self.uri_validator.validate(tool_id)
                     if not uri_result.is_valid:
                         errors.extend([f"Tool[{i}] {e}" for e in uri_result.errors])
@@ -160,30 +248,53 @@ class Validator:
                 for i, node in enumerate(graph["nodes"]):
                     ref = node.get("ref")
                     if ref and ref.startswith("ajson://"):
+                        checked += 1
                         uri_result = self.uri_validator.validate(ref)
                         if not uri_result.is_valid:
                             errors.extend([f"Graph node[{i}] {e}" for e in uri_result.errors])
+        if profile is not None:
+            profile.lap("uris", checked, len(errors))
 
         # Validate policy expressions
+        checked = 0
         if manifest_dict and "policies" in manifest_dict:
             for i, policy in enumerate(manifest_dict["policies"]):
                 where = policy.get("where")
                 if where:
+                    checked += 1
                     policy_result = self.policy_validator.validate(where)
                     if not policy_result.is_valid:
                         errors.extend([f"Policy[{i}] {e}" for e in policy_result.errors])
                     warnings.extend([f"Policy[{i}] {w}" for w in policy_result.warnings])
+        if profile is not None:
+            profile.lap("policies", checked, len(errors))
 
         # Validate graph edge conditions
+        checked = 0
         if manifest_dict and "graph" in manifest_dict:
             graph = manifest_dict["graph"]
             if "edges" in graph:
                 for i, edge in enumerate(graph["edges"]):
                     condition = edge.get("condition")
                     if condition:
+                        checked += 1
                         policy_result = self.policy_validator.validate(condition)
                         if not policy_result.is_valid:
                             errors.extend([f"Edge[{i}] condition {e}" for e in policy_result.errors])
+        if profile is not None:
+            profile.lap("edges", checked, len(errors))
+
+        # Analyze graph topology
+        graph_analysis = None
+        if manifest_dict and isinstance(manifest_dict.get("graph"), dict):
+            graph = manifest_dict["graph"]
+            if isinstance(graph.get("nodes"), list) and isinstance(graph.get("edges", []), list):
+                graph_analysis = analyze_graph(graph)
+                # Cycles are informational: they stay on result.graph only
+                errors.extend(f.message for f in graph_analysis.errors)
+                warnings.extend(f.message for f in graph_analysis.warnings)
+        if profile is not None:
+            profile.lap("graph", len(graph["nodes"]) if graph_analysis else 0, len(errors))
 
         # Check for warnings
         if manifest_dict:
@@ -205,12 +316,183 @@ class Validator:
             is_valid=is_valid,
             errors=errors,
             warnings=warnings,
-            manifest=manifest_dict
+            manifest=manifest_dict,
+            graph=graph_analysis,
+            profile=profile,
+        )
+
+    def validate_many(
+        self,
+        manifests: Iterable[ManifestSource],
+        strict: bool = False,
+        executor: Union[None, str, Executor] = None,
+        max_workers: Optional[int] = None,
+        window: Optional[int] = None,
+    ) -> Iterator[Tuple[ManifestSource, ValidationResult]]:
+        """
+        Lazily validate a stream of manifests.
+
+        Results are yielded in input order. At most ``window`` manifests are in
+        flight at once, so an unbounded iterable is consumed with constant
+        memory. Unexpected exceptions are reported as failed results instead
+        of aborting the stream.
+
+        Args:
+            manifests: Iterable of paths, raw JSON bytes or manifest dicts
+            strict: If True, treat warnings as errors
+            executor: None to validate in the calling thread, "thread" or
+                      "process" for a pool owned by this call, or an existing
+                      Executor instance (not shut down afterwards)
+            max_workers: Worker count for an owned pool
+            window: Maximum number of in-flight manifests. Defaults to four
+                    per worker.
+
+        Yields:
+            (source, ValidationResult) tuples
+        """
+        if executor is None:
+            for source in manifests:
+                yield source, self._validate_safely(source, strict)
+            return
+
+        if window is None:
+            window = 4 * (max_workers or os.cpu_count() or 1)
+        if window < 1:
+            raise ValueError("window must be at least 1")
+
+        if isinstance(executor, str):
+            if executor == "thread":
+                pool: Executor = ThreadPoolExecutor(max_workers=max_workers)
+            elif executor == "process":
+                pool = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_warm_process_validator,
+                    initargs=(self._worker_config(),),
+                )
+            else:
+                raise ValueError(f"Unknown executor {executor!r}. Use 'thread' or 'process'")
+            with pool:
+                yield from self._validate_in_pool(manifests, strict, pool, window)
+        else:
+            yield from self._validate_in_pool(manifests, strict, executor, window)
+
+    def _validate_in_pool(
+        self,
+        manifests: Iterable[ManifestSource],
+        strict: bool,
+        pool: Executor,
+        window: int,
+    ) -> Iterator[Tuple[ManifestSource, ValidationResult]]:
+        """Feed manifests through an executor with a bounded in-flight window."""
+        in_process = isinstance(pool, ProcessPoolExecutor)
+        config = self._worker_config()
+        # Workers cannot reach this process's metrics: they return profiles
+        # and the results are recorded here as they are yielded
+        metrics = self.metrics if in_process else NULL_METRICS
+        pending: Deque[Tuple[ManifestSource, "Future[ValidationResult]"]] = deque()
+
+        for source in manifests:
+            if in_process:
+                # memoryviews cannot be pickled to a worker
+                payload = source.tobytes() if isinstance(source, memoryview) else source
+                future = pool.submit(_validate_in_process, config, payload, strict)
+            else:
+                future = pool.submit(self._validate_safely, source, strict)
+            pending.append((source, future))
+            if len(pending) >= window:
+                done_source, done = pending.popleft()
+                yield done_source, self._recorded(metrics, done.result())
+
+        while pending:
+            done_source, done = pending.popleft()
+            yield done_source, self._recorded(metrics, done.result())
+
+    def _recorded(self, metrics: Metrics, result: ValidationResult) -> ValidationResult:
+        """Record a result computed in a worker process."""
+        if metrics.enabled:
+            _record(metrics, result)
+            if not self.profile:
+                result.profile = None
+        return result
+
+    def _validate_safely(self, manifest: ManifestSource, strict: bool) -> ValidationResult:
+        """Validate, turning unexpected exceptions into a failed result."""
+        try:
+            return self.validate(manifest, strict=strict)
+        except Exception as e:
+            return ValidationResult(is_valid=False, errors=[str(e)])
+
+    def _worker_config(self) -> Tuple[Tuple[str, Any], ...]:
+        """Constructor arguments used to rebuild this validator in a worker process."""
+        return (
+            ("schema_path", self.schema_path),
+            ("cache_size", self.cache_size),
+            ("cache_dir", self.cache_dir),
+            ("cache_max_bytes", self.cache_max_bytes),
+            ("json_backend", self.json_backend),
+            ("profile", self.profile or self.metrics.enabled),
         )
 
 
+def _lap(
+    profile: Optional[ValidationProfile], stage: str, count: int, errors: int
+) -> Optional[ValidationProfile]:
+    """Record a final lap on an optional profile and return it."""
+    if profile is not None:
+        profile.lap(stage, count, errors)
+    return profile
+
+
+def _record(metrics: Metrics, result: ValidationResult) -> None:
+    """Report one validation result into metrics."""
+    metrics.inc("jsonagents_manifests_validated_total")
+    if not result.is_valid:
+        metrics.inc("jsonagents_manifests_failed_total")
+    profile = result.profile
+    if profile is None:
+        return
+    for stage, timing in profile.stages.items():
+        metrics.observe("jsonagents_validation_stage_seconds", timing.seconds, {"stage": stage})
+        if timing.errors:
+            metrics.inc("jsonagents_validation_errors_total", timing.errors, {"category": stage})
+        if stage == "cache":
+            outcome = "jsonagents_cache_hits_total" if timing.count else "jsonagents_cache_misses_total"
+            metrics.inc(outcome, labels={"cache": "result"})
+    metrics.observe("jsonagents_validation_seconds", profile.total_seconds)
+
+
+# Validators rebuilt inside worker processes, keyed by constructor arguments
+_process_validators: Dict[Tuple[Tuple[str, Any], ...], Validator] = {}
+
+
+def _process_validator(config: Tuple[Tuple[str, Any], ...]) -> Validator:
+    """Return the worker process's validator for a configuration."""
+    validator = _process_validators.get(config)
+    if validator is None:
+        validator = _process_validators[config] = Validator(metrics=NULL_METRICS, **dict(config))
+    return validator
+
+
+def _warm_process_validator(config: Tuple[Tuple[str, Any], ...]) -> None:
+    """Build the worker's validator and compile its schema up front."""
+    try:
+        _process_validator(config)._get_validator()
+    except Exception:
+        # Reported per manifest, same as in-process validation
+        pass
+
+
+def _validate_in_process(
+    config: Tuple[Tuple[str, Any], ...],
+    manifest: ManifestSource,
+    strict: bool,
+) -> ValidationResult:
+    """Validate a manifest inside a worker process."""
+    return _process_validator(config)._validate_safely(manifest, strict)
+
+
 def validate_manifest(
-    manifest: Union[str, Path, Dict[str, Any]],
+    manifest: ManifestSource,
     strict: bool = False,
     schema_path: Optional[str] = None
 ) -> ValidationResult:
@@ -218,7 +500,7 @@ def validate_manifest(
     Convenience function to validate a manifest.
 
     Args:
-        manifest: Path to manifest file or manifest dict
+        manifest: Path to manifest file, raw JSON bytes/memoryview or manifest dict
         strict: If True, treat warnings as errors
         schema_path: Optional custom schema path
 
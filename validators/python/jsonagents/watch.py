@@ -0,0 +1,185 @@
+"""Incremental revalidation of manifest files for watch mode.
+
+A :class:`Watcher` keeps one warm :class:`Validator` and the last known state
+of every watched file. Each :meth:`Watcher.scan` stats the files, re-reads
+only those whose mtime or size moved, and revalidates only those whose
+content hash actually changed, returning what changed in the result set.
+Scanning is polling based so it behaves the same on every platform.
+"""
+
+import hashlib
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .validator import ValidationResult, Validator
+
+
+ADDED = "added"
+CHANGED = "changed"
+REMOVED = "removed"
+
+
+@dataclass(frozen=True)
+class FileState:
+    """What a file looked like when it was last validated."""
+
+    mtime_ns: int
+    size: int
+    digest: str
+
+
+@dataclass(frozen=True)
+class Change:
+    """A difference in the result set between two scans."""
+
+    path: str
+    kind: str
+    before: Optional[ValidationResult] = None
+    after: Optional[ValidationResult] = None
+
+    @property
+    def new_errors(self) -> Tuple[str, ...]:
+        return _added(self.before.errors if self.before else (),
+                      self.after.errors if self.after else ())
+
+    @property
+    def fixed_errors(self) -> Tuple[str, ...]:
+        return _added(self.after.errors if self.after else (),
+                      self.before.errors if self.before else ())
+
+    @property
+    def new_warnings(self) -> Tuple[str, ...]:
+        return _added(self.before.warnings if self.before else (),
+                      self.after.warnings if self.after else ())
+
+    @property
+    def fixed_warnings(self) -> Tuple[str, ...]:
+        return _added(self.after.warnings if self.after else (),
+                      self.before.warnings if self.before else ())
+
+
+class Watcher:
+    """
+    Track manifest files and revalidate the ones that change.
+
+    Example:
+        >>> watcher = Watcher(["examples/"])
+        >>> watcher.scan()          # first scan reports every file as added
+        >>> watcher.run(print)      # then prints changes until interrupted
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[Union[str, Path]],
+        validator: Optional[Validator] = None,
+        strict: bool = False,
+        patterns: Sequence[str] = ("*.json",),
+    ) -> None:
+        """
+        Initialize the watcher.
+
+        Args:
+            paths: Files and directories to watch; directories are expanded
+                   with ``patterns`` on every scan, so new files are picked up
+            validator: Validator to reuse. If None, a new one is created.
+            strict: If True, treat warnings as errors
+            patterns: Glob patterns matched inside watched directories
+        """
+        self.paths = [Path(p) for p in paths]
+        self.validator = validator or Validator()
+        self.strict = strict
+        self.patterns = tuple(patterns)
+        self._states: Dict[str, FileState] = {}
+        self._results: Dict[str, ValidationResult] = {}
+
+    @property
+    def results(self) -> Dict[str, ValidationResult]:
+        """Current result per watched file, in path order."""
+        return dict(sorted(self._results.items()))
+
+    def files(self) -> List[Path]:
+        """Expand the watched paths into the files currently present."""
+        found: Dict[Path, None] = {}
+        for path in self.paths:
+            if path.is_dir():
+                for pattern in self.patterns:
+                    found.update(dict.fromkeys(sorted(path.glob(pattern))))
+            elif path.exists():
+                found[path] = None
+        return list(found)
+
+    def scan(self) -> List[Change]:
+        """
+        Revalidate what changed since the previous scan.
+
+        Returns:
+            Changes in path order; empty if nothing changed
+        """
+        changes: List[Change] = []
+        seen = set()
+        for path in self.files():
+            name = str(path)
+            seen.add(name)
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            state = self._states.get(name)
+            if state is not None and state.mtime_ns == stat.st_mtime_ns and state.size == stat.st_size:
+                continue
+            try:
+                raw = path.read_bytes()
+            except OSError:
+                continue
+            digest = hashlib.sha256(raw).hexdigest()
+            self._states[name] = FileState(stat.st_mtime_ns, stat.st_size, digest)
+            if state is not None and state.digest == digest:
+                # Touched or rewritten with identical content
+                continue
+            before = self._results.get(name)
+            after = self.validator._validate_safely(raw, self.strict)
+            self._results[name] = after
+            if before is None:
+                changes.append(Change(name, ADDED, after=after))
+            elif _outcome(before) != _outcome(after):
+                changes.append(Change(name, CHANGED, before=before, after=after))
+
+        for name in [n for n in self._states if n not in seen]:
+            del self._states[name]
+            changes.append(Change(name, REMOVED, before=self._results.pop(name, None)))
+
+        return sorted(changes, key=lambda c: c.path)
+
+    def run(
+        self,
+        on_change: Callable[[List[Change]], None],
+        interval: float = 0.5,
+        max_scans: Optional[int] = None,
+    ) -> None:
+        """
+        Scan repeatedly, calling ``on_change`` whenever the result set changes.
+
+        Args:
+            on_change: Called with the non-empty list of changes of a scan
+            interval: Seconds between scans
+            max_scans: Stop after this many scans. If None, run until interrupted.
+        """
+        scans = 0
+        while max_scans is None or scans < max_scans:
+            changes = self.scan()
+            scans += 1
+            if changes:
+                on_change(changes)
+            if max_scans is None or scans < max_scans:
+                time.sleep(interval)
+
+
+def _outcome(result: ValidationResult) -> Tuple[bool, Tuple[str, ...], Tuple[str, ...]]:
+    return result.is_valid, tuple(result.errors), tuple(result.warnings)
+
+
+def _added(old: Sequence[str], new: Sequence[str]) -> Tuple[str, ...]:
+    previous = set(old)
+    return tuple(message for message in new if message not in previous)
@@ -0,0 +1,96 @@
+"""Shared test fixtures."""
+
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def schema_codegen_dir(tmp_path_factory):
+    """Keep generated schema checks out of the user's cache directory."""
+    path = tmp_path_factory.mktemp("schemas")
+    os.environ["JSONAGENTS_SCHEMA_CACHE_DIR"] = str(path)
+    return path
+
+
+@pytest.fixture
+def make_manifest():
+    """Factory for a minimal core-profile manifest with the given agent id."""
+    def make(agent_id="ajson://example.com/agents/test"):
+        return {
+            "manifest_version": "1.0",
+            "profiles": ["core"],
+            "agent": {"id": agent_id, "name": "Test Agent", "version": "1.0.0"},
+            "capabilities": [{"id": "echo", "description": "Echo service"}],
+            "modalities": {"input": ["text"], "output": ["text"]},
+        }
+    return make
+
+
+class Origin:
+    """Serves manifests under /.well-known/ with ETag support and counts requests."""
+
+    def __init__(self):
+        self.documents = {}
+        self.hits = []
+        self.delay = 0.0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        origin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                with origin._lock:
+                    origin.hits.append((self.path, self.headers.get("If-None-Match")))
+                    origin.active += 1
+                    origin.max_active = max(origin.max_active, origin.active)
+                time.sleep(origin.delay)
+                with origin._lock:
+                    origin.active -= 1
+                body = origin.documents.get(self.path)
+                if body is None:
+                    self._send(404, b"not found")
+                    return
+                etag = f'"{hash(body) & 0xFFFFFFFF:x}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self._send(304, b"", etag)
+                    return
+                self._send(200, body, etag)
+
+            def _send(self, status, body, etag=None):
+                self.send_response(status)
+                if etag:
+                    self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.authority = f"127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(
+            target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        ).start()
+
+    def publish(self, name, manifest):
+        self.documents[f"/.well-known/agents/{name}.agents.json"] = (
+            json.dumps(manifest).encode() if not isinstance(manifest, bytes) else manifest
+        )
+        return f"ajson://{self.authority}/agents/{name}"
+
+
+@pytest.fixture
+def origin():
+    server = Origin()
+    yield server
+    server.server.shutdown()
+    server.server.server_close()
@@ -0,0 +1,119 @@
+"""Tests for the synthetic manifest generator and benchmark runner."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+from jsonagents.bench import (
+    SHAPES,
+    ManifestShape,
+    compare_reports,
+    generate_expressions,
+    generate_manifest,
+    generate_uris,
+    latency_summary,
+    measure,
+    run_benchmarks,
+)
+from jsonagents.cli import main
+from jsonagents.policy import PolicyValidator
+from jsonagents.validator import Validator
+
+
+def test_generator_is_deterministic():
+    """Test the same seed and shape give the same manifest."""
+    shape = SHAPES["medium"]
+
+    assert generate_manifest(shape, 7) == generate_manifest(shape, 7)
+    assert generate_manifest(shape, 7) != generate_manifest(shape, 8)
+    assert generate_uris(20, 3) == generate_uris(20, 3)
+
+
+@pytest.mark.parametrize("name", sorted(SHAPES))
+def test_generated_manifests_are_valid(name):
+    """Test every preset shape produces valid manifests of that size."""
+    shape = SHAPES[name]
+    validator = Validator()
+
+    for seed in range(3):
+        manifest = generate_manifest(shape, seed)
+        assert validator.validate(manifest).errors == []
+        assert len(manifest.get("tools", [])) == shape.tools
+        assert len(manifest.get("policies", [])) == shape.policies
+        assert len(manifest.get("graph", {}).get("edges", [])) == shape.edges
+
+
+def test_embedded_schema_size():
+    """Test each tool embeds an input schema with the requested property count."""
+    manifest = generate_manifest(ManifestShape(tools=3, policies=0, schema_properties=12))
+
+    assert [len(t["input_schema"]["properties"]) for t in manifest["tools"]] == [12, 12, 12]
+
+
+def test_generated_expressions_are_valid():
+    """Test generated where clauses all pass policy validation."""
+    validator = PolicyValidator()
+
+    assert all(validator.validate(e).is_valid for e in generate_expressions(200, seed=1))
+
+
+def test_latency_percentiles():
+    """Test nearest-rank percentiles in milliseconds."""
+    summary = latency_summary([i * 1_000_000 for i in range(1, 101)])
+
+    assert summary["min"] == 1 and summary["max"] == 100
+    assert (summary["p50"], summary["p90"], summary["p99"]) == (50, 90, 99)
+    assert summary["mean"] == 50.5
+
+
+def test_measure_counts_calls():
+    """Test measure() calls the function once per input after the warmup."""
+    calls = []
+
+    measurement = measure("noop", calls.append, [1, 2, 3], warmup=1)
+
+    assert calls == [1, 1, 2, 3]
+    assert measurement.iterations == 3
+    assert measurement.latency_ms["max"] >= measurement.latency_ms["min"]
+
+
+def test_run_benchmarks_report():
+    """Test the report is JSON-serializable and covers the selected suites."""
+    report = run_benchmarks(SHAPES["small"], iterations=5, suites=("schema", "uri", "policy", "validate"))
+
+    assert list(report["results"]) == ["schema", "uri", "policy", "validate"]
+    assert report["shape"]["tools"] == SHAPES["small"].tools
+    assert json.loads(json.dumps(report)) == report
+    with pytest.raises(ValueError, match="Unknown benchmark suite"):
+        run_benchmarks(suites=("disk",))
+
+
+def test_compare_reports():
+    """Test only p50 slowdowns beyond the tolerance are reported."""
+    def report(p50):
+        return {"results": {"uri": {"latency_ms": {"p50": p50}}}}
+
+    assert compare_reports(report(1.0), report(1.2), tolerance=0.25) == []
+    (regression,) = compare_reports(report(1.0), report(1.5), tolerance=0.25)
+    assert regression.startswith("uri: p50 1.0000 ms -> 1.5000 ms")
+
+
+def test_cli_bench_json_and_baseline(tmp_path):
+    """Test `jsonagents bench` writes a JSON report and fails on regressions."""
+    runner = CliRunner()
+    output = tmp_path / "bench.json"
+
+    result = runner.invoke(main, ["bench", "--shape", "small", "--tools", "1", "-n", "5",
+                                  "--suite", "uri", "--json", "-o", str(output)])
+
+    assert result.exit_code == 0
+    report = json.loads(output.read_text())
+    assert report["shape"]["tools"] == 1
+    assert json.loads(result.output) == report
+
+    report["results"]["uri"]["latency_ms"]["p50"] = 1e-9
+    output.write_text(json.dumps(report))
+    result = runner.invoke(main, ["bench", "-n", "5", "--suite", "uri",
+                                  "--baseline", str(output)])
+    assert result.exit_code == 1
+    assert "Regression: uri" in result.output
@@ -0,0 +1,194 @@
+"""Tests for the command-line interface."""
+
+import json
+import pytest
+from click.testing import CliRunner
+from jsonagents.cli import main
+
+
+@pytest.fixture
+def manifest_dir(tmp_path, make_manifest):
+    """Directory with a mix of valid and invalid manifests."""
+    for i in range(12):
+        agent_id = f"ajson://example.com/agents/a{i}" if i % 3 else "ajson:bad"
+        (tmp_path / f"m{i:02d}.json").write_text(json.dumps(make_manifest(agent_id)))
+    return tmp_path
+
+
+def test_validate_valid_file(tmp_path, make_manifest):
+    """Test validating a single valid file exits with 0."""
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps(make_manifest("ajson://example.com/agents/test")))
+
+    result = CliRunner().invoke(main, ["validate", str(path)])
+
+    assert result.exit_code == 0
+    assert "All manifests are valid" in result.output
+
+
+def test_validate_jobs_matches_serial(manifest_dir):
+    """Test --jobs gives the same ordered output and exit code as a serial run."""
+    files = sorted(str(p) for p in manifest_dir.glob("*.json"))
+    runner = CliRunner()
+
+    serial = runner.invoke(main, ["validate", "--json", *files])
+    parallel = runner.invoke(main, ["validate", "--json", "--jobs", "3", *files])
+
+    assert serial.exit_code == 1
+    assert parallel.exit_code == serial.exit_code
+    assert parallel.output == serial.output
+
+
+def test_validate_jobs_auto(manifest_dir):
+    """Test --jobs auto is accepted."""
+    result = CliRunner().invoke(main, ["validate", "--jobs", "auto", str(manifest_dir)])
+
+    assert result.exit_code == 1
+    assert "Total Files" in result.output
+
+
+@pytest.mark.parametrize("value", ["0", "-2", "many"])
+def test_validate_jobs_rejects_invalid(manifest_dir, value):
+    """Test invalid --jobs values are rejected."""
+    result = CliRunner().invoke(main, ["validate", "--jobs", value, str(manifest_dir)])
+
+    assert result.exit_code == 2
+    assert "--jobs" in result.output
+
+
+@pytest.fixture
+def ndjson_file(tmp_path, make_manifest):
+    """NDJSON export with a blank line and an invalid JSON line."""
+    lines = [
+        json.dumps(make_manifest("ajson://example.com/agents/a1")),
+        json.dumps(make_manifest("ajson:bad")),
+        "",
+        "{not json",
+        json.dumps(make_manifest("ajson://example.com/agents/a2")),
+    ]
+    path = tmp_path / "export.ndjson"
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def test_validate_ndjson_file(ndjson_file):
+    """Test NDJSON validation reports one result per line with line numbers."""
+    result = CliRunner().invoke(main, ["validate", "--ndjson", "--json", str(ndjson_file)])
+
+    entries = [json.loads(line) for line in result.output.splitlines()]
+    assert result.exit_code == 1
+    assert [entry["line"] for entry in entries] == [1, 2, 4, 5]
+    assert [entry["valid"] for entry in entries] == [True, False, False, True]
+    assert all(entry["file"] == str(ndjson_file) for entry in entries)
+    assert any("json" in error.lower() for error in entries[2]["errors"])
+
+
+def test_validate_ndjson_stdin(ndjson_file):
+    """Test NDJSON validation from stdin."""
+    result = CliRunner().invoke(
+        main, ["validate", "--ndjson", "-"], input=ndjson_file.read_bytes()
+    )
+
+    assert result.exit_code == 1
+    assert "<stdin>:2" in result.output
+    assert "<stdin>:5" in result.output
+    assert "Total Manifests" in result.output
+
+
+def test_validate_ndjson_jobs_matches_serial(ndjson_file):
+    """Test NDJSON validation with --jobs keeps line order."""
+    runner = CliRunner()
+
+    serial = runner.invoke(main, ["validate", "--ndjson", "--json", str(ndjson_file)])
+    parallel = runner.invoke(
+        main, ["validate", "--ndjson", "--json", "--jobs", "2", str(ndjson_file)]
+    )
+
+    assert parallel.exit_code == serial.exit_code
+    assert parallel.output == serial.output
+
+
+def test_validate_ndjson_all_valid(tmp_path, make_manifest):
+    """Test NDJSON validation exits with 0 when every line is valid."""
+    path = tmp_path / "export.ndjson"
+    path.write_text(json.dumps(make_manifest("ajson://example.com/agents/a1")) + "\n")
+
+    result = CliRunner().invoke(main, ["validate", "--ndjson", str(path)])
+
+    assert result.exit_code == 0
+    assert "All manifests are valid" in result.output
+
+
+def test_validate_single_manifest_from_stdin(make_manifest):
+    """Test '-' without --ndjson reads one manifest from stdin."""
+    manifest = json.dumps(make_manifest("ajson://example.com/agents/test"))
+
+    result = CliRunner().invoke(main, ["validate", "-"], input=manifest)
+
+    assert result.exit_code == 0
+    assert "<stdin>" in result.output
+
+
+def test_validate_cache_dir(manifest_dir, tmp_path_factory):
+    """Test --cache-dir gives the same output on a warm run."""
+    cache_dir = tmp_path_factory.mktemp("cache")
+    args = ["validate", str(manifest_dir), "--json", "--cache-dir", str(cache_dir)]
+
+    cold = CliRunner().invoke(main, args)
+    warm = CliRunner().invoke(main, args)
+
+    assert cold.exit_code == warm.exit_code == 1
+    assert json.loads(cold.output) == json.loads(warm.output)
+    # The four invalid manifests have identical content and share an entry
+    assert len(list(cache_dir.glob("*.json"))) == 9
+
+
+def test_validate_watch_rejects_jobs(manifest_dir):
+    """Test --watch refuses --jobs instead of ignoring it."""
+    result = CliRunner().invoke(main, ["validate", str(manifest_dir), "--watch", "-j", "2"])
+
+    assert result.exit_code == 2
+    assert "--jobs cannot be combined with --watch" in result.output
+
+
+def test_validate_verbose_skips_cache_dir(manifest_dir, tmp_path_factory):
+    """Test --verbose output, which previews manifests, is the same on every run."""
+    cache_dir = tmp_path_factory.mktemp("cache")
+    args = ["validate", str(manifest_dir), "--verbose", "--cache-dir", str(cache_dir)]
+
+    first = CliRunner().invoke(main, args)
+    second = CliRunner().invoke(main, args)
+
+    assert "Manifest preview" in second.output
+    assert first.output == second.output
+    assert list(cache_dir.glob("*.json")) == []
+
+
+def test_validate_timings(manifest_dir):
+    """Test --timings prints a per-stage breakdown summed over all files."""
+    result = CliRunner().invoke(main, ["validate", str(manifest_dir), "--timings"])
+
+    assert result.exit_code == 1
+    assert "Validation Timings (12 manifests)" in result.output
+    for stage in ("parse", "schema", "uris", "policies"):
+        assert stage in result.output
+
+
+def test_validate_profile_is_a_deprecated_alias(manifest_dir):
+    """Test the hidden --profile flag still prints timings, with a warning."""
+    result = CliRunner().invoke(main, ["validate", str(manifest_dir), "--profile"])
+
+    assert "Validation Timings (12 manifests)" in result.output
+    assert "--profile is deprecated" in result.output
+    assert "--profile" not in CliRunner().invoke(main, ["validate", "--help"]).output
+
+
+def test_validate_timings_json(ndjson_file):
+    """Test --timings with --json reports the breakdown as a JSON line on stderr."""
+    result = CliRunner().invoke(main, ["validate", "--ndjson", "--json", "--timings",
+                                       str(ndjson_file)])
+
+    profile = json.loads(result.output.splitlines()[-1])["profile"]
+    assert profile["validations"] == 4
+    assert profile["stages"]["parse"]["count"] == 4
+    assert profile["stages"]["uris"]["count"] == 3
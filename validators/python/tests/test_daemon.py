@@ -0,0 +1,161 @@
+"""Tests for the Unix-socket daemon."""
+
+import json
+import os
+import select
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+
+import pytest
+from jsonagents import daemon
+from jsonagents.bench import SHAPES, generate_manifest
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+
+
+@pytest.fixture
+def socket_path(monkeypatch):
+    # Unix socket paths are limited to ~100 bytes: keep them out of tmp_path
+    directory = tempfile.mkdtemp(prefix="ja-")
+    path = os.path.join(directory, "d.sock")
+    monkeypatch.setenv("JSONAGENTS_DAEMON_SOCKET", path)
+    monkeypatch.delenv("JSONAGENTS_NO_DAEMON", raising=False)
+    yield path
+    if os.path.exists(path):
+        os.unlink(path)
+    os.rmdir(directory)
+
+
+@pytest.fixture
+def running(socket_path):
+    thread = threading.Thread(target=daemon.serve, args=(socket_path, None), daemon=True)
+    thread.start()
+    for _ in range(200):
+        try:
+            daemon.request("ping", socket_path, timeout=1.0)
+            break
+        except daemon.DaemonError:
+            thread.join(0.05)
+    yield socket_path
+    daemon.request("stop", socket_path)
+    thread.join(5)
+    assert not thread.is_alive()
+
+
+def _forward(argv, capsys):
+    code = daemon.try_forward(argv)
+    out, err = capsys.readouterr()
+    return code, out, err
+
+
+@pytest.mark.parametrize("argv,expected", [
+    (["validate", "m.json"], True),
+    (["check-policy", "x"], True),
+    (["validate", "--watch", "."], False),
+    (["validate", "--ndjson", "export.ndjson"], False),
+    (["validate", "-"], False),
+    (["check-policy", "-"], False),
+    (["validate", "--help"], False),
+    (["serve"], False),
+    (["daemon", "start"], False),
+    ([], False),
+])
+def test_should_forward(monkeypatch, argv, expected):
+    """Test only short-lived commands are forwarded, unless disabled."""
+    monkeypatch.delenv("JSONAGENTS_NO_DAEMON", raising=False)
+    assert daemon.should_forward(argv) is expected
+
+    monkeypatch.setenv("JSONAGENTS_NO_DAEMON", "1")
+    assert not daemon.should_forward(argv)
+
+
+def test_no_daemon_runs_in_process(socket_path):
+    """Test forwarding gives up when nothing listens on the socket."""
+    assert daemon.try_forward(["check-policy", "tool.type == 'http'"]) is None
+    with pytest.raises(daemon.DaemonError):
+        daemon.request("ping", socket_path)
+
+
+def test_validate_files(running, tmp_path, capsys, monkeypatch):
+    """Test validate runs in the daemon relative to the caller's directory."""
+    (tmp_path / "good.json").write_text(json.dumps(generate_manifest(SHAPES["small"])))
+    (tmp_path / "bad.json").write_text(json.dumps({"manifest_version": "1.0"}))
+    monkeypatch.chdir(tmp_path)
+    cwd = os.getcwd()
+
+    code, out, _ = _forward(["validate", "--json", "good.json"], capsys)
+    assert code == 0
+    assert json.loads(out)[0]["valid"]
+
+    code, out, _ = _forward(["validate", "--json", "good.json", "bad.json"], capsys)
+    assert code == 1
+    assert [r["valid"] for r in json.loads(out)] == [True, False]
+    assert os.getcwd() == cwd
+
+    code, _, err = _forward(["validate", "missing.json"], capsys)
+    assert code == 2 and "does not exist" in err
+
+
+def test_ndjson_stdin_streams_in_process(running):
+    """Test `--ndjson -` answers each line before stdin is closed."""
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(daemon.__file__)))
+    env = dict(os.environ, PYTHONPATH=package_root, JSONAGENTS_DAEMON_SOCKET=running)
+    process = subprocess.Popen(
+        [sys.executable, "-u", "-m", "jsonagents", "validate", "--ndjson", "--json", "-"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=env,
+    )
+    try:
+        process.stdin.write(json.dumps(generate_manifest(SHAPES["small"])).encode() + b"\n")
+        process.stdin.flush()
+        ready, _, _ = select.select([process.stdout], [], [], 30)
+        assert ready, "no output before stdin was closed"
+        assert json.loads(process.stdout.readline())["valid"]
+        process.stdin.close()
+        assert process.wait(30) == 0
+    finally:
+        process.kill()
+        process.stdout.close()
+
+    assert daemon.request("ping", running)["requests"] == 0
+
+
+def test_check_commands(running, capsys):
+    """Test check-uri and check-policy output and exit codes."""
+    code, out, _ = _forward(["check-uri", "ajson://example.com/agents/a"], capsys)
+    assert code == 0 and "https://example.com/" in out
+
+    code, out, _ = _forward(["check-policy", "tool.type =="], capsys)
+    assert code == 1 and "Invalid" in out
+
+
+def test_status_and_version_mismatch(running, capsys, monkeypatch):
+    """Test ping reports counters and another version's daemon is not used."""
+    _forward(["check-policy", "tool.type == 'http'"], capsys)
+
+    info = daemon.request("ping", running)
+    assert info["status"] == "ok" and info["pid"] == os.getpid()
+    assert info["requests"] == 1 and info["socket"] == running
+
+    with monkeypatch.context() as patch:
+        patch.setattr(daemon, "__version__", "0.0.0")
+        assert daemon.try_forward(["check-policy", "tool.type == 'http'"]) is None
+    assert daemon.request("ping", running)["requests"] == 1
+
+
+def test_second_daemon_is_refused(running):
+    """Test starting a daemon on a live socket fails."""
+    with pytest.raises(daemon.DaemonError, match="already running"):
+        daemon.serve(running, None)
+
+
+def test_idle_timeout(socket_path):
+    """Test the daemon exits and removes its socket when idle."""
+    thread = threading.Thread(target=daemon.serve, args=(socket_path, 0.2), daemon=True)
+    thread.start()
+    thread.join(10)
+
+    assert not thread.is_alive()
+    assert not os.path.exists(socket_path)
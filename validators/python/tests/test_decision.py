@@ -0,0 +1,127 @@
+"""Tests for the policy decision engine."""
+
+import pytest
+from jsonagents import Decision, PolicyEngine
+
+
+MANIFEST = {
+    "policies": [
+        {
+            "id": "deny-external",
+            "effect": "deny",
+            "action": "tool.call",
+            "where": "tool.endpoint !~ 'internal.corp'",
+        },
+        {
+            "id": "allow-http",
+            "effect": "allow",
+            "action": "tool.call",
+            "where": "tool.type == 'http'",
+        },
+        {"id": "audit-tools", "effect": "audit", "action": "tool.*"},
+        {
+            "id": "notify-urgent",
+            "effect": "notify",
+            "action": "*",
+            "where": "message.priority > 5",
+        },
+        {"id": "allow-send", "effect": "allow", "action": "message.send"},
+    ]
+}
+
+INTERNAL_HTTP = {"tool": {"type": "http", "endpoint": "https://api.internal.corp/v1"}}
+
+
+def test_allow():
+    """Test a matching allow policy allows the action."""
+    decision = PolicyEngine.from_manifest(MANIFEST).decide("tool.call", INTERNAL_HTTP)
+
+    assert isinstance(decision, Decision)
+    assert decision.allowed
+    assert decision.policy_ids == ("allow-http",)
+    assert decision.audit == ("audit-tools",)
+    assert decision.notify == ()
+
+
+def test_deny_overrides_allow():
+    """Test a matching deny policy wins over a matching allow policy."""
+    context = {"tool": {"type": "http", "endpoint": "https://example.com"}}
+
+    decision = PolicyEngine.from_manifest(MANIFEST).decide("tool.call", context)
+
+    assert decision.effect == "deny"
+    assert decision.policy_ids == ("deny-external",)
+
+
+def test_default_effect():
+    """Test the default effect applies when no allow or deny policy matches."""
+    context = {"tool": {"type": "function", "endpoint": "https://api.internal.corp"}}
+
+    assert PolicyEngine.from_manifest(MANIFEST).decide("tool.call", context).effect == "deny"
+    decision = PolicyEngine.from_manifest(MANIFEST, default="allow").decide("tool.call", context)
+    assert decision.allowed
+    assert decision.is_default
+
+
+def test_only_candidate_policies():
+    """Test policies for other actions are not considered."""
+    engine = PolicyEngine.from_manifest(MANIFEST)
+
+    assert engine.candidates("message.send") == ("allow-send", "notify-urgent")
+    assert engine.candidates("tool.list") == ("audit-tools", "notify-urgent")
+
+    decision = engine.decide("message.send", {"message": {"priority": 9}})
+    assert decision.allowed
+    assert decision.notify == ("notify-urgent",)
+
+
+def test_decision_cache_keys_on_read_fields():
+    """Test contexts differing only in unread fields share a cached decision."""
+    engine = PolicyEngine.from_manifest(MANIFEST)
+    first = dict(INTERNAL_HTTP, agent={"id": "a"})
+    second = dict(INTERNAL_HTTP, agent={"id": "b"})
+
+    assert engine.decide("tool.call", first) is engine.decide("tool.call", second)
+    info = engine.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_decision_cache_distinguishes_bool_and_number():
+    """Test True and 1 do not share a cache entry."""
+    engine = PolicyEngine([
+        {"id": "flag", "effect": "allow", "action": "tool.call", "where": "tool.flag == true"},
+    ])
+
+    assert engine.decide("tool.call", {"tool": {"flag": True}}).allowed
+    assert not engine.decide("tool.call", {"tool": {"flag": 1}}).allowed
+
+
+def test_unhashable_values_bypass_cache():
+    """Test mapping values are evaluated without caching."""
+    engine = PolicyEngine([
+        {"id": "auth", "effect": "allow", "action": "tool.call", "where": "tool.auth"},
+    ])
+
+    assert engine.decide("tool.call", {"tool": {"auth": {"method": "oauth"}}}).allowed
+    assert engine.decide("tool.call", {"tool": {"auth": ["oauth"]}}).allowed
+    assert engine.cache_info().currsize == 1
+
+
+def test_invalid_policies():
+    """Test malformed policies and where clauses are rejected."""
+    with pytest.raises(ValueError, match="Policy\\[0\\].*Policy\\[1\\] has unknown effect"):
+        PolicyEngine([
+            {"id": "bad", "effect": "allow", "action": "tool.call", "where": "tool.type ==="},
+            {"id": "odd", "effect": "maybe", "action": "tool.call"},
+        ])
+
+    with pytest.raises(ValueError, match="default"):
+        PolicyEngine([], default="audit")
+
+
+def test_manifest_without_policies():
+    """Test a manifest without policies always yields the default effect."""
+    decision = PolicyEngine.from_manifest({}).decide("tool.call", {})
+
+    assert decision.effect == "deny"
+    assert decision.is_default
@@ -0,0 +1,164 @@
+"""Tests for concurrent graph ref resolution."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from jsonagents.dependencies import find_cycles, graph_refs, resolve_graph, resolve_graph_sync
+from jsonagents.resolver import Resolver
+
+
+def _agent(uri, refs=()):
+    return {
+        "agent": {"id": uri},
+        "graph": {"nodes": [{"id": f"n{i}", "ref": ref} for i, ref in enumerate(refs)]},
+    }
+
+
+def _publish_tree(origin, fanout, depth, prefix="a"):
+    """Publish a tree of agents and return the URI of its root."""
+    uri = f"ajson://{origin.authority}/agents/{prefix}"
+    children = []
+    if depth:
+        children = [_publish_tree(origin, fanout, depth - 1, f"{prefix}{i}") for i in range(fanout)]
+    origin.publish(prefix, _agent(uri, children))
+    return uri
+
+
+@pytest.fixture
+def resolver():
+    with Resolver(scheme="http", pool_size=16) as r:
+        yield r
+
+
+def test_graph_refs():
+    """Test only distinct ajson:// refs are collected."""
+    manifest = {"graph": {"nodes": [
+        {"id": "a", "ref": "ajson://x.com/a"},
+        {"id": "b", "ref": "ajson://x.com/a"},
+        {"id": "c", "ref": "https://x.com/c"},
+        {"id": "d"},
+    ]}}
+
+    assert graph_refs(manifest) == ("ajson://x.com/a",)
+    assert graph_refs({}) == ()
+
+
+def test_resolve_direct_refs_only(origin, resolver):
+    """Test non-transitive resolution stops after the manifest's own refs."""
+    child = _publish_tree(origin, fanout=2, depth=1, prefix="c")
+    root = _agent("ajson://example.com/agents/root", [child])
+
+    graph = resolve_graph_sync(root, resolver=resolver, transitive=False)
+
+    assert set(graph.nodes) == {child}
+    assert graph.depth[child] == 1
+    assert len(graph.truncated) == 2
+    assert not graph.is_complete
+
+
+def test_resolve_transitive(origin, resolver):
+    """Test transitive resolution fetches every reachable agent once."""
+    top = _publish_tree(origin, fanout=3, depth=2)
+    root = _agent("ajson://example.com/agents/root", [top])
+
+    graph = resolve_graph_sync(root, resolver=resolver)
+
+    assert len(graph.nodes) == 1 + 3 + 9
+    assert len(origin.hits) == 13
+    assert graph.is_complete
+    assert max(graph.depth.values()) == 3
+    assert graph.edges["ajson://example.com/agents/root"] == (top,)
+
+
+def test_wall_clock_tracks_depth(origin, resolver):
+    """Test fetches at the same depth overlap."""
+    top = _publish_tree(origin, fanout=6, depth=1)
+    origin.delay = 0.2
+
+    started = time.perf_counter()
+    graph = resolve_graph_sync(_agent("ajson://example.com/agents/root", [top]), resolver=resolver)
+    elapsed = time.perf_counter() - started
+
+    assert len(graph.nodes) == 7
+    assert elapsed < 7 * 0.2
+
+
+def test_per_host_limit(origin, resolver):
+    """Test no more than per_host fetches hit one host at a time."""
+    top = _publish_tree(origin, fanout=8, depth=1)
+    origin.delay = 0.05
+
+    resolve_graph_sync(_agent("ajson://example.com/agents/root", [top]),
+                       resolver=resolver, per_host=2)
+
+    assert origin.max_active <= 2
+
+
+def test_cycles_terminate_and_are_reported(origin, resolver):
+    """Test a ref cycle is fetched once per agent and reported."""
+    a = f"ajson://{origin.authority}/agents/a"
+    b = f"ajson://{origin.authority}/agents/b"
+    origin.publish("a", _agent(a, [b]))
+    origin.publish("b", _agent(b, [a]))
+
+    graph = resolve_graph_sync(_agent("ajson://example.com/agents/root", [a]), resolver=resolver)
+
+    assert len(origin.hits) == 2
+    assert graph.cycles == [(a, b, a)]
+
+
+def test_depth_limit(origin, resolver):
+    """Test refs beyond max_depth are reported as truncated."""
+    top = _publish_tree(origin, fanout=1, depth=4)
+
+    graph = resolve_graph_sync(_agent("ajson://example.com/agents/root", [top]),
+                               resolver=resolver, max_depth=2)
+
+    assert len(graph.nodes) == 2
+    assert graph.truncated == (f"ajson://{origin.authority}/agents/a00",)
+
+
+def test_errors_are_collected(origin, resolver):
+    """Test failed fetches are recorded without aborting the others."""
+    good = _publish_tree(origin, fanout=0, depth=0, prefix="good")
+    missing = f"ajson://{origin.authority}/agents/missing"
+
+    graph = resolve_graph_sync(_agent("ajson://example.com/agents/root", [good, missing]),
+                               resolver=resolver)
+
+    assert set(graph.nodes) == {good}
+    assert "HTTP 404" in graph.errors[missing]
+
+
+def test_failure_leaves_nothing_running(origin, resolver, monkeypatch):
+    """Test an unexpected fetch error waits for in-flight fetches before raising."""
+    slow = [_publish_tree(origin, fanout=0, depth=0, prefix=f"slow{i}") for i in range(4)]
+    broken = f"ajson://{origin.authority}/agents/broken"
+    origin.delay = 0.2
+    resolve = resolver.resolve
+
+    def fail_one(uri, refresh=False):
+        if uri == broken:
+            raise RuntimeError("boom")
+        return resolve(uri, refresh)
+
+    monkeypatch.setattr(resolver, "resolve", fail_one)
+
+    async def run():
+        with pytest.raises(RuntimeError, match="boom"):
+            await resolve_graph(_agent("ajson://example.com/agents/root", slow + [broken]),
+                                resolver=resolver)
+        return asyncio.all_tasks() - {asyncio.current_task()}
+
+    assert asyncio.run(run()) == set()
+    assert origin.active == 0
+    assert not [t for t in threading.enumerate() if t.name.startswith("jsonagents-resolve")]
+
+
+def test_find_cycles():
+    """Test back edges are reported as cycles."""
+    edges = {"r": ("a",), "a": ("b", "c"), "b": ("a",), "c": ("c",)}
+
+    assert find_cycles(edges, "r") == [("a", "b", "a"), ("c", "c")]
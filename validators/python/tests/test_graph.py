@@ -0,0 +1,129 @@
+"""Tests for graph topology analysis."""
+
+import random
+import time
+
+from jsonagents.graph import analyze_graph, strongly_connected_components
+
+
+def _graph(node_ids, edges):
+    return {
+        "nodes": [{"id": n, "ref": f"ajson://example.com/agents/{n}"} for n in node_ids],
+        "edges": [{"from": a, "to": b} for a, b in edges],
+    }
+
+
+def test_clean_graph():
+    """Test an acyclic, connected graph has no findings."""
+    analysis = analyze_graph(_graph(["router", "faq", "billing"],
+                                    [("router", "faq"), ("router", "billing")]))
+
+    assert analysis.findings == ()
+    assert analysis.entries == ("router",)
+
+
+def test_duplicate_node_ids():
+    """Test duplicate ids are errors."""
+    analysis = analyze_graph(_graph(["a", "b", "a"], [("a", "b")]))
+
+    (finding,) = analysis.errors
+    assert finding.code == "duplicate-node"
+    assert finding.message == "Graph node[2] duplicates id 'a' (first defined at node[0])"
+
+
+def test_dangling_edges():
+    """Test edges naming unknown nodes are errors."""
+    analysis = analyze_graph(_graph(["a", "b"], [("a", "b"), ("a", "ghost"), ("nope", "b")]))
+
+    assert [(f.code, f.edge, f.nodes) for f in analysis.errors] == [
+        ("dangling-edge", 1, ("ghost",)),
+        ("dangling-edge", 2, ("nope",)),
+    ]
+    assert analysis.errors[0].message == "Edge[1] 'to' references unknown node 'ghost'"
+
+
+def test_cycles_are_informational():
+    """Test cycles and self-loops are reported as info, not warnings."""
+    analysis = analyze_graph(_graph(
+        ["entry", "a", "b", "c", "d"],
+        [("entry", "a"), ("a", "b"), ("b", "c"), ("c", "a"), ("entry", "d"), ("d", "d")],
+    ))
+
+    assert analysis.errors == () and analysis.warnings == ()
+    assert sorted(sorted(c) for c in analysis.cycles) == [["a", "b", "c"], ["d"]]
+    assert [f.code for f in analysis.info] == ["cycle", "cycle"]
+
+
+def test_unreachable_nodes():
+    """Test nodes not reachable from entry nodes are reported."""
+    analysis = analyze_graph(_graph(["a", "b", "x", "y"], [("a", "b"), ("x", "y"), ("y", "x")]))
+
+    assert analysis.entries == ("a",)
+    assert analysis.unreachable == ("x", "y")
+    assert [f.code for f in analysis.warnings] == ["unreachable"]
+
+
+def test_explicit_entries():
+    """Test reachability from caller-supplied entry nodes."""
+    analysis = analyze_graph(_graph(["a", "b", "c"], [("a", "b")]), entries=["b"])
+
+    assert analysis.unreachable == ("a", "c")
+
+
+def test_all_nodes_in_cycle_uses_first_node_as_entry():
+    """Test a graph without in-degree-zero nodes starts from its first node."""
+    analysis = analyze_graph(_graph(["a", "b"], [("a", "b"), ("b", "a")]))
+
+    assert analysis.entries == ("a",)
+    assert analysis.unreachable == ()
+
+
+def test_isolated_node_does_not_hide_the_main_graph():
+    """Test the first node stays an entry next to nodes without incoming edges."""
+    analysis = analyze_graph(_graph(["router", "faq", "orphan"],
+                                    [("router", "faq"), ("faq", "router")]))
+
+    assert analysis.entries == ("router", "orphan")
+    assert analysis.unreachable == ()
+    assert analysis.warnings == ()
+
+
+def _brute_force_components(adjacency):
+    n = len(adjacency)
+    reach = []
+    for v in range(n):
+        seen, stack = {v}, [v]
+        while stack:
+            for w in adjacency[stack.pop()]:
+                if w not in seen:
+                    seen.add(w)
+                    stack.append(w)
+        reach.append(seen)
+    return {frozenset(w for w in reach[v] if v in reach[w]) for v in range(n)}
+
+
+def test_tarjan_matches_brute_force():
+    """Test SCCs agree with mutual reachability on random graphs."""
+    rng = random.Random(7)
+    for _ in range(50):
+        n = rng.randint(1, 30)
+        adjacency = [[rng.randrange(n) for _ in range(rng.randint(0, 3))] for _ in range(n)]
+
+        components = strongly_connected_components(adjacency)
+
+        assert {frozenset(c) for c in components} == _brute_force_components(adjacency)
+        assert sorted(v for c in components for v in c) == list(range(n))
+
+
+def test_large_graph_is_linear():
+    """Test a deep chain with thousands of nodes is analyzed quickly and without recursion."""
+    count = 50000
+    ids = [f"n{i}" for i in range(count)]
+    edges = [(ids[i], ids[i + 1]) for i in range(count - 1)] + [(ids[-1], ids[0])]
+
+    started = time.perf_counter()
+    analysis = analyze_graph(_graph(ids, edges))
+
+    assert time.perf_counter() - started < 5
+    assert len(analysis.cycles) == 1 and len(analysis.cycles[0]) == count
+    assert "and 49990 more" in analysis.info[0].message
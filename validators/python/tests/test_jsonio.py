@@ -0,0 +1,97 @@
+"""Tests for the pluggable JSON parsing layer."""
+
+import json
+
+import pytest
+from jsonagents import jsonio
+from jsonagents.jsonio import get_backend, load_path, loads
+from jsonagents.validator import Validator
+
+
+DOCUMENT = {"agent": {"id": "ajson://example.com/agents/a", "name": "Ünïcode"}, "n": [1, 2.5, None]}
+
+
+def _backend(name):
+    if name != "json":
+        pytest.importorskip(name)
+    return get_backend(name)
+
+
+@pytest.fixture(params=["json", "orjson", "msgspec"])
+def backend(request):
+    return _backend(request.param)
+
+
+def test_auto_backend_prefers_fast_parsers():
+    """Test the default backend is the first installed one."""
+    assert get_backend().name in jsonio.BACKEND_NAMES
+    assert get_backend("auto") == get_backend()
+
+
+def test_unknown_backend():
+    """Test unknown backend names are rejected."""
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        get_backend("simplejson")
+
+
+@pytest.mark.parametrize("convert", [bytes, bytearray, memoryview, lambda b: b.decode()])
+def test_loads_buffer_types(backend, convert):
+    """Test every backend parses bytes-like input and str."""
+    raw = json.dumps(DOCUMENT).encode()
+
+    assert loads(convert(raw), backend) == DOCUMENT
+
+
+def test_fast_backend_falls_back_to_stdlib(backend):
+    """Test documents a fast parser rejects still parse like the stdlib."""
+    raw = b'{"big": 123456789012345678901234567890, "nan": NaN}'
+
+    parsed = loads(raw, backend)
+
+    assert parsed["big"] == 123456789012345678901234567890
+    assert parsed["nan"] != parsed["nan"]
+
+
+def test_errors_match_stdlib(backend):
+    """Test invalid documents raise the stdlib error and message."""
+    with pytest.raises(json.JSONDecodeError) as expected:
+        json.loads(b'{"a": }')
+    with pytest.raises(json.JSONDecodeError) as actual:
+        loads(b'{"a": }', backend)
+
+    assert str(actual.value) == str(expected.value)
+
+
+def test_load_path_mmap(backend, tmp_path, monkeypatch):
+    """Test large files are parsed through a memory map."""
+    monkeypatch.setattr(jsonio, "MMAP_THRESHOLD", 1)
+    path = tmp_path / "doc.json"
+    path.write_text(json.dumps(DOCUMENT), encoding="utf-8")
+
+    assert load_path(path, backend) == DOCUMENT
+
+
+def test_load_path_empty_file(backend, tmp_path):
+    """Test an empty file is invalid JSON rather than an mmap error."""
+    path = tmp_path / "empty.json"
+    path.write_bytes(b"")
+
+    with pytest.raises(json.JSONDecodeError):
+        load_path(path, backend)
+
+
+def test_validator_accepts_memoryview():
+    """Test raw memoryview manifests validate like bytes."""
+    raw = json.dumps({
+        "manifest_version": "1.0",
+        "profiles": ["core"],
+        "agent": {"id": "ajson://example.com/agents/view", "name": "View", "version": "1.0.0"},
+        "capabilities": [{"id": "echo", "description": "Echo"}],
+        "modalities": {"input": ["text"], "output": ["text"]},
+    }).encode()
+    validator = Validator(json_backend="json")
+
+    assert validator.validate(memoryview(raw)).is_valid
+    results = [r for _, r in validator.validate_many([memoryview(raw)] * 2, executor="process",
+                                                      max_workers=2)]
+    assert all(r.is_valid for r in results)
@@ -0,0 +1,111 @@
+"""Tests for memoized URI and policy validation."""
+
+import dataclasses
+import pytest
+from jsonagents.lru import LRUCache
+from jsonagents.policy import PolicyValidator
+from jsonagents.uri import URIValidator
+from jsonagents.validator import Validator
+
+
+def test_lru_counts_hits_misses_evictions():
+    """Test the LRU cache counters and eviction order."""
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1      # 'a' becomes most recent
+    cache.put("c", 3)               # evicts 'b'
+
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    info = cache.info()
+    assert (info.hits, info.misses, info.evictions) == (2, 1, 1)
+    assert (info.maxsize, info.currsize) == (2, 2)
+
+
+def test_lru_disabled():
+    """Test a zero-sized cache stores nothing."""
+    cache = LRUCache(maxsize=0)
+    cache.put("a", 1)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_lru_rejects_negative_size():
+    """Test negative capacities are rejected."""
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=-1)
+
+
+def test_policy_validation_is_memoized():
+    """Test repeated expressions are served from the cache."""
+    validator = PolicyValidator(cache_size=8)
+
+    first = validator.validate("tool.type == 'http'")
+    second = validator.validate("tool.type == 'http'")
+
+    assert first is second
+    info = validator.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_uri_validation_is_memoized():
+    """Test repeated URIs are served from the cache."""
+    validator = URIValidator(cache_size=8)
+
+    first = validator.validate("ajson://example.com/agents/a")
+    second = validator.validate("ajson://example.com/agents/a")
+
+    assert first is second
+    assert validator.cache_info().hits == 1
+
+
+def test_cached_results_are_immutable():
+    """Test cached results cannot be mutated by callers."""
+    policy_result = PolicyValidator().validate("tool.type === 'http'")
+    uri_result = URIValidator().validate("ajson://example.com/agents/a")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        policy_result.is_valid = True
+    with pytest.raises(AttributeError):
+        policy_result.errors.append("extra")
+    with pytest.raises(TypeError):
+        uri_result.parsed["path"] = "/other"
+
+
+def test_clear_cache_resets_counters():
+    """Test clearing the memoization cache."""
+    validator = PolicyValidator()
+    validator.validate("tool.type == 'http'")
+    validator.clear_cache()
+
+    info = validator.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+
+
+def test_validator_shares_memoization_across_manifests():
+    """Test a Validator pays once per distinct URI and expression."""
+    manifest = {
+        "manifest_version": "1.0",
+        "profiles": ["core", "gov"],
+        "agent": {
+            "id": "ajson://example.com/agents/test",
+            "name": "Test Agent",
+            "version": "1.0.0"
+        },
+        "capabilities": [{"id": "echo", "description": "Echo service"}],
+        "modalities": {"input": ["text"], "output": ["text"]},
+        "policies": [
+            {"id": "p1", "effect": "deny", "action": "tool.call", "where": "tool.type == 'http'"},
+            {"id": "p2", "effect": "deny", "action": "tool.call", "where": "tool.type == 'http'"},
+        ],
+    }
+    validator = Validator(cache_size=16)
+
+    for _ in range(5):
+        assert validator.validate(manifest).is_valid
+
+    assert validator.policy_validator.cache_info().misses == 1
+    assert validator.policy_validator.cache_info().hits == 9
+    assert validator.uri_validator.cache_info().misses == 1
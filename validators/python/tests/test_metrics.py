@@ -0,0 +1,140 @@
+"""Tests for the metrics interface and Prometheus exporter."""
+
+import json
+
+import pytest
+from jsonagents.bench import SHAPES, generate_manifest
+from jsonagents.metrics import NULL_METRICS, Registry, get_metrics, set_metrics
+from jsonagents.policy import PolicyValidator
+from jsonagents.uri import URIValidator
+from jsonagents.validator import Validator
+
+
+@pytest.fixture
+def registry():
+    return Registry()
+
+
+def test_default_metrics_are_disabled():
+    """Test validators report into a no-op sink unless configured."""
+    assert get_metrics() is NULL_METRICS
+    assert not Validator().metrics.enabled
+    assert Validator().validate(generate_manifest(SHAPES["small"])).profile is None
+
+
+def test_validator_counts_and_stages(registry):
+    """Test validated/failed counters, errors by category and stage histograms."""
+    validator = Validator(metrics=registry)
+
+    validator.validate(generate_manifest(SHAPES["medium"]))
+    result = validator.validate({"manifest_version": "1.0", "agent": {"id": "ajson:bad"}})
+
+    assert result.profile is None
+    assert registry.value("jsonagents_manifests_validated_total") == 2
+    assert registry.value("jsonagents_manifests_failed_total") == 1
+    schema_errors = sum(e.startswith("Schema error") for e in result.errors)
+    assert registry.value("jsonagents_validation_errors_total", {"category": "schema"}) == schema_errors
+    assert registry.value("jsonagents_validation_errors_total", {"category": "uris"}) == 1
+    for stage in ("parse", "schema", "uris", "policies"):
+        count, _ = registry.histogram("jsonagents_validation_stage_seconds", {"stage": stage})
+        assert count == 2
+    assert registry.histogram("jsonagents_validation_seconds")[0] == 2
+
+
+def test_uri_and_policy_cache_hits(registry):
+    """Test URI and policy checks count results and memoization hits."""
+    uris = URIValidator(metrics=registry)
+    policies = PolicyValidator(metrics=registry)
+
+    for _ in range(3):
+        uris.validate("ajson://example.com/agents/a")
+        policies.validate("tool.type == 'http'")
+    uris.validate("ajson:bad")
+
+    assert registry.value("jsonagents_cache_hits_total", {"cache": "uri"}) == 2
+    assert registry.value("jsonagents_cache_misses_total", {"cache": "uri"}) == 2
+    assert registry.value("jsonagents_uri_checks_total", {"result": "invalid"}) == 1
+    assert registry.value("jsonagents_cache_hits_total", {"cache": "policy"}) == 2
+    assert registry.value("jsonagents_policy_checks_total", {"result": "valid"}) == 3
+
+
+def test_result_cache_hits(registry, tmp_path):
+    """Test persistent result cache hits are counted."""
+    validator = Validator(metrics=registry, cache_dir=tmp_path)
+    raw = json.dumps(generate_manifest(SHAPES["small"])).encode()
+
+    validator.validate(raw)
+    validator.validate(raw)
+
+    assert registry.value("jsonagents_cache_hits_total", {"cache": "result"}) == 1
+    assert registry.value("jsonagents_cache_misses_total", {"cache": "result"}) == 1
+
+
+def test_process_pool_results_are_recorded(registry):
+    """Test results computed in worker processes are recorded in the parent."""
+    validator = Validator(metrics=registry)
+    raw = json.dumps(generate_manifest(SHAPES["small"])).encode()
+
+    results = [r for _, r in validator.validate_many([raw] * 3, executor="process", max_workers=2)]
+
+    assert all(r.profile is None for r in results)
+    assert registry.value("jsonagents_manifests_validated_total") == 3
+    assert registry.histogram("jsonagents_validation_stage_seconds", {"stage": "schema"})[0] == 3
+
+
+def test_process_wide_metrics(registry):
+    """Test set_metrics() applies to validators without their own metrics."""
+    set_metrics(registry)
+    try:
+        Validator().validate(generate_manifest(SHAPES["small"]))
+    finally:
+        set_metrics(None)
+
+    assert registry.value("jsonagents_manifests_validated_total") == 1
+    assert get_metrics() is NULL_METRICS
+
+
+def test_prometheus_text_format():
+    """Test counters and cumulative histogram buckets in the exposition format."""
+    registry = Registry(buckets=(0.1, 1.0))
+    registry.inc("jsonagents_manifests_validated_total", 2)
+    registry.inc("custom_total", labels={"path": 'a"b\\c'})
+    for value in (0.05, 0.5, 5.0):
+        registry.observe("jsonagents_validation_stage_seconds", value, {"stage": "schema"})
+
+    text = registry.to_prometheus()
+
+    assert text.splitlines() == [
+        "# TYPE custom_total counter",
+        'custom_total{path="a\\"b\\\\c"} 1',
+        "# HELP jsonagents_manifests_validated_total Manifests validated",
+        "# TYPE jsonagents_manifests_validated_total counter",
+        "jsonagents_manifests_validated_total 2",
+        "# HELP jsonagents_validation_stage_seconds Validation latency by stage",
+        "# TYPE jsonagents_validation_stage_seconds histogram",
+        'jsonagents_validation_stage_seconds_bucket{stage="schema",le="0.1"} 1',
+        'jsonagents_validation_stage_seconds_bucket{stage="schema",le="1"} 2',
+        'jsonagents_validation_stage_seconds_bucket{stage="schema",le="+Inf"} 3',
+        'jsonagents_validation_stage_seconds_sum{stage="schema"} 5.55',
+        'jsonagents_validation_stage_seconds_count{stage="schema"} 3',
+    ]
+    assert Registry().to_prometheus() == ""
+
+
+def test_prometheus_nan_values():
+    """Test NaN counters and observations are exported as NaN."""
+    registry = Registry(buckets=(1.0,))
+    registry.inc("custom_total", float("nan"))
+    registry.observe("custom_seconds", float("nan"))
+
+    lines = registry.to_prometheus().splitlines()
+
+    assert "custom_total NaN" in lines
+    assert "custom_seconds_sum NaN" in lines
+    assert 'custom_seconds_bucket{le="+Inf"} 1' in lines
+
+
+def test_buckets_must_be_sorted():
+    """Test unsorted histogram buckets are rejected."""
+    with pytest.raises(ValueError, match="ascending"):
+        Registry(buckets=(1.0, 0.1))
@@ -291,3 +291,185 @@ def test_literal_string_double_quote():
     result = validator.validate('tool.type == "http"')
     
     assert result.is_valid
+
+
+def test_parse_returns_tree():
+    """Test parsing builds a typed syntax tree with source spans."""
+    from jsonagents.policy_ast import Compare, Literal, Logical, Path
+
+    validator = PolicyValidator()
+    expression = "tool.type == 'http' && tool.auth.method != 'none'"
+    tree = validator.parse(expression)
+
+    assert isinstance(tree, Logical)
+    assert tree.op == "and"
+    left, right = tree.operands
+    assert isinstance(left, Compare) and left.op == "=="
+    assert isinstance(left.left, Path) and left.left.parts == ("tool", "type")
+    assert isinstance(left.right, Literal) and left.right.value == "http"
+    assert right.left.dotted == "tool.auth.method"
+    assert expression[slice(*left.span)] == "tool.type == 'http'"
+    assert expression[slice(*right.left.span)] == "tool.auth.method"
+
+
+def test_parse_precedence():
+    """Test 'and' binds tighter than 'or' and 'not' covers a comparison."""
+    from jsonagents.policy_ast import Compare, Logical, Not
+
+    tree = PolicyValidator().parse("not tool.a == 1 or tool.b == 2 and tool.c == 3")
+
+    assert isinstance(tree, Logical) and tree.op == "or"
+    assert isinstance(tree.operands[0], Not)
+    assert isinstance(tree.operands[0].operand, Compare)
+    assert isinstance(tree.operands[1], Logical) and tree.operands[1].op == "and"
+
+
+def test_parse_literals_and_indexes():
+    """Test literal values, arrays and indexed accessors."""
+    from jsonagents.policy_ast import Array, paths
+
+    tree = PolicyValidator().parse(
+        "tool.args[0] in [1, 2.5, true, null, 'it\\'s'] || tool.headers['x-id'] == -3"
+    )
+
+    first, second = tree.operands
+    assert isinstance(first.right, Array)
+    assert [item.value for item in first.right.items] == [1, 2.5, True, None, "it's"]
+    assert second.right.value == -3
+    assert [p.parts for p in paths(tree)] == [("tool", "args", 0), ("tool", "headers", "x-id")]
+
+
+def test_parse_raises_syntax_error():
+    """Test parse() raises PolicySyntaxError for malformed input."""
+    from jsonagents.policy_ast import PolicySyntaxError
+
+    with pytest.raises(PolicySyntaxError) as exc_info:
+        PolicyValidator().parse("tool.type == ")
+
+    assert "operand" in str(exc_info.value)
+
+
+def test_validate_result_carries_tree():
+    """Test validation results expose the parsed tree for reuse."""
+    validator = PolicyValidator()
+
+    assert validator.validate("tool.type == 'http'").tree is not None
+    assert validator.validate("tool.type === 'http'").tree is None
+
+
+def test_keyword_prefixed_identifiers():
+    """Test identifiers containing operator keywords are not split."""
+    from jsonagents.policy_ast import paths
+
+    validator = PolicyValidator()
+    result = validator.validate("tool.containsx == 1 && tool.index in [1] && tool.notify == true")
+
+    assert result.is_valid
+    assert [p.dotted for p in paths(result.tree)] == [
+        "tool.containsx", "tool.index", "tool.notify"
+    ]
+
+
+def test_invalid_regex_literal():
+    """Test regex operands are compiled during validation."""
+    validator = PolicyValidator()
+    result = validator.validate("tool.endpoint ~ '(unclosed'")
+
+    assert not result.is_valid
+    assert any("regular expression" in error for error in result.errors)
+
+
+def test_chained_comparison():
+    """Test chained comparisons are rejected."""
+    validator = PolicyValidator()
+    result = validator.validate("tool.a == tool.b == tool.c")
+
+    assert not result.is_valid
+    assert any("chained" in error for error in result.errors)
+
+
+def test_array_items_must_be_literals():
+    """Test arrays only hold literal values."""
+    validator = PolicyValidator()
+    result = validator.validate("tool.type in [tool.other]")
+
+    assert not result.is_valid
+    assert any("literal" in error for error in result.errors)
+
+
+def test_missing_operator_between_operands():
+    """Test adjacent operands without an operator."""
+    validator = PolicyValidator()
+    result = validator.validate("tool.type 'http'")
+
+    assert not result.is_valid
+    assert any("expected an operator" in error for error in result.errors)
+
+
+def test_tokenize_typed_tokens_with_offsets():
+    """Test the tokenizer emits typed tokens with source offsets."""
+    from jsonagents.policy_ast import EOF, LITERAL, NAME, OP, tokenize
+
+    expression = "tool.type not in ['a', \"b\"] && tool.n >= -1.5"
+    tokens, errors = tokenize(expression)
+
+    assert errors == []
+    assert tokens[-1].kind == EOF
+    assert [t.kind for t in tokens[:4]] == [NAME, ".", NAME, OP]
+    assert tokens[3].value == "not in"
+    assert [t.value for t in tokens if t.kind == LITERAL] == ["a", "b", -1.5]
+    for token in tokens[:-1]:
+        assert expression[token.start:token.end] == token.text
+
+
+@pytest.mark.parametrize("expression,number", [
+    ("tool.x == 1.5.3", "1.5.3"),
+    ("tool.x == 12abc", "12abc"),
+    ("tool.x == -1.", "-1."),
+])
+def test_invalid_number_message(expression, number):
+    """Test malformed numbers are reported whole, at their offset."""
+    result = PolicyValidator().validate(expression)
+
+    assert result.errors == (f"Invalid number '{number}' at offset 10",)
+
+
+def test_tokenize_keywords_need_word_boundaries():
+    """Test keywords inside identifiers stay part of the identifier."""
+    from jsonagents.policy_ast import NAME, tokenize
+
+    tokens, _ = tokenize("tool.contains_list == tool.inbox && tool.nothing == tool.ending")
+
+    assert [t.text for t in tokens if t.kind == NAME] == [
+        "tool", "contains_list", "tool", "inbox", "tool", "nothing", "tool", "ending"
+    ]
+
+
+def test_tokenize_many_literals_is_linear():
+    """Test tokenizing scales linearly with the number of string literals."""
+    import time
+    from jsonagents.policy_ast import tokenize
+
+    def best_time(count):
+        expression = " || ".join(f"tool.f{i} == 'value {i}'" for i in range(count))
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            tokens, errors = tokenize(expression)
+            timings.append(time.perf_counter() - start)
+        assert not errors and len(tokens) == count * 6
+        return min(timings)
+
+    small, large = best_time(1000), best_time(8000)
+
+    # Quadratic scanning would be ~64x slower; allow generous noise
+    assert large < small * 20
+
+
+def test_deeply_nested_expression():
+    """Test pathological nesting is reported instead of crashing."""
+    validator = PolicyValidator()
+    result = validator.validate("(" * 5000 + "tool.a == 1" + ")" * 5000)
+
+    assert not result.is_valid
+    assert any("nested" in error for error in result.errors)
@@ -0,0 +1,168 @@
+"""Tests for column-wise batch policy evaluation."""
+
+import random
+
+import pytest
+from jsonagents.policy_batch import flatten
+from jsonagents.policy_eval import compile_policy
+
+
+EXPRESSIONS = [
+    "tool.type == 'http' && tool.auth.method != 'none'",
+    "tool.type in ['http', 'function'] and message.priority > 5",
+    "not (tool.retries >= 2) || tool.enabled == true",
+    "tool.type not in ['system'] and tool.retries != 1",
+    "tool.endpoint ~ '^https://' or tool.endpoint starts_with 'http'",
+    "message.tags contains 'alpha' and message.priority <= 3",
+    "tool.enabled",
+    "tool.retries == 1.0 || tool.retries < 0",
+    "message.tags[0] == 'alpha'",
+]
+
+BACKENDS = ["python", "numpy"]
+
+
+def _random_context(rng):
+    """Build a context with missing keys, nulls and mixed value types."""
+    tool = {}
+    if rng.random() < 0.9:
+        tool["type"] = rng.choice(["http", "function", "system", None, 1])
+    if rng.random() < 0.8:
+        tool["auth"] = rng.choice([{"method": "none"}, {"method": "oauth"}, {}, None, "x"])
+    if rng.random() < 0.8:
+        tool["retries"] = rng.choice([0, 1, 1.0, 2, 3.5, True, "2", None, 2 ** 60])
+    if rng.random() < 0.7:
+        tool["enabled"] = rng.choice([True, False, 1, 0, None])
+    if rng.random() < 0.7:
+        tool["endpoint"] = rng.choice(["https://a.example", "http://b.example", "ftp://c", 7])
+    context = {"tool": tool}
+    if rng.random() < 0.8:
+        context["message"] = {
+            "priority": rng.choice([1, 3, 5, 9, "high", None]),
+            "tags": rng.choice([["alpha", "beta"], ["beta"], [], "alphabet", None]),
+        }
+    return context
+
+
+@pytest.fixture(scope="module")
+def contexts():
+    rng = random.Random(42)
+    return [_random_context(rng) for _ in range(2000)]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    return request.param
+
+
+@pytest.mark.parametrize("expression", EXPRESSIONS)
+def test_batch_matches_row_evaluation(expression, contexts, backend):
+    """Test batch masks agree with per-row evaluation on every context."""
+    policy = compile_policy(expression)
+
+    mask = policy.evaluate_batch(contexts, backend=backend)
+
+    assert [bool(value) for value in mask] == [policy(context) for context in contexts]
+
+
+@pytest.mark.parametrize("expression", [
+    "tool.retries == 9007199254740993",
+    "tool.retries != 9007199254740993",
+    "tool.retries < 9007199254740993",
+    "tool.retries >= -9007199254740993",
+])
+def test_batch_matches_row_evaluation_for_large_literals(expression, backend):
+    """Test integer literals beyond float precision are compared exactly."""
+    contexts = [{"tool": {"retries": value}} for value in
+                [2 ** 53, 2 ** 53 - 1, -(2 ** 53), 1, 1.5, None]]
+    policy = compile_policy(expression)
+
+    mask = policy.evaluate_batch(contexts, backend=backend)
+
+    assert [bool(value) for value in mask] == [policy(context) for context in contexts]
+
+
+def test_python_backend_returns_list(contexts):
+    """Test the pure-Python backend returns a list of bools."""
+    mask = compile_policy("tool.type == 'http'").evaluate_batch(contexts[:10], backend="python")
+
+    assert isinstance(mask, list)
+    assert all(type(value) is bool for value in mask)
+
+
+def test_numpy_backend_returns_bool_array(contexts):
+    """Test the NumPy backend returns a bool array."""
+    numpy = pytest.importorskip("numpy")
+
+    mask = compile_policy("tool.type == 'http'").evaluate_batch(contexts[:10], backend="numpy")
+
+    assert isinstance(mask, numpy.ndarray)
+    assert mask.dtype == bool
+    assert mask.shape == (10,)
+
+
+def test_batch_accepts_iterator(backend):
+    """Test contexts may be a one-shot iterator."""
+    rows = iter([{"tool": {"type": "http"}}, {"tool": {"type": "function"}}])
+
+    mask = compile_policy("tool.type == 'http'").evaluate_batch(rows, backend=backend)
+
+    assert list(mask) == [True, False]
+
+
+def test_batch_empty(backend):
+    """Test an empty batch yields an empty mask."""
+    mask = compile_policy("tool.type == 'http' && message.priority > 1").evaluate_batch(
+        [], backend=backend
+    )
+
+    assert len(mask) == 0
+
+
+def test_evaluate_columns(backend):
+    """Test columnar input keyed by dotted path."""
+    policy = compile_policy("tool.type == 'http' && tool.auth.method != 'none'")
+
+    mask = policy.evaluate_columns(
+        {"tool.type": ["http", "http", "function"], "tool.auth.method": ["oauth", "none", "oauth"]},
+        backend=backend,
+    )
+
+    assert list(mask) == [True, False, False]
+
+
+def test_evaluate_columns_missing_column_is_null(backend):
+    """Test accessors without a column evaluate to null."""
+    policy = compile_policy("tool.type == 'http' && tool.auth.method != 'none'")
+
+    mask = policy.evaluate_columns({"tool.type": ["http", "function"]}, backend=backend)
+
+    assert list(mask) == [True, False]
+
+
+def test_evaluate_columns_length_mismatch():
+    """Test columns of different lengths are rejected."""
+    policy = compile_policy("tool.type == 'http' && message.priority > 1")
+
+    with pytest.raises(ValueError, match="different lengths"):
+        policy.evaluate_columns({"tool.type": ["http"], "message.priority": [1, 2]})
+
+
+def test_unknown_backend():
+    """Test an unknown backend name is rejected."""
+    with pytest.raises(ValueError, match="Unknown backend"):
+        compile_policy("tool.enabled").evaluate_batch([], backend="gpu")
+
+
+def test_flatten_shares_prefixes():
+    """Test flatten walks shared prefixes once and fills missing values with None."""
+    rows = [{"tool": {"type": "http", "auth": {"method": "oauth"}}}, {"tool": None}, {}]
+
+    columns = flatten(rows, [("tool", "type"), ("tool", "auth", "method")])
+
+    assert columns == {
+        ("tool", "type"): ["http", None, None],
+        ("tool", "auth", "method"): ["oauth", None, None],
+    }
@@ -0,0 +1,114 @@
+"""Tests for compiled policy evaluation."""
+
+import pytest
+from jsonagents.policy import PolicyValidator
+from jsonagents.policy_ast import PolicySyntaxError
+from jsonagents.policy_eval import CompiledPolicy, compile_policy
+
+
+CONTEXT = {
+    "tool": {
+        "type": "http",
+        "endpoint": "https://api.internal.corp/v1",
+        "auth": {"method": "oauth"},
+        "args": ["a", "b"],
+        "enabled": True,
+        "retries": 3,
+    },
+    "message": {
+        "priority": 9,
+        "payload": "this is urgent",
+        "tags": ["alpha", "beta"],
+    },
+    "agent": {"id": "ajson://internal.corp/agents/router"},
+    "runtime": {"environment": "production"},
+}
+
+
+def test_compile_returns_callable():
+    """Test PolicyValidator.compile returns a CompiledPolicy."""
+    policy = PolicyValidator().compile("tool.type == 'http'")
+
+    assert isinstance(policy, CompiledPolicy)
+    assert policy(CONTEXT) is True
+    assert policy.evaluate({"tool": {"type": "function"}}) is False
+
+
+def test_compile_invalid_expression():
+    """Test compiling a malformed expression raises PolicySyntaxError."""
+    with pytest.raises(PolicySyntaxError):
+        PolicyValidator().compile("tool.type === 'http'")
+
+
+@pytest.mark.parametrize("expression,expected", [
+    ("tool.type == 'http' && tool.auth.method != 'none'", True),
+    ("tool.type == 'http' and tool.auth.method == 'none'", False),
+    ("tool.type == 'system' || message.priority > 8", True),
+    ("message.priority >= 9 and message.priority <= 9", True),
+    ("message.priority < 9", False),
+    ("tool.endpoint ~ '^https://.*\\.internal'", True),
+    ("tool.endpoint !~ 'external'", True),
+    ("message.payload contains 'urgent'", True),
+    ("message.tags contains 'beta'", True),
+    ("agent.id starts_with 'ajson://internal'", True),
+    ("tool.endpoint ends_with '/v1'", True),
+    ("tool.type in ['http', 'function']", True),
+    ("tool.type not in ['system', 'plugin']", True),
+    ("tool.retries in [1, 2, 3]", True),
+    ("'alpha' in message.tags", True),
+    ("not (tool.type == 'system')", True),
+    ("not not tool.type == 'http'", True),
+    ("tool.enabled == true", True),
+    ("tool.enabled", True),
+    ("tool.args[1] == 'b'", True),
+    ("tool.args[5] == null", True),
+    ("tool.missing.deeply.nested.field == null", True),
+    ("runtime.environment == 'production' and (tool.retries > 5 or tool.enabled)", True),
+])
+def test_evaluate(expression, expected):
+    """Test evaluation of each operator family."""
+    assert compile_policy(expression)(CONTEXT) is expected
+
+
+@pytest.mark.parametrize("expression", [
+    "tool.retries == true",
+    "tool.enabled == 1",
+    "tool.type > 5",
+    "tool.missing > 0",
+    "tool.retries contains 'x'",
+    "tool.missing starts_with 'x'",
+    "tool.missing ~ '.*'",
+    "tool.missing in ['a']",
+])
+def test_type_mismatches_are_false(expression):
+    """Test mismatched types evaluate to false instead of raising."""
+    assert compile_policy(expression)(CONTEXT) is False
+
+
+def test_short_circuit():
+    """Test logical operators short-circuit."""
+    class Exploding(dict):
+        def __getitem__(self, key):
+            raise AssertionError("should not be read")
+
+    context = {"tool": {"type": "http"}, "message": Exploding()}
+
+    assert compile_policy("tool.type == 'http' || message.priority > 1")(context)
+    assert not compile_policy("tool.type == 'x' && message.priority > 1")(context)
+
+
+def test_generic_comparisons_match_fast_paths():
+    """Test path-vs-path comparisons use the same semantics as literal fast paths."""
+    context = {"tool": {"a": "http", "b": "http", "n": 2, "m": 2.0, "t": True, "one": 1}}
+
+    assert compile_policy("tool.a == tool.b")(context)
+    assert compile_policy("tool.n == tool.m")(context)
+    assert not compile_policy("tool.t == tool.one")(context)
+    assert compile_policy("tool.n >= tool.m")(context)
+
+
+def test_compiled_policy_paths():
+    """Test compiled policies expose the accessors they read."""
+    policy = compile_policy("tool.type == 'http' && (tool.auth.method != 'none' || tool.type == 'x')")
+
+    assert policy.paths == (("tool", "type"), ("tool", "auth", "method"))
@@ -0,0 +1,101 @@
+"""Tests for the ajson:// resolver against a local stand-in HTTP server."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from jsonagents.resolver import DiskCache, Resolver, ResolverError
+
+
+def test_resolve(origin):
+    """Test a URI is fetched from its .well-known URL."""
+    uri = origin.publish("router", {"agent": {"id": "router"}})
+
+    with Resolver(scheme="http") as resolver:
+        resolved = resolver.resolve(uri)
+
+    assert resolved.manifest == {"agent": {"id": "router"}}
+    assert resolved.url == f"http://{origin.authority}/.well-known/agents/router.agents.json"
+    assert not resolved.from_cache
+    assert resolved.etag
+
+
+def test_fresh_cache_entry_skips_network(origin, tmp_path):
+    """Test entries within the TTL are served from disk."""
+    uri = origin.publish("router", {"agent": {"id": "router"}})
+
+    with Resolver(cache_dir=tmp_path, scheme="http") as resolver:
+        resolver.resolve(uri)
+    with Resolver(cache_dir=tmp_path, scheme="http") as resolver:
+        resolved = resolver.resolve(uri)
+
+    assert resolved.from_cache and not resolved.revalidated
+    assert len(origin.hits) == 1
+
+
+def test_stale_entry_is_revalidated(origin, tmp_path):
+    """Test expired entries send If-None-Match and reuse the body on 304."""
+    uri = origin.publish("router", {"agent": {"id": "router"}})
+
+    with Resolver(cache_dir=tmp_path, ttl=0, scheme="http") as resolver:
+        first = resolver.resolve(uri)
+        second = resolver.resolve(uri)
+
+    assert second.revalidated and second.from_cache
+    assert second.manifest == first.manifest
+    assert origin.hits[1][1] == first.etag
+
+
+def test_changed_content_is_refetched(origin, tmp_path):
+    """Test a changed document replaces the cached one."""
+    uri = origin.publish("router", {"version": 1})
+
+    with Resolver(cache_dir=tmp_path, scheme="http") as resolver:
+        resolver.resolve(uri)
+        origin.publish("router", {"version": 2})
+        resolved = resolver.resolve(uri, refresh=True)
+
+    assert resolved.manifest == {"version": 2}
+    assert not resolved.from_cache
+
+
+def test_single_flight(origin):
+    """Test concurrent requests for one URI share a single fetch."""
+    uri = origin.publish("slow", {"agent": {"id": "slow"}})
+    origin.delay = 0.3
+
+    with Resolver(scheme="http") as resolver, ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda _: resolver.resolve(uri), range(8)))
+
+    assert len(origin.hits) == 1
+    assert all(r.manifest == {"agent": {"id": "slow"}} for r in results)
+
+
+def test_http_error(origin):
+    """Test a missing document raises ResolverError."""
+    with Resolver(scheme="http") as resolver:
+        with pytest.raises(ResolverError, match="HTTP 404"):
+            resolver.resolve(f"ajson://{origin.authority}/agents/missing")
+
+
+def test_invalid_json(origin):
+    """Test an undecodable body raises ResolverError."""
+    uri = origin.publish("broken", b"{not json")
+
+    with Resolver(scheme="http") as resolver:
+        with pytest.raises(ResolverError, match="Invalid JSON"):
+            resolver.resolve(uri)
+
+
+def test_invalid_uri():
+    """Test invalid URIs are rejected before any request."""
+    with Resolver() as resolver:
+        with pytest.raises(ValueError):
+            resolver.resolve("https://example.com/agent.json")
+
+
+def test_disk_cache_ignores_corrupt_entries(tmp_path):
+    """Test unreadable cache files are treated as misses."""
+    cache = DiskCache(tmp_path)
+    cache.path_for("http://x/a").write_bytes(b"garbage")
+
+    assert cache.load("http://x/a") is None
@@ -0,0 +1,153 @@
+"""Tests for the persistent validation result cache."""
+
+import json
+import os
+import shutil
+
+import pytest
+from jsonagents.result_cache import ResultCache
+from jsonagents.schema import BUNDLED_SCHEMA_PATH, invalidate_schema_cache
+from jsonagents.validator import Validator
+
+
+@pytest.fixture
+def manifest_file(tmp_path, make_manifest):
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps(make_manifest()))
+    return path
+
+
+def test_key_covers_content_schema_and_mode():
+    """Test every input to a result changes the key."""
+    base = ResultCache.key(b"{}", "schema", False)
+
+    assert base == ResultCache.key(b"{}", "schema", False)
+    assert base != ResultCache.key(b"{ }", "schema", False)
+    assert base != ResultCache.key(b"{}", "other", False)
+    assert base != ResultCache.key(b"{}", "schema", True)
+
+
+def test_put_and_get(tmp_path):
+    """Test stored outcomes round-trip and no temporary files are left behind."""
+    cache = ResultCache(tmp_path)
+    cache.put("k", False, ["bad"], ["meh"])
+
+    assert cache.get("k") == {"is_valid": False, "errors": ["bad"], "warnings": ["meh"]}
+    assert cache.get("missing") is None
+    assert os.listdir(tmp_path) == ["k.json"]
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    """Test unreadable entries are ignored."""
+    cache = ResultCache(tmp_path)
+    (tmp_path / "k.json").write_text("{not json")
+
+    assert cache.get("k") is None
+
+
+def test_rewriting_an_entry_keeps_size_accurate(tmp_path):
+    """Test overwriting a key does not inflate the tracked size."""
+    cache = ResultCache(tmp_path)
+    cache.put("other", True, [], [])
+    for _ in range(20):
+        cache.put("k", True, [], ["x" * 40])
+
+    assert cache._size == cache.size()
+
+
+def test_lru_eviction(tmp_path):
+    """Test least recently used entries are evicted once over budget."""
+    entry_size = len(b'{"is_valid":true,"errors":[],"warnings":["' + b"x" * 40 + b'"]}')
+    cache = ResultCache(tmp_path, max_bytes=entry_size * 5 + entry_size // 2)
+    for i in range(5):
+        cache.put(f"k{i}", True, [], ["x" * 40])
+        os.utime(tmp_path / f"k{i}.json", ns=(i * 10**9, i * 10**9))
+    cache.get("k0")
+
+    cache.put("k5", True, [], ["x" * 40])
+
+    assert cache.size() <= cache.max_bytes
+    assert cache.get("k0") is not None
+    assert cache.get("k1") is None
+    assert cache.get("k5") is not None
+
+
+def test_validator_hit_skips_validation(tmp_path, manifest_file, monkeypatch):
+    """Test a warm cache answers without parsing or schema validation."""
+    validator = Validator(cache_dir=tmp_path / "cache")
+    first = validator.validate(manifest_file)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("validated again")
+
+    monkeypatch.setattr(Validator, "_validate", fail)
+    second = Validator(cache_dir=tmp_path / "cache").validate(manifest_file)
+
+    assert first.is_valid and second.is_valid
+    assert second.errors == first.errors
+    assert second.warnings == first.warnings
+    assert second.manifest is None
+
+
+def test_validator_cache_separates_strict_and_content(tmp_path, manifest_file, make_manifest):
+    """Test strict mode and edited content get their own entries."""
+    validator = Validator(cache_dir=tmp_path / "cache")
+    manifest = make_manifest()
+    del manifest["capabilities"]
+    manifest_file.write_text(json.dumps(manifest))
+
+    lax = validator.validate(manifest_file)
+    strict = validator.validate(manifest_file, strict=True)
+    manifest_file.write_text(json.dumps(make_manifest()))
+    edited = validator.validate(manifest_file, strict=True)
+
+    assert lax.warnings and lax.is_valid
+    assert not strict.is_valid
+    assert edited.is_valid
+
+
+def test_validator_cache_keys_on_schema(tmp_path, manifest_file):
+    """Test a different schema does not reuse results."""
+    schema = tmp_path / "schema.json"
+    shutil.copy(BUNDLED_SCHEMA_PATH, schema)
+    Validator(cache_dir=tmp_path / "cache").validate(manifest_file)
+
+    Validator(schema_path=str(schema), cache_dir=tmp_path / "cache").validate(manifest_file)
+    schema.write_text(schema.read_text() + "\n")
+    Validator(schema_path=str(schema), cache_dir=tmp_path / "cache").validate(manifest_file)
+
+    assert len(ResultCache(tmp_path / "cache")) == 2
+
+
+def test_validator_cache_keys_on_companion_schemas(tmp_path):
+    """Test editing a $ref'd companion schema does not reuse stored results."""
+    schema = tmp_path / "schema.json"
+    part = tmp_path / "part.json"
+    manifest = tmp_path / "manifest.json"
+    schema.write_text(json.dumps({"properties": {"n": {"$ref": "part.json"}}}))
+    part.write_text(json.dumps({"type": "integer"}))
+    manifest.write_text(json.dumps({"n": "s"}))
+    assert not Validator(schema_path=str(schema), cache_dir=tmp_path / "cache") \
+        .validate(manifest).is_valid
+
+    mtime_ns = part.stat().st_mtime_ns
+    part.write_text(json.dumps({"type": "string"}))
+    os.utime(part, ns=(mtime_ns, mtime_ns + 10**9))
+    # As in a new process: nothing compiled yet, only the disk cache is warm
+    invalidate_schema_cache()
+
+    assert Validator(schema_path=str(schema), cache_dir=tmp_path / "cache") \
+        .validate(manifest).is_valid
+    assert len(ResultCache(tmp_path / "cache")) == 2
+
+
+def test_validator_cache_ignores_dicts_and_missing_files(tmp_path, make_manifest):
+    """Test dict inputs and unreadable files bypass the cache."""
+    validator = Validator(cache_dir=tmp_path / "cache")
+
+    assert validator.validate(make_manifest()).is_valid
+    missing = validator.validate(tmp_path / "missing.json")
+
+    assert not missing.is_valid
+    assert "File not found" in missing.errors[0]
+    assert len(validator.result_cache) == 0
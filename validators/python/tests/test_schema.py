@@ -0,0 +1,206 @@
+"""Tests for the process-wide schema cache."""
+
+import json
+import os
+import pytest
+from pathlib import Path
+from jsonagents.schema import (
+    BUNDLED_SCHEMA_PATH,
+    SchemaCache,
+    get_compiled_schema,
+    invalidate_schema_cache,
+)
+from jsonagents.validator import Validator, validate_manifest
+
+
+@pytest.fixture
+def schema_copy(tmp_path):
+    """Copy the bundled schema to a temporary location."""
+    path = tmp_path / "json-agents.json"
+    path.write_bytes(BUNDLED_SCHEMA_PATH.read_bytes())
+    return path
+
+
+def test_bundled_schema_is_cached():
+    """Test the bundled schema is compiled once and reused."""
+    first = get_compiled_schema()
+    second = get_compiled_schema()
+
+    assert first is second
+    assert first.path == BUNDLED_SCHEMA_PATH.resolve()
+    assert len(first.content_hash) == 64
+
+
+def test_validators_share_compiled_schema():
+    """Test separate Validator instances share one compiled validator."""
+    assert Validator()._get_validator() is Validator()._get_validator()
+
+
+def test_validate_manifest_reuses_validator(schema_copy, make_manifest):
+    """Test the convenience function reuses the warm validator."""
+    validate_manifest(make_manifest(), schema_path=str(schema_copy))
+    compiled = get_compiled_schema(schema_copy)
+
+    result = validate_manifest(make_manifest(), schema_path=str(schema_copy))
+
+    assert result.is_valid
+    assert get_compiled_schema(schema_copy) is compiled
+
+
+def test_touch_without_change_keeps_validator(schema_copy):
+    """Test an mtime change with identical content keeps the compiled validator."""
+    cache = SchemaCache()
+    first = cache.get(schema_copy)
+
+    stat = schema_copy.stat()
+    os.utime(schema_copy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    second = cache.get(schema_copy)
+
+    assert second is not first
+    assert second.mtime_ns != first.mtime_ns
+    assert second.validator is first.validator
+
+
+def test_content_change_rebuilds_validator(schema_copy):
+    """Test a content change rebuilds the compiled validator."""
+    cache = SchemaCache()
+    first = cache.get(schema_copy)
+
+    schema = json.loads(schema_copy.read_text())
+    schema["title"] = "Modified"
+    schema_copy.write_text(json.dumps(schema))
+    stat = schema_copy.stat()
+    os.utime(schema_copy, ns=(stat.st_atime_ns, first.mtime_ns + 1_000_000_000))
+    second = cache.get(schema_copy)
+
+    assert second.validator is not first.validator
+    assert second.content_hash != first.content_hash
+    assert second.schema["title"] == "Modified"
+
+
+def test_invalidate_single_entry(schema_copy):
+    """Test explicit invalidation of one schema path."""
+    cache = SchemaCache()
+    first = cache.get(schema_copy)
+    cache.get()
+    assert len(cache) == 2
+
+    cache.invalidate(schema_copy)
+
+    assert len(cache) == 1
+    assert cache.get(schema_copy).validator is not first.validator
+
+
+def test_invalidate_all():
+    """Test invalidating the process-wide cache."""
+    first = get_compiled_schema()
+    invalidate_schema_cache()
+
+    assert get_compiled_schema() is not first
+
+
+def test_missing_schema_raises():
+    """Test missing schema files raise FileNotFoundError."""
+    cache = SchemaCache()
+
+    with pytest.raises(FileNotFoundError):
+        cache.get(Path("/nonexistent/schema.json"))
+
+
+@pytest.fixture
+def companion_schemas(tmp_path):
+    """A custom schema referencing companion schemas next to it."""
+    (tmp_path / "defs").mkdir()
+    (tmp_path / "defs" / "name.json").write_text(json.dumps({
+        "type": "string",
+        "minLength": 2,
+        "$defs": {"count": {"type": "integer"}},
+    }))
+    (tmp_path / "common.json").write_text(json.dumps({
+        "$defs": {
+            "name": {"$ref": "defs/name.json"},
+            "count": {"$ref": "defs/name.json#/$defs/count"},
+        },
+    }))
+    path = tmp_path / "main.json"
+    path.write_text(json.dumps({
+        "type": "object",
+        "properties": {
+            "name": {"$ref": "common.json#/$defs/name"},
+            "count": {"$ref": "common.json#/$defs/count"},
+            "remote": {"$ref": "https://schemas.example.com/remote.json"},
+        },
+    }))
+    return path
+
+
+def test_companion_schemas_are_preloaded(companion_schemas):
+    """Test relative references resolve without reading files during validation."""
+    compiled = SchemaCache().get(companion_schemas)
+    for companion in companion_schemas.parent.rglob("*.json"):
+        if companion != companion_schemas:
+            companion.unlink()
+
+    messages = [e.message for e in compiled.iter_errors({"name": "a", "count": "x"})]
+
+    assert messages == ["'a' is too short", "'x' is not of type 'integer'"]
+    assert list(compiled.iter_errors({"name": "ab", "count": 1})) == []
+
+
+def _edit(path, schema):
+    """Rewrite a schema file with a strictly newer mtime."""
+    mtime_ns = path.stat().st_mtime_ns
+    path.write_text(json.dumps(schema))
+    os.utime(path, ns=(mtime_ns, mtime_ns + 1_000_000_000))
+
+
+def test_companion_change_rebuilds_validator(tmp_path):
+    """Test editing, removing or recreating a companion schema is noticed."""
+    path = tmp_path / "main.json"
+    part = tmp_path / "part.json"
+    path.write_text(json.dumps({"properties": {"n": {"$ref": "part.json"}}}))
+    part.write_text(json.dumps({"type": "integer"}))
+    first = get_compiled_schema(path)
+    assert not Validator(schema_path=str(path)).validate({"n": "s"}).is_valid
+
+    _edit(part, {"type": "string"})
+    second = get_compiled_schema(path)
+
+    assert second.content_hash != first.content_hash
+    assert [c.path for c in second.companions] == [part]
+    assert Validator(schema_path=str(path)).validate({"n": "s"}).is_valid
+
+    stat = part.stat()
+    os.utime(part, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert get_compiled_schema(path).validator is second.validator
+
+    part.unlink()
+    assert get_compiled_schema(path).content_hash != second.content_hash
+    part.write_text(json.dumps({"type": "integer"}))
+    assert not Validator(schema_path=str(path)).validate({"n": "s"}).is_valid
+
+
+def test_remote_references_are_not_fetched(companion_schemas, monkeypatch, make_manifest):
+    """Test references outside the preloaded registry fail without network access."""
+    def no_network(*args, **kwargs):
+        raise AssertionError("network access")
+
+    monkeypatch.setattr("socket.socket.connect", no_network)
+    monkeypatch.setattr("socket.create_connection", no_network)
+
+    result = Validator(schema_path=str(companion_schemas)).validate(
+        dict(make_manifest(), remote=1)
+    )
+
+    assert any("Unresolvable: https://schemas.example.com/remote.json" in e
+               for e in result.errors)
+
+
+def test_bundled_schema_resolves_from_registry(make_manifest):
+    """Test the bundled schema's $defs resolve through the prebuilt registry."""
+    compiled = SchemaCache(codegen_dir=False).get()
+    manifest = dict(make_manifest(), agent={"id": "x"})
+
+    messages = [e.message for e in compiled.iter_errors(manifest)]
+
+    assert messages == ["'name' is a required property"]
@@ -0,0 +1,163 @@
+"""Tests for the generated schema validity checks."""
+
+import copy
+import json
+import random
+from decimal import Decimal
+
+import pytest
+from jsonschema import Draft202012Validator
+from jsonagents import schema_compiler
+from jsonagents.bench import SHAPES, generate_manifest
+from jsonagents.schema import BUNDLED_SCHEMA_PATH, SchemaCache, get_compiled_schema
+from jsonagents.schema_compiler import SchemaCompileError, generate_source, load_check
+
+
+KEYWORD_SCHEMA = {
+    "$defs": {"positive": {"type": "number", "exclusiveMinimum": 0}},
+    "type": "object",
+    "properties": {
+        "count": {"type": "integer", "minimum": 1, "maximum": 10},
+        "ratio": {"$ref": "#/$defs/positive"},
+        "name": {"type": "string", "minLength": 2, "maxLength": 5, "pattern": "^[a-z]+$"},
+        "mode": {"enum": ["a", "b", 1, None]},
+        "flag": {"const": True},
+        "pair": {"const": [1, "x"]},
+        "tags": {"type": "array", "uniqueItems": True, "minItems": 1, "maxItems": 3},
+        "either": {"anyOf": [{"type": "string"}, {"type": "integer"}]},
+        "one": {"oneOf": [{"type": "integer"}, {"minimum": 5}]},
+        "never": {"not": {"type": "string"}},
+        "nested": {"type": ["object", "null"], "additionalProperties": {"type": "boolean"}},
+    },
+    "patternProperties": {"^x-": {"type": "string"}, "^y": {"minProperties": 1}},
+    "additionalProperties": False,
+    "maxProperties": 6,
+    "if": {"required": ["count"]},
+    "then": {"required": ["name"]},
+    "else": {"not": {"required": ["ratio"]}},
+}
+
+INSTANCES = [
+    {}, [], "x", None,
+    {"count": 3, "name": "ab"}, {"count": 3.0, "name": "ab"}, {"count": 3.5, "name": "ab"},
+    {"count": True, "name": "ab"}, {"count": 0, "name": "ab"}, {"count": 11, "name": "ab"},
+    {"count": 3}, {"ratio": 1}, {"ratio": 0}, {"ratio": False}, {"ratio": Decimal("0.5")},
+    {"name": "abcdef"}, {"name": "a"}, {"name": "AB"}, {"name": 12},
+    {"mode": "a"}, {"mode": 1}, {"mode": 1.0}, {"mode": True}, {"mode": None}, {"mode": "c"},
+    {"flag": True}, {"flag": 1}, {"pair": [1, "x"]}, {"pair": [True, "x"]}, {"pair": (1, "x")},
+    {"tags": ["a", "b"]}, {"tags": ["a", "a"]}, {"tags": [1, True]}, {"tags": [1, 1.0]},
+    {"tags": [{"a": 1}, {"a": 1}]}, {"tags": [[1], [True]]}, {"tags": []}, {"tags": [1, 2, 3, 4]},
+    {"either": "s"}, {"either": 2}, {"either": 2.5}, {"one": 3}, {"one": 7}, {"one": 7.5},
+    {"one": "s"}, {"never": "s"}, {"never": 1}, {"nested": None}, {"nested": {"a": True}},
+    {"nested": {"a": 1}}, {"x-a": "s"}, {"x-a": 1}, {"y": {}}, {"y": {"a": 1}}, {"z": 1},
+    {"a": 1, "b": 2, "c": 3, "d": 4, "e": 5, "f": 6, "g": 7},
+]
+
+
+@pytest.fixture(scope="module")
+def bundled():
+    schema = json.loads(BUNDLED_SCHEMA_PATH.read_text())
+    return load_check(schema), Draft202012Validator(schema)
+
+
+@pytest.mark.parametrize("instance", INSTANCES, ids=range(len(INSTANCES)))
+def test_keywords_match_jsonschema(instance):
+    """Test every supported keyword accepts exactly what jsonschema accepts."""
+    check = load_check(KEYWORD_SCHEMA)
+
+    assert check(instance) is Draft202012Validator(KEYWORD_SCHEMA).is_valid(instance)
+
+
+def test_bundled_schema_matches_jsonschema(bundled):
+    """Test mutated manifests are judged exactly as jsonschema judges them."""
+    check, validator = bundled
+    rng = random.Random(0)
+    values = [None, True, 0, 1.0, "", "exec", "gov", "graph", [], ["exec"], ["a", "a"], {}]
+    verdicts = set()
+
+    for i in range(1500):
+        manifest = generate_manifest(SHAPES["small"], seed=i % 10)
+        manifest["profiles"] = rng.choice([["core"], ["exec"], ["gov", "graph"]])
+        for _ in range(rng.randint(0, 2)):
+            _mutate(rng, manifest, values)
+        expected = validator.is_valid(manifest)
+        verdicts.add(expected)
+        assert check(manifest) is expected, json.dumps(manifest)
+
+    assert verdicts == {True, False}
+
+
+def _mutate(rng, manifest, values):
+    parent, key = manifest, rng.choice(list(manifest))
+    while isinstance(parent[key], (dict, list)) and parent[key] and rng.random() < 0.7:
+        parent = parent[key]
+        key = rng.choice(list(parent) if isinstance(parent, dict) else range(len(parent)))
+    if isinstance(parent, dict) and rng.random() < 0.3:
+        del parent[key]
+    elif isinstance(parent, dict) and rng.random() < 0.3:
+        key = rng.choice(["x-extra", "extra", "runtime", "graph"])
+        parent[key] = copy.deepcopy(rng.choice(values))
+    else:
+        parent[key] = copy.deepcopy(rng.choice(values))
+
+
+def test_iter_errors_matches_jsonschema():
+    """Test compiled schemas report jsonschema's errors for invalid manifests only."""
+    compiled = get_compiled_schema()
+    manifest = generate_manifest(SHAPES["medium"])
+    invalid = dict(manifest, manifest_version="2.0", extra=1)
+
+    assert compiled.check is not None
+    assert list(compiled.iter_errors(manifest)) == []
+    assert [e.message for e in compiled.iter_errors(invalid)] == \
+        [e.message for e in compiled.validator.iter_errors(invalid)]
+
+
+def test_unsupported_schemas_fall_back(tmp_path):
+    """Test schemas the generator rejects are validated by jsonschema alone."""
+    schema = {"type": "object", "unevaluatedProperties": False}
+    path = tmp_path / "schema.json"
+    path.write_text(json.dumps(schema))
+
+    with pytest.raises(SchemaCompileError, match="unevaluatedProperties"):
+        generate_source(schema)
+    with pytest.raises(SchemaCompileError, match="Unsupported \\$ref"):
+        generate_source({"$ref": "other.json"})
+
+    compiled = SchemaCache(codegen_dir=None).get(path)
+    assert compiled.check is None
+    assert [e.validator for e in compiled.iter_errors({"a": 1})] == ["unevaluatedProperties"]
+
+
+def test_disk_cache(tmp_path, monkeypatch):
+    """Test generated modules are written once and imported afterwards."""
+    first = load_check(KEYWORD_SCHEMA, "abc", tmp_path)
+    (module,) = tmp_path.glob("schema_abc_v*.py")
+    assert module.read_text() == generate_source(KEYWORD_SCHEMA)
+
+    def fail(schema):
+        raise AssertionError("regenerated")
+
+    monkeypatch.setattr(schema_compiler, "generate_source", fail)
+    second = load_check(KEYWORD_SCHEMA, "abc", tmp_path)
+
+    assert second is not first
+    assert second({"count": 3, "name": "ab"}) and not second({"count": 3})
+
+
+def test_corrupt_cache_entry_is_regenerated(tmp_path):
+    """Test a damaged cached module is replaced."""
+    load_check(KEYWORD_SCHEMA, "abc", tmp_path)
+    (module,) = tmp_path.glob("schema_abc_v*.py")
+    module.write_text("def check(")
+
+    check = load_check(KEYWORD_SCHEMA, "abc", tmp_path)
+
+    assert check({"count": 3, "name": "ab"})
+    assert module.read_text() == generate_source(KEYWORD_SCHEMA)
+
+
+def test_codegen_can_be_disabled():
+    """Test SchemaCache(codegen_dir=False) skips generated checks."""
+    assert SchemaCache(codegen_dir=False).get().check is None
+    assert SchemaCache(codegen_dir=None).get().check is not None
@@ -0,0 +1,183 @@
+"""Tests for the HTTP validation service."""
+
+import http.client
+import json
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from jsonagents.bench import SHAPES, generate_manifest
+from jsonagents.server import ValidationServer
+
+
+@pytest.fixture
+def server():
+    server = ValidationServer(("127.0.0.1", 0), workers=2, max_body=64 * 1024,
+                              keepalive_timeout=2)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05},
+                              daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _connect(server):
+    host, port = server.server_address[:2]
+    return http.client.HTTPConnection(host, port, timeout=5)
+
+
+def _request(connection, method, path, body=None, headers=None):
+    connection.request(method, path, body=body, headers=headers or {})
+    response = connection.getresponse()
+    return response.status, response.getheader("Content-Type"), response.read()
+
+
+def test_validate_keep_alive(server):
+    """Test many validations over one persistent connection."""
+    connection = _connect(server)
+    valid = json.dumps(generate_manifest(SHAPES["small"])).encode()
+    invalid = json.dumps({"manifest_version": "1.0", "agent": {"id": "ajson:bad"}}).encode()
+
+    for body, expected in [(valid, True), (invalid, False), (valid, True)]:
+        status, content_type, raw = _request(connection, "POST", "/validate", body)
+        result = json.loads(raw)
+        assert status == 200 and content_type == "application/json"
+        assert result["valid"] is expected
+        assert bool(result["errors"]) is not expected
+
+    assert server.requests == 3
+
+
+def test_validate_strict_and_invalid_json(server):
+    """Test strict mode and unparsable bodies."""
+    connection = _connect(server)
+    manifest = generate_manifest(SHAPES["small"])
+    del manifest["capabilities"]
+
+    _, _, lenient = _request(connection, "POST", "/validate", json.dumps(manifest))
+    _, _, strict = _request(connection, "POST", "/validate?strict=1", json.dumps(manifest))
+    _, _, broken = _request(connection, "POST", "/validate", b"{not json")
+
+    assert json.loads(lenient)["valid"] and json.loads(lenient)["warnings"]
+    assert not json.loads(strict)["valid"]
+    assert json.loads(broken)["errors"][0].startswith("Invalid JSON")
+
+
+def test_validator_errors_are_reported(server):
+    """Test a manifest that makes the validator raise gets a JSON answer."""
+    connection = _connect(server)
+
+    status, _, raw = _request(connection, "POST", "/validate", b'{"agent": "oops"}')
+    result = json.loads(raw)
+    assert status == 200 and not result["valid"] and result["errors"]
+
+    status, _, raw = _request(connection, "GET", "/healthz")
+    assert status == 200
+
+
+def test_validate_chunked_body(server):
+    """Test a chunked request body is read as bytes."""
+    raw = json.dumps(generate_manifest(SHAPES["small"])).encode()
+    connection = _connect(server)
+
+    connection.request("POST", "/validate", body=iter([raw[:10], raw[10:]]),
+                       headers={"Transfer-Encoding": "chunked"}, encode_chunked=True)
+    response = connection.getresponse()
+
+    assert response.status == 200
+    assert json.loads(response.read())["valid"]
+
+
+def test_check_uri_and_policy(server):
+    """Test URI and policy checks by query string and by body."""
+    connection = _connect(server)
+
+    _, _, uri = _request(connection, "GET", "/check-uri?uri=ajson://example.com/agents/a")
+    _, _, bad_uri = _request(connection, "POST", "/check-uri", b"ajson:bad")
+    _, _, policy = _request(connection, "POST", "/check-policy", b"tool.type == 'http'")
+    _, _, bad_policy = _request(connection, "GET", "/check-policy?expression=tool.type%20%3D%3D")
+
+    uri = json.loads(uri)
+    assert uri["valid"] and uri["parsed"]["authority"] == "example.com"
+    assert uri["https_url"].startswith("https://example.com/")
+    assert not json.loads(bad_uri)["valid"]
+    assert json.loads(policy)["valid"]
+    assert not json.loads(bad_policy)["valid"]
+
+
+@pytest.mark.parametrize("method,path,size,status", [
+    ("GET", "/nope", 0, 404),
+    ("GET", "/validate", 0, 405),
+    ("GET", "/check-uri", 0, 400),
+    ("POST", "/validate", 64 * 1024 + 1, 413),
+])
+def test_errors(server, method, path, size, status):
+    """Test unknown endpoints, wrong methods, missing arguments and large bodies."""
+    actual, _, raw = _request(_connect(server), method, path, b"x" * size if size else None)
+
+    assert actual == status
+    assert "error" in json.loads(raw)
+
+
+def test_missing_content_length(server):
+    """Test a POST without a body length is rejected with 411."""
+    host, port = server.server_address[:2]
+    with socket.create_connection((host, port), timeout=5) as sock:
+        sock.sendall(b"POST /validate HTTP/1.1\r\nHost: x\r\n\r\n")
+        response = sock.recv(4096)
+
+    assert response.startswith(b"HTTP/1.1 411")
+
+
+def test_healthz_and_metrics(server):
+    """Test the health endpoint and Prometheus metrics."""
+    connection = _connect(server)
+    _request(connection, "POST", "/validate", json.dumps(generate_manifest(SHAPES["small"])))
+
+    _, _, health = _request(connection, "GET", "/healthz")
+    status, content_type, metrics = _request(connection, "GET", "/metrics")
+
+    health = json.loads(health)
+    assert health["status"] == "ok" and health["workers"] == 2
+    assert status == 200 and content_type.startswith("text/plain")
+    text = metrics.decode()
+    assert "jsonagents_manifests_validated_total 1" in text
+    assert 'jsonagents_http_requests_total{endpoint="/validate",status="200"} 1' in text
+    assert 'jsonagents_validation_stage_seconds_count{stage="schema"} 1' in text
+
+
+def test_concurrency_is_bounded(server):
+    """Test at most `workers` connections are served at once."""
+    raw = json.dumps(generate_manifest(SHAPES["medium"])).encode()
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    validate = server.validator.validate
+
+    def slow_validate(manifest, strict=False):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return validate(manifest, strict)
+
+    server.validator.validate = slow_validate
+
+    def call(_):
+        connection = _connect(server)
+        try:
+            return _request(connection, "POST", "/validate", raw, {"Connection": "close"})[0]
+        finally:
+            connection.close()
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        statuses = list(pool.map(call, range(6)))
+
+    assert statuses == [200] * 6
+    assert peak == 2
@@ -0,0 +1,92 @@
+"""Tests that importing the package and the light CLI commands stay cheap."""
+
+import subprocess
+import sys
+
+import pytest
+from click.testing import CliRunner
+from jsonagents.cli import main
+
+
+HEAVY = ("jsonschema", "rich", "requests", "numpy")
+
+# Generous, to stay stable on slow CI machines; a warm import takes ~50 ms
+CLI_IMPORT_BUDGET_US = 500_000
+
+
+def _loaded_after(code):
+    """Run code in a fresh interpreter and return which heavy modules it loaded."""
+    probe = code + f"\nimport sys\nprint('\\n' + ','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    output = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True,
+                            check=True).stdout
+    return [name for name in output.splitlines()[-1].split(",") if name]
+
+
+def test_import_package_is_lazy():
+    """Test `import jsonagents` loads none of the heavy dependencies."""
+    assert _loaded_after("import jsonagents") == []
+
+
+@pytest.mark.parametrize("args", [
+    ["check-uri", "ajson://example.com/agents/hello"],
+    ["check-policy", "tool.type == 'http'"],
+])
+def test_light_commands_skip_heavy_imports(args):
+    """Test check-uri and check-policy run without jsonschema, rich or requests."""
+    code = (
+        "from jsonagents.cli import main\n"
+        f"try:\n    main({args!r})\nexcept SystemExit:\n    pass"
+    )
+
+    assert _loaded_after(code) == []
+
+
+def _import_times(module):
+    """Import a module under ``-X importtime``; map each module to its cumulative time (us)."""
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True, text=True, check=True).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_cli_import_time():
+    """Test `import jsonagents.cli` is fast and pulls in no heavy dependency."""
+    times = _import_times("jsonagents.cli")
+
+    assert [name for name in times if name.split(".")[0] in HEAVY] == []
+    assert times["jsonagents"] + times["jsonagents.cli"] < CLI_IMPORT_BUDGET_US, times
+
+
+def test_lazy_attributes():
+    """Test public names resolve on access and are listed by dir()."""
+    import jsonagents
+    from jsonagents.validator import Validator
+
+    assert jsonagents.Validator is Validator
+    assert "PolicyEngine" in dir(jsonagents)
+    with pytest.raises(AttributeError):
+        jsonagents.NotAName
+
+
+def test_check_uri_output():
+    """Test check-uri still reports components and the HTTPS URL."""
+    result = CliRunner().invoke(main, ["check-uri", "ajson://example.com/agents/hello"])
+
+    assert result.exit_code == 0
+    assert "Valid URI: ajson://example.com/agents/hello" in result.output
+    assert "authority: example.com" in result.output
+    assert "HTTPS URL: https://example.com/" in result.output
+
+
+def test_check_policy_errors():
+    """Test check-policy lists errors and exits non-zero for a bad expression."""
+    result = CliRunner().invoke(main, ["check-policy", "tool.type =="])
+
+    assert result.exit_code == 1
+    assert "Invalid expression" in result.output
+    assert "Errors:" in result.output
@@ -0,0 +1,84 @@
+"""Tests for per-stage validation timing."""
+
+import json
+import pickle
+
+from jsonagents.bench import SHAPES, generate_manifest
+from jsonagents.timing import StageTiming, ValidationProfile
+from jsonagents.validator import Validator
+
+
+def test_profile_is_off_by_default():
+    """Test results carry no profile unless profiling is enabled."""
+    assert Validator().validate(generate_manifest(SHAPES["small"])).profile is None
+
+
+def test_profile_counts_per_stage():
+    """Test each stage records its time and the number of items it handled."""
+    manifest = generate_manifest(SHAPES["medium"])
+    conditions = sum(1 for edge in manifest["graph"]["edges"] if "condition" in edge)
+    uris = 1 + sum(t["id"].startswith("ajson://") for t in manifest["tools"]) \
+        + len(manifest["graph"]["nodes"])
+
+    result = Validator(profile=True).validate(json.dumps(manifest).encode())
+    counts = {stage: timing.count for stage, timing in result.profile.stages.items()}
+
+    assert counts == {
+        "parse": 1,
+        "schema": 0,
+        "uris": uris,
+        "policies": len(manifest["policies"]),
+        "edges": conditions,
+        "graph": len(manifest["graph"]["nodes"]),
+    }
+    assert all(timing.seconds >= 0 for timing in result.profile.stages.values())
+    assert result.profile.total_seconds > 0
+
+
+def test_profile_schema_errors_and_invalid_json():
+    """Test schema errors are counted and unparsable input stops after parsing."""
+    validator = Validator(profile=True)
+
+    result = validator.validate({"manifest_version": "1.0"})
+    assert result.profile.stages["parse"].count == 0
+    assert result.profile.stages["schema"].count == len(result.errors)
+
+    result = validator.validate(b"{")
+    assert list(result.profile.stages) == ["parse"]
+
+
+def test_profile_cache_hits(tmp_path):
+    """Test result cache lookups are recorded as their own stage."""
+    validator = Validator(profile=True, cache_dir=tmp_path)
+    raw = json.dumps(generate_manifest(SHAPES["small"])).encode()
+
+    cold = validator.validate(raw)
+    warm = validator.validate(raw)
+
+    assert cold.profile.stages["cache"].count == 0
+    assert "schema" in cold.profile.stages
+    assert list(warm.profile.stages) == ["cache"]
+    assert warm.profile.stages["cache"].count == 1
+
+
+def test_aggregate_and_pickle():
+    """Test profiles sum stage by stage and survive a process boundary."""
+    a = ValidationProfile({"schema": StageTiming(0.5, 2), "parse": StageTiming(0.25, 1)})
+    b = ValidationProfile({"parse": StageTiming(0.25, 1)})
+
+    total = ValidationProfile.aggregate([a, None, pickle.loads(pickle.dumps(b))])
+
+    assert total.validations == 2
+    assert list(total.stages) == ["parse", "schema"]
+    assert total.stages["parse"] == StageTiming(0.5, 2)
+    assert total.to_dict()["total_seconds"] == 1.0
+
+
+def test_profile_in_process_pool():
+    """Test profiling is carried into worker processes."""
+    validator = Validator(profile=True)
+    raw = json.dumps(generate_manifest(SHAPES["small"])).encode()
+
+    results = [r for _, r in validator.validate_many([raw] * 2, executor="process", max_workers=2)]
+
+    assert all(r.profile is not None and r.profile.stages["parse"].count == 1 for r in results)
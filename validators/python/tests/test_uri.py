@@ -196,3 +196,77 @@ def test_uri_with_query_params():
     
     assert result.is_valid
     assert any("query" in warning.lower() for warning in result.warnings)
+
+
+FAST_PATH_SAMPLES = [
+    "ajson://example.com/agents/router",
+    "ajson://localhost:8080/agents/test",
+    "ajson://a.b-c.example.com:1/x/y.agents.json#frag?/x",
+    "ajson://example.com:0/agents/test",
+    "ajson://example.com:65536/agents/test",
+    "ajson://example.com:/agents/test",
+    "ajson://-bad.com/agents/test",
+    "ajson://example.com/agents/test#",
+    "ajson://example.com/agents/test?",
+    "ajson://user@example.com/agents/test",
+    "ajson://example.com",
+    "ajson://example.com/a b",
+    "ajson://example.com/agents\n",
+    "ajson://example.com/agents/test\t",
+    "AJSON://example.com/agents/test",
+    "ajson://[::1]/agents/test",
+]
+
+
+def _random_uri(rng):
+    alphabet = "aZ09.-_~:@/#?!$&'()*+,;= %[]\t"
+    pieces = [
+        rng.choice(["ajson://", "ajson://", "ajson:/", "http://"]),
+        rng.choice(["example.com", "localhost", "a-b.c", "x" * 64, "", "u@h", "h.",
+                    "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 6)))]),
+        rng.choice(["", ":80", ":0", ":65535", ":99999", ":x", ":"]),
+        rng.choice(["", "/agents/router", "/a;b/c@d", "agents",
+                    "/" + "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 8)))]),
+        rng.choice(["", "#v1", "#", "#a?b/c", "?q=1", "?q#f",
+                    "#" + "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 5)))]),
+    ]
+    return "".join(pieces)
+
+
+def test_fast_path_matches_detailed_validation():
+    """Test the single-regex fast path agrees with the detailed validation."""
+    import random
+
+    validator = URIValidator(cache_size=0)
+    rng = random.Random(3986)
+    samples = FAST_PATH_SAMPLES + [_random_uri(rng) for _ in range(5000)]
+
+    for uri in samples:
+        assert validator.validate(uri) == validator._validate_detailed(uri), uri
+
+
+def test_fast_path_parsed_components():
+    """Test the fast path decomposes the URI like urlparse."""
+    result = URIValidator().validate("ajson://example.com:8443/agents/router#v2")
+
+    assert dict(result.parsed) == {
+        "scheme": "ajson",
+        "authority": "example.com:8443",
+        "path": "/agents/router",
+        "query": "",
+        "fragment": "v2",
+    }
+
+
+def test_fast_path_result_is_a_regular_instance():
+    """Test fast-path results go through the dataclass constructor."""
+    import dataclasses
+    from types import MappingProxyType
+
+    result = URIValidator().validate("ajson://example.com/agents/router")
+    copy = dataclasses.replace(result, uri="ajson://example.com/agents/other")
+
+    assert type(result.parsed) is MappingProxyType and result.errors == ()
+    assert copy.parsed == result.parsed and copy.uri.endswith("/other")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.uri = "x"
@@ -505,3 +505,122 @@ def test_validate_with_invalid_edge_condition():
     
     assert not result.is_valid
     assert any("Edge" in error or "condition" in error.lower() for error in result.errors)
+
+
+def test_validate_bytes(make_manifest):
+    """Test validation of raw JSON bytes."""
+    validator = Validator()
+    raw = json.dumps(make_manifest("ajson://example.com/agents/test")).encode()
+
+    assert validator.validate(raw).is_valid
+
+    result = validator.validate(b"{invalid json")
+    assert not result.is_valid
+    assert any("json" in error.lower() for error in result.errors)
+
+
+def test_validate_many_mixed_sources(tmp_path, make_manifest):
+    """Test validate_many accepts paths, bytes and dicts in order."""
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps(make_manifest("ajson://example.com/agents/file")))
+    raw = json.dumps(make_manifest("ajson:bad")).encode()
+    manifest = make_manifest("ajson://example.com/agents/dict")
+
+    results = list(Validator().validate_many([path, raw, manifest]))
+
+    assert [source for source, _ in results] == [path, raw, manifest]
+    assert [result.is_valid for _, result in results] == [True, False, True]
+
+
+def test_validate_many_is_lazy(make_manifest):
+    """Test validate_many only consumes input as results are requested."""
+    consumed = []
+
+    def source():
+        for i in range(100):
+            consumed.append(i)
+            yield make_manifest(f"ajson://example.com/agents/a{i}")
+
+    results = Validator().validate_many(source())
+    next(results)
+
+    assert consumed == [0]
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_validate_many_executor_preserves_order(executor, make_manifest):
+    """Test pooled validation yields results in input order."""
+    manifests = [
+        make_manifest(f"ajson://example.com/agents/a{i}" if i % 4 else "ajson:bad")
+        for i in range(20)
+    ]
+
+    results = list(Validator().validate_many(
+        manifests, executor=executor, max_workers=2, window=3
+    ))
+
+    assert [source for source, _ in results] == manifests
+    assert [result.is_valid for _, result in results] == [bool(i % 4) for i in range(20)]
+
+
+def test_validate_many_bounded_window(make_manifest):
+    """Test at most `window` manifests are pulled ahead of the consumer."""
+    consumed = []
+
+    def source():
+        for i in range(50):
+            consumed.append(i)
+            yield make_manifest(f"ajson://example.com/agents/a{i}")
+
+    results = Validator().validate_many(source(), executor="thread", max_workers=2, window=4)
+    next(results)
+
+    assert len(consumed) == 4
+
+
+def test_validate_many_reports_exceptions(make_manifest):
+    """Test unexpected exceptions become failed results instead of aborting."""
+    manifest = make_manifest("ajson://example.com/agents/test")
+    broken = dict(manifest, agent="not-an-object")
+
+    results = list(Validator().validate_many([broken, manifest]))
+
+    assert not results[0][1].is_valid
+    assert results[1][1].is_valid
+
+
+def test_validate_many_unknown_executor():
+    """Test unknown executor names are rejected."""
+    with pytest.raises(ValueError):
+        list(Validator().validate_many([{}], executor="fiber"))
+
+
+def test_validate_graph_topology(make_manifest):
+    """Test graph analysis findings are reported on the result."""
+    manifest = make_manifest("ajson://example.com/agents/orchestrator")
+    manifest["profiles"] = ["core", "graph"]
+    manifest["graph"] = {
+        "nodes": [
+            {"id": "router", "ref": "ajson://example.com/agents/router"},
+            {"id": "faq", "ref": "ajson://example.com/agents/faq"},
+            {"id": "orphan", "ref": "ajson://example.com/agents/orphan"},
+        ],
+        "edges": [
+            {"from": "router", "to": "faq"},
+            {"from": "faq", "to": "router"},
+            {"from": "router", "to": "billing"},
+        ],
+    }
+
+    result = Validator().validate(manifest)
+
+    assert not result.is_valid
+    assert "Edge[2] 'to' references unknown node 'billing'" in result.errors
+    assert result.warnings == []
+    assert result.graph.cycles == (("router", "faq"),)
+    assert result.graph.entries == ("router", "orphan")
+    assert result.graph.unreachable == ()
+
+    # An intentional routing loop does not fail strict validation
+    del manifest["graph"]["edges"][2]
+    assert Validator().validate(manifest, strict=True).is_valid
@@ -0,0 +1,131 @@
+"""Tests for incremental revalidation in watch mode."""
+
+import json
+import os
+
+import pytest
+from jsonagents.cli import _watch
+from jsonagents.validator import Validator
+from jsonagents.watch import ADDED, CHANGED, REMOVED, Watcher
+
+
+def _write(path, manifest, mtime_offset=0):
+    path.write_text(json.dumps(manifest))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset))
+
+
+class CountingValidator(Validator):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def validate(self, manifest, strict=False):
+        self.calls += 1
+        return super().validate(manifest, strict)
+
+
+@pytest.fixture
+def watched(tmp_path, make_manifest):
+    _write(tmp_path / "a.json", make_manifest())
+    _write(tmp_path / "b.json", make_manifest("ajson://example.com/agents/b"))
+    return tmp_path
+
+
+def test_first_scan_adds_every_file(watched):
+    """Test the first scan validates and reports all files."""
+    watcher = Watcher([watched])
+
+    changes = watcher.scan()
+
+    assert [(c.path, c.kind) for c in changes] == [
+        (str(watched / "a.json"), ADDED),
+        (str(watched / "b.json"), ADDED),
+    ]
+    assert all(r.is_valid for r in watcher.results.values())
+
+
+def test_unchanged_files_are_not_revalidated(watched, make_manifest):
+    """Test files with the same mtime, or the same content, are skipped."""
+    validator = CountingValidator()
+    watcher = Watcher([watched], validator=validator)
+    watcher.scan()
+
+    assert watcher.scan() == []
+    _write(watched / "a.json", make_manifest(), mtime_offset=10**9)
+    assert watcher.scan() == []
+    assert validator.calls == 2
+
+
+def test_changed_file_reports_diff(watched, make_manifest):
+    """Test an edit that breaks a file reports the new errors."""
+    watcher = Watcher([watched])
+    watcher.scan()
+
+    _write(watched / "a.json", make_manifest("ajson:bad"), mtime_offset=10**9)
+    (change,) = watcher.scan()
+
+    assert change.kind == CHANGED
+    assert change.before.is_valid and not change.after.is_valid
+    assert change.new_errors and not change.fixed_errors
+
+    _write(watched / "a.json", make_manifest(), mtime_offset=2 * 10**9)
+    (change,) = watcher.scan()
+    assert change.fixed_errors == tuple(change.before.errors)
+
+
+def test_validator_errors_do_not_stop_the_watcher(watched, make_manifest):
+    """Test a manifest that makes the validator raise is reported as invalid."""
+    watcher = Watcher([watched])
+    watcher.scan()
+
+    _write(watched / "a.json", {"agent": "oops"}, mtime_offset=10**9)
+    (change,) = watcher.scan()
+
+    assert change.kind == CHANGED and not change.after.is_valid
+    assert change.after.errors
+
+    _write(watched / "a.json", make_manifest(), mtime_offset=2 * 10**9)
+    (change,) = watcher.scan()
+    assert change.after.is_valid
+
+
+def test_added_and_removed_files(watched, make_manifest):
+    """Test new files are picked up and deleted files reported."""
+    watcher = Watcher([watched])
+    watcher.scan()
+
+    _write(watched / "c.json", make_manifest("ajson://example.com/agents/c"))
+    (watched / "b.json").unlink()
+    changes = watcher.scan()
+
+    assert [(os.path.basename(c.path), c.kind) for c in changes] == [
+        ("b.json", REMOVED),
+        ("c.json", ADDED),
+    ]
+    assert sorted(os.path.basename(p) for p in watcher.results) == ["a.json", "c.json"]
+
+
+def test_run_stops_after_max_scans(watched):
+    """Test run() reports only scans with changes."""
+    reported = []
+
+    Watcher([watched]).run(reported.append, interval=0, max_scans=3)
+
+    assert len(reported) == 1
+
+
+def test_cli_watch_json(watched, capsys, make_manifest):
+    """Test watch mode emits one JSON line per change and the final exit code."""
+    _write(watched / "bad.json", make_manifest("ajson:bad"))
+
+    with pytest.raises(SystemExit) as exit_info:
+        _watch((str(watched),), False, False, True, None, 0.01, max_scans=2)
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(os.path.basename(l["file"]), l["event"], l["valid"]) for l in lines] == [
+        ("a.json", "added", True),
+        ("b.json", "added", True),
+        ("bad.json", "added", False),
+    ]
+    assert exit_info.value.code == 1